@@ -0,0 +1,72 @@
+"""
+Weak ETags for conditional GETs.
+
+Routes compute a cheap fingerprint of what they would return (usually row
+counts and the latest last_modified from the repository) and call
+`not_modified` before doing any real work. If the client already holds a
+matching ETag a bodiless 304 is returned, otherwise the ETag is set on the
+response and the route carries on as normal.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Builds a weak ETag from the given values.
+
+    :param Any parts: values identifying the representation, their repr
+        must be stable (e.g. ints, strings, datetimes and tuples of them).
+    :return str: the ETag header value.
+    """
+    digest = hashlib.sha1(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an ETag (weak comparison).
+
+    :param Optional[str] if_none_match: the request header value, if any.
+    :param str etag: the current ETag.
+    :return bool: True if the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(
+    request: Request, response: Response, *parts: Any
+) -> Optional[Response]:
+    """
+    Handles If-None-Match for a GET route.
+
+    The request path, query string and caller's org scope are always part
+    of the ETag, so callers only pass the data fingerprint.
+
+    :param Request request: the incoming request.
+    :param Response response: the route's response, the ETag is set on it.
+    :param Any parts: the fingerprint of the data the route returns.
+    :return Optional[Response]: a 304 response to return straight away, or
+        None if the route should build its payload.
+    """
+    user = getattr(request.state, "user", None)
+    scope = (user.is_superuser, tuple(user.org_ids or ())) if user else None
+    etag = weak_etag(request.url.path, request.url.query, scope, *parts)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    response.headers["ETag"] = etag
+    return None
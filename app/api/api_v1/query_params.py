@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Union
+from typing import Optional, Union
 
 from fastapi import HTTPException, status
+from pydantic import BaseModel
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
@@ -49,3 +50,28 @@ def validate_query_params(
                 detail="Maximum results must be an integer value",
             )
     return True
+
+
+def parse_fields(fields: Optional[str], model: type[BaseModel]) -> Optional[set[str]]:
+    """
+    Parses a sparse fieldset, e.g. `fields=title,status`.
+
+    :param Optional[str] fields: comma separated names of the fields of
+        model to return, or None for all of them.
+    :param type[BaseModel] model: the read DTO being returned.
+    :raises HTTPException: If an unknown field is requested a 400 is
+        returned.
+    :return Optional[set[str]]: the requested fields (always including
+        import_id), or None for all of them.
+    """
+    if fields is None:
+        return None
+
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    invalid_fields = sorted(requested - model.model_fields.keys())
+    if invalid_fields:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Fields are invalid: {invalid_fields}",
+        )
+    return requested | {"import_id"}
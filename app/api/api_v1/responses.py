@@ -0,0 +1,65 @@
+"""
+Fast JSON responses for DTOs we built ourselves.
+
+When a route declares a `response_model` FastAPI validates whatever the
+route returns against it and only then serialises it. For the read routes
+the payload is already a list of our own pydantic DTOs, so that second
+validation pass is pure overhead and dominates large list responses.
+
+Returning a `DTOResponse` hands FastAPI a ready-made response, which it
+passes through untouched, and the DTOs are serialised once by
+pydantic-core straight to bytes. The `response_model` on the route is
+still used to document the endpoint.
+"""
+
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+# Headers the route's injected response carries that must not be copied
+# onto the real response, which computes its own.
+_OWN_HEADERS = (b"content-length", b"content-type")
+
+
+class DTOResponse(JSONResponse):
+    """A JSON response serialised by pydantic-core, without re-validation."""
+
+    def __init__(
+        self, content: Any, *args: Any, fields: Optional[set[str]] = None, **kwargs
+    ):
+        self.fields = fields
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        include: Any = self.fields
+        if include is not None and isinstance(content, list):
+            include = {"__all__": include}
+        return to_json(content, include=include)
+
+
+def dto_response(
+    content: Any,
+    response: Optional[Response] = None,
+    fields: Optional[set[str]] = None,
+) -> DTOResponse:
+    """
+    Wraps trusted DTOs (or lists of them) in a `DTOResponse`.
+
+    :param Any content: the DTO(s) to return, these must be built by our
+        own services as they are not validated against the response model.
+    :param Optional[Response] response: the route's injected response, any
+        headers set on it (e.g. the ETag) are carried over.
+    :param Optional[set[str]] fields: a sparse fieldset, only these fields
+        of each DTO are returned.
+    :return DTOResponse: the response to return from the route.
+    """
+    fast = DTOResponse(content, fields=fields)
+    if response is not None:
+        fast.raw_headers.extend(
+            (name, value)
+            for name, value in response.raw_headers
+            if name not in _OWN_HEADERS
+        )
+    return fast
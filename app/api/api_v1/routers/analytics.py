@@ -5,6 +5,7 @@ import logging
 from fastapi import APIRouter, HTTPException, Request, status
 
 import app.service.analytics as analytics_service
+from app.clients.db.session import run_blocking
 from app.errors import RepositoryError
 from app.model.analytics import SummaryDTO
 
@@ -22,7 +23,7 @@ async def get_analytics_summary(request: Request) -> SummaryDTO:
     data in key (str): value (int) form.
     """
     try:
-        summary_dto = analytics_service.summary(request.state.user)
+        summary_dto = await run_blocking(analytics_service.summary, request.state.user)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -2,6 +2,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.clients.db.session import run_blocking
 from app.errors import AuthorisationError, ValidationError
 from app.model.app_token import AppTokenCreateDTO
 from app.service.app_token import create_configuration_token
@@ -20,7 +21,9 @@ async def create_app_token(new_token: AppTokenCreateDTO) -> str:
     :return str: returns the newly encoded custom app token.
     """
     try:
-        token = create_configuration_token(new_token, new_token.expiry_years)
+        token = await run_blocking(
+            create_configuration_token, new_token, new_token.expiry_years
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -3,6 +3,8 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
+import app.clients.db.session as db_session
+import app.service.audit as audit_service
 import app.service.authorisation as auth_service
 import app.service.token as token_service
 from app.errors import (
@@ -11,7 +13,7 @@ from app.errors import (
     RepositoryError,
     TokenError,
 )
-from app.service.authentication import authenticate_user
+from app.service.authentication import authenticate_user_async
 
 auth_router = r = APIRouter()
 
@@ -35,9 +37,10 @@ async def check_user_auth(
     """
     try:
         # NOTE: there may come a time when the decoding needs to be transformed into the UserContext object
-        user = token_service.decode(token)
-        entity = auth_service.path_to_endpoint(request.scope["path"])
-        operation = auth_service.http_method_to_operation(request.scope["method"])
+        user = token_service.decode_cached(token)
+        access = auth_service.get_route_access(
+            request.scope["route"].path, request.scope["method"]
+        )
     except TokenError:
         msg = f"Invalid token {token}"
         _LOGGER.exception(msg)
@@ -47,30 +50,28 @@ async def check_user_auth(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    try:
-        if request.headers.get("content-type") == "application/json":
-            payload = await request.json()
-        else:
-            payload = False
-    except Exception as e:
-        _LOGGER.warning(f"⚠️ Failed to read request body: {e}")
-        payload = False
-
-    _LOGGER.info(
-        f"AUDIT: {user.email} is performing {operation} on {entity}",
-        extra={
-            "props": {
-                "request": request.scope["path"],
-                "user": user.email,
-                "op": operation,
-                "entity": entity,
-                "payload": payload if payload else "null",
-            }
-        },
+    # The body is already buffered for the route, reading it does not parse it
+    payload = None
+    if request.headers.get("content-type") == "application/json":
+        try:
+            payload = audit_service.capture_payload(await request.body())
+        except Exception as e:
+            _LOGGER.warning(f"⚠️ Failed to read request body: {e}")
+
+    audit_service.submit(
+        audit_service.AuditRecord(
+            path=request.scope["path"],
+            user=user.email,
+            operation=access.operation,
+            entity=access.entity,
+            payload=payload,
+        )
     )
 
     try:
-        auth_service.is_authorised(user, entity, operation)
+        auth_service.is_authorised(
+            user, access.entity, access.operation, access.required_access
+        )
     except AuthorisationError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -79,6 +80,7 @@ async def check_user_auth(
         )
 
     request.state.user = user
+    db_session.current_user.set(user.email)
 
 
 @r.post("/tokens")
@@ -89,7 +91,9 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     )
 
     try:
-        access_token = authenticate_user(form_data.username, form_data.password)
+        access_token = await authenticate_user_async(
+            form_data.username, form_data.password
+        )
     except (RepositoryError, AuthenticationError) as e:
         _LOGGER.error(f"Error getting token: {e.message}")
         raise HTTPException(
@@ -4,6 +4,7 @@ import os
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, UploadFile, status
 
+from app.clients.db.session import run_blocking
 from app.errors import ValidationError
 from app.model.general import Json
 from app.service.bulk_import import (
@@ -22,6 +23,15 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
 
+def _build_template(corpus_type: str) -> Json:
+    return {
+        "collections": [get_collection_template(corpus_type)],
+        "families": [get_family_template(corpus_type)],
+        "documents": [get_document_template(corpus_type)],
+        "events": [get_event_template(corpus_type)],
+    }
+
+
 @r.get(
     "/bulk-import/template/{corpus_type}",
     response_model=Json,
@@ -36,12 +46,7 @@ async def get_bulk_import_template(corpus_type: str) -> Json:
     """
 
     try:
-        return {
-            "collections": [get_collection_template(corpus_type)],
-            "families": [get_family_template(corpus_type)],
-            "documents": [get_document_template(corpus_type)],
-            "events": [get_event_template(corpus_type)],
-        }
+        return await run_blocking(_build_template, corpus_type)
     except ValidationError as e:
         _LOGGER.error(e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
@@ -70,7 +75,7 @@ async def bulk_import(
         data_dict = json.loads(content)
 
         _LOGGER.info("🔍 Checking that corpus exists...")
-        validate_corpus_exists(corpus_import_id)
+        await run_blocking(validate_corpus_exists, corpus_import_id)
 
         _LOGGER.info("🔍 Validating entity relationships in data...")
         validate_bulk_import_data(data_dict)
@@ -1,15 +1,19 @@
 """Endpoints for managing the Collection entity."""
 
 import logging
+from typing import Annotated, Union
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 import app.service.collection as collection_service
+from app.api.api_v1.etag import not_modified
 from app.api.api_v1.query_params import (
     get_query_params_as_dict,
     set_default_query_params,
     validate_query_params,
 )
+from app.api.api_v1.responses import dto_response
+from app.clients.db.session import run_blocking
 from app.errors import RepositoryError, ValidationError
 from app.model.collection import (
     CollectionCreateDTO,
@@ -28,17 +32,23 @@ _LOGGER = logging.getLogger(__name__)
     response_model=CollectionReadDTO,
 )
 async def get_collection(
+    request: Request,
+    response: Response,
     import_id: str,
-) -> CollectionReadDTO:
+) -> Union[CollectionReadDTO, Response]:
     """
     Returns a specific collection given the import id.
 
     :param str import_id: Specified import_id.
     :raises HTTPException: If the collection is not found a 404 is returned.
-    :return CollectionDTO: returns a CollectionDTO of the collection found.
+    :return CollectionDTO: returns a CollectionDTO of the collection found,
+        or a 304 if the client's copy (If-None-Match) is current.
     """
     try:
-        collection = collection_service.get(import_id)
+        version = await run_blocking(collection_service.entity_version, import_id)
+        if version is not None and (cached := not_modified(request, response, version)):
+            return cached
+        collection = await run_blocking(collection_service.get, import_id)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -52,21 +62,41 @@ async def get_collection(
             detail=f"Collection not found: {import_id}",
         )
 
-    return collection
+    return dto_response(collection, response)
 
 
 @r.get(
     "/collections",
     response_model=list[CollectionReadDTO],
 )
-async def get_all_collections(request: Request) -> list[CollectionReadDTO]:
+async def get_all_collections(
+    request: Request,
+    response: Response,
+    ids: Annotated[list[str] | None, Query()] = None,
+) -> Union[list[CollectionReadDTO], Response]:
     """
-    Returns all collections
+    Returns all collections, or only those with the given import ids.
 
+    :param Optional[list[str]] ids: import ids to fetch in one request,
+        collections that are missing or not visible to the user are
+        omitted.
+    :raises HTTPException: If an import id is invalid or too many are
+        requested a 400 is returned.
     :return CollectionDTO: returns a CollectionDTO of the collection found.
     """
     try:
-        return collection_service.all(request.state.user)
+        version = await run_blocking(collection_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        if ids is not None:
+            collections = await run_blocking(
+                collection_service.get_many, ids, request.state.user
+            )
+        else:
+            collections = await run_blocking(collection_service.all, request.state.user)
+        return dto_response(collections, response)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -77,7 +107,9 @@ async def get_all_collections(request: Request) -> list[CollectionReadDTO]:
     "/collections/",
     response_model=list[CollectionReadDTO],
 )
-async def search_collection(request: Request) -> list[CollectionReadDTO]:
+async def search_collection(
+    request: Request, response: Response
+) -> Union[list[CollectionReadDTO], Response]:
     """
     Searches for collections matching URL parameters ("q" by default).
 
@@ -100,7 +132,12 @@ async def search_collection(request: Request) -> list[CollectionReadDTO]:
     validate_query_params(query_params, VALID_PARAMS)
 
     try:
-        collections = collection_service.search(query_params, request.state.user)
+        version = await run_blocking(collection_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        collections = await run_blocking(
+            collection_service.search, query_params, request.state.user
+        )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -120,7 +157,7 @@ async def search_collection(request: Request) -> list[CollectionReadDTO]:
     if len(collections) == 0:
         _LOGGER.info(f"Collections not found for terms: {query_params}")
 
-    return collections
+    return dto_response(collections, response)
 
 
 @r.put(
@@ -139,7 +176,9 @@ async def update_collection(
     :return CollectionDTO: returns a CollectionDTO of the collection updated.
     """
     try:
-        collection = collection_service.update(import_id, new_collection)
+        collection = await run_blocking(
+            collection_service.update, import_id, new_collection
+        )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -171,7 +210,7 @@ async def create_collection(
     """
     try:
         org_id = new_collection.org_id or request.state.user.org_id
-        return collection_service.create(new_collection, org_id)
+        return await run_blocking(collection_service.create, new_collection, org_id)
     except ValidationError as e:
         _LOGGER.error(e.message)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
@@ -195,7 +234,7 @@ async def delete_collection(
     :raises HTTPException: If the collection is not found a 404 is returned.
     """
     try:
-        collection_deleted = collection_service.delete(import_id)
+        collection_deleted = await run_blocking(collection_service.delete, import_id)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -1,19 +1,45 @@
-from fastapi import APIRouter, HTTPException, Request, status
+from typing import Annotated, Union
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 import app.service.config as config_service
+from app.api.api_v1.etag import not_modified
+from app.clients.db.session import run_blocking
 from app.errors import RepositoryError
-from app.model.config import ConfigReadDTO
+from app.model.config import CompactConfigReadDTO, ConfigReadDTO
 
 config_router = r = APIRouter()
 
 
-@r.get("/config", response_model=ConfigReadDTO)
-async def get_config(request: Request) -> ConfigReadDTO:
+@r.get("/config", response_model=Union[ConfigReadDTO, CompactConfigReadDTO])
+async def get_config(
+    request: Request,
+    response: Response,
+    compact: Annotated[bool, Query()] = False,
+) -> Union[ConfigReadDTO, CompactConfigReadDTO, Response]:
+    """
+    Returns the config for the current user's organisations.
+
+    :param bool compact: If true, corpora refer to their corpus type by name
+        and each taxonomy is only included once, in corpus_types.
+    :raises HTTPException: If a DB error occurs a 503 is returned.
+    :return: The config, or a 304 if the client's copy is current.
+    """
     user = request.state.user
     try:
-        config = config_service.get(user)
+        config = await run_blocking(config_service.get_serialised, user, compact)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
         )
-    return config
+
+    if cached := not_modified(request, response, config.digest):
+        return cached
+
+    # The payload is already serialised (and was validated when built), so
+    # send it as is rather than have it re-validated against the model.
+    return Response(
+        content=config.payload,
+        media_type="application/json",
+        headers={"ETag": response.headers["ETag"]},
+    )
@@ -1,12 +1,15 @@
 import logging
+from typing import Union
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.api.api_v1.query_params import (
     get_query_params_as_dict,
     set_default_query_params,
     validate_query_params,
 )
+from app.api.api_v1.responses import dto_response
+from app.clients.db.session import run_blocking
 from app.errors import (
     AuthorisationError,
     ConflictError,
@@ -30,7 +33,7 @@ _LOGGER = logging.getLogger(__file__)
     "/corpora/{import_id}",
     response_model=CorpusReadDTO,
 )
-async def get_corpus(import_id: str) -> CorpusReadDTO:
+async def get_corpus(import_id: str) -> Union[CorpusReadDTO, Response]:
     """
     Returns a specific corpus given the import id.
 
@@ -39,7 +42,7 @@ async def get_corpus(import_id: str) -> CorpusReadDTO:
     :return CorpusReadDTO: returns a CorpusReadDTO of the corpus found.
     """
     try:
-        corpus = corpus_service.get(import_id)
+        corpus = await run_blocking(corpus_service.get, import_id)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -53,11 +56,11 @@ async def get_corpus(import_id: str) -> CorpusReadDTO:
             detail=f"Corpus not found: {import_id}",
         )
 
-    return corpus
+    return dto_response(corpus)
 
 
 @r.get("/corpora", response_model=list[CorpusReadDTO])
-async def get_all_corpora(request: Request) -> list[CorpusReadDTO]:
+async def get_all_corpora(request: Request) -> Union[list[CorpusReadDTO], Response]:
     """
     Returns all corpora
 
@@ -65,7 +68,7 @@ async def get_all_corpora(request: Request) -> list[CorpusReadDTO]:
     :return CorpusReadDTO: returns a CorpusReadDTO of the corpora found.
     """
     try:
-        return corpus_service.all(request.state.user)
+        return dto_response(await run_blocking(corpus_service.all, request.state.user))
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -73,7 +76,7 @@ async def get_all_corpora(request: Request) -> list[CorpusReadDTO]:
 
 
 @r.get("/corpora/", response_model=list[CorpusReadDTO])
-async def search_corpora(request: Request) -> list[CorpusReadDTO]:
+async def search_corpora(request: Request) -> Union[list[CorpusReadDTO], Response]:
     """
     Searches for corpora matching URL parameters ("q" by default).
 
@@ -95,7 +98,9 @@ async def search_corpora(request: Request) -> list[CorpusReadDTO]:
     validate_query_params(query_params, VALID_PARAMS)
 
     try:
-        corpora = corpus_service.search(query_params, request.state.user)
+        corpora = await run_blocking(
+            corpus_service.search, query_params, request.state.user
+        )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -113,7 +118,7 @@ async def search_corpora(request: Request) -> list[CorpusReadDTO]:
     if len(corpora) == 0:
         _LOGGER.info(f"Corpora not found for terms: {query_params}")
 
-    return corpora
+    return dto_response(corpora)
 
 
 @r.put(
@@ -132,7 +137,9 @@ async def update_corpus(
     :return CorpusReadDTO: returns a CorpusReadDTO of the corpus updated.
     """
     try:
-        corpus = corpus_service.update(import_id, new_corpus, request.state.user)
+        corpus = await run_blocking(
+            corpus_service.update, import_id, new_corpus, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -160,7 +167,9 @@ async def create_corpus(request: Request, new_corpus: CorpusCreateDTO) -> str:
     :return str: returns the import id of the newly created corpus.
     """
     try:
-        corpus_id = corpus_service.create(new_corpus, request.state.user)
+        corpus_id = await run_blocking(
+            corpus_service.create, new_corpus, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -185,7 +194,7 @@ async def get_upload_url(corpus_id: str) -> CorpusLogoUploadDTO:
     """
     _LOGGER.info(f"Getting upload URL for corpus {corpus_id}")
     try:
-        return corpus_service.get_upload_url(corpus_id)
+        return await run_blocking(corpus_service.get_upload_url, corpus_id)
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Request, status
 
+from app.clients.db.session import run_blocking
 from app.errors import AuthorisationError, RepositoryError, ValidationError
 from app.model.corpus_type import CorpusTypeCreateDTO, CorpusTypeReadDTO
 from app.service import corpus_type as corpus_type_service
@@ -19,7 +20,7 @@ async def get_all_corpus_types(request: Request) -> list[CorpusTypeReadDTO]:
     :return CorpusTypeReadDTO: The requested corpus type.
     """
     try:
-        return corpus_type_service.all(request.state.user)
+        return await run_blocking(corpus_type_service.all, request.state.user)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -38,7 +39,7 @@ async def get_corpus_type(corpus_type_name: str) -> CorpusTypeReadDTO:
     :return CorpusTypeReadDTO: The requested corpus type.
     """
     try:
-        corpus_type = corpus_type_service.get(corpus_type_name)
+        corpus_type = await run_blocking(corpus_type_service.get, corpus_type_name)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -71,7 +72,7 @@ async def create_corpus_type(
     """
 
     try:
-        return corpus_type_service.create(new_corpus_type)
+        return await run_blocking(corpus_type_service.create, new_corpus_type)
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
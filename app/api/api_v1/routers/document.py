@@ -1,15 +1,20 @@
 """Endpoints for managing the Document entity."""
 
 import logging
+from typing import Annotated, Union
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 import app.service.document as document_service
+from app.api.api_v1.etag import not_modified
 from app.api.api_v1.query_params import (
     get_query_params_as_dict,
+    parse_fields,
     set_default_query_params,
     validate_query_params,
 )
+from app.api.api_v1.responses import dto_response
+from app.clients.db.session import run_blocking
 from app.errors import AuthorisationError, RepositoryError, ValidationError
 from app.model.document import DocumentCreateDTO, DocumentReadDTO, DocumentWriteDTO
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
@@ -23,16 +28,28 @@ _LOGGER = logging.getLogger(__name__)
     "/documents/{import_id}",
     response_model=DocumentReadDTO,
 )
-async def get_document(import_id: str) -> DocumentReadDTO:
+async def get_document(
+    request: Request,
+    response: Response,
+    import_id: str,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[DocumentReadDTO, Response]:
     """
     Returns a specific document given the import id.
 
     :param str import_id: Specified import_id.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "title,status"), the rest are neither computed nor returned.
     :raises HTTPException: If the document is not found a 404 is returned.
-    :return DocumentDTO: returns a DocumentDTO of the document found.
+    :return DocumentDTO: returns a DocumentDTO of the document found, or a
+        304 if the client's copy (If-None-Match) is current.
     """
+    sparse_fields = parse_fields(fields, DocumentReadDTO)
     try:
-        document = document_service.get(import_id)
+        version = await run_blocking(document_service.entity_version, import_id)
+        if version is not None and (cached := not_modified(request, response, version)):
+            return cached
+        document = await run_blocking(document_service.get, import_id, sparse_fields)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -46,22 +63,47 @@ async def get_document(import_id: str) -> DocumentReadDTO:
             detail=f"Document not found: {import_id}",
         )
 
-    return document
+    return dto_response(document, response, sparse_fields)
 
 
 @r.get(
     "/documents",
     response_model=list[DocumentReadDTO],
 )
-async def get_all_documents(request: Request) -> list[DocumentReadDTO]:
+async def get_all_documents(
+    request: Request,
+    response: Response,
+    ids: Annotated[list[str] | None, Query()] = None,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[list[DocumentReadDTO], Response]:
     """
-    Returns all documents
+    Returns all documents, or only those with the given import ids.
 
     :param Request request: Request object.
+    :param Optional[list[str]] ids: import ids to fetch in one request,
+        documents that are missing or not visible to the user are omitted.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "title,status"), the rest are neither computed nor returned.
+    :raises HTTPException: If an import id is invalid or too many are
+        requested a 400 is returned.
     :return DocumentDTO: returns a DocumentDTO of the document found.
     """
+    sparse_fields = parse_fields(fields, DocumentReadDTO)
     try:
-        return document_service.all(request.state.user)
+        version = await run_blocking(document_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        if ids is not None:
+            documents = await run_blocking(
+                document_service.get_many, ids, request.state.user, sparse_fields
+            )
+        else:
+            documents = await run_blocking(
+                document_service.all, request.state.user, sparse_fields
+            )
+        return dto_response(documents, response, sparse_fields)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -72,12 +114,18 @@ async def get_all_documents(request: Request) -> list[DocumentReadDTO]:
     "/documents/",
     response_model=list[DocumentReadDTO],
 )
-async def search_document(request: Request) -> list[DocumentReadDTO]:
+async def search_document(
+    request: Request,
+    response: Response,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[list[DocumentReadDTO], Response]:
     """
     Searches for documents matching URL parameters ("q" by default).
 
     :param Request request: The fields to match against and the values
         to search for. Defaults to searching for "" in document titles.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "title,status"), the rest are neither computed nor returned.
     :raises HTTPException: If invalid fields passed a 400 is returned.
     :raises HTTPException: If a DB error occurs a 503 is returned.
     :raises HTTPException: If the search request times out a 408 is
@@ -86,6 +134,8 @@ async def search_document(request: Request) -> list[DocumentReadDTO]:
         can be empty).
     """
     query_params = get_query_params_as_dict(request.query_params)
+    query_params.pop("fields", None)
+    sparse_fields = parse_fields(fields, DocumentReadDTO)
 
     query_params = set_default_query_params(query_params)
 
@@ -93,7 +143,12 @@ async def search_document(request: Request) -> list[DocumentReadDTO]:
     validate_query_params(query_params, VALID_PARAMS)
 
     try:
-        documents = document_service.search(query_params, request.state.user)
+        version = await run_blocking(document_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        documents = await run_blocking(
+            document_service.search, query_params, request.state.user, sparse_fields
+        )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -111,7 +166,7 @@ async def search_document(request: Request) -> list[DocumentReadDTO]:
     if len(documents) == 0:
         _LOGGER.info(f"Documents not found for terms: {query_params}")
 
-    return documents
+    return dto_response(documents, response, sparse_fields)
 
 
 @r.put(
@@ -130,7 +185,9 @@ async def update_document(
     :return DocumentDTO: returns a DocumentDTO of the document updated.
     """
     try:
-        document = document_service.update(import_id, new_document, request.state.user)
+        document = await run_blocking(
+            document_service.update, import_id, new_document, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -162,7 +219,9 @@ async def create_document(request: Request, new_document: DocumentCreateDTO) ->
     :return str: returns a the import_id of the document created.
     """
     try:
-        return document_service.create(new_document, request.state.user)
+        return await run_blocking(
+            document_service.create, new_document, request.state.user
+        )
     except AuthorisationError as e:
         _LOGGER.error(e.message)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
@@ -208,7 +267,9 @@ async def delete_document(request: Request, import_id: str) -> None:
     :raises HTTPException: If the document is not found a 404 is returned.
     """
     try:
-        document_deleted = document_service.delete(import_id, request.state.user)
+        document_deleted = await run_blocking(
+            document_service.delete, import_id, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
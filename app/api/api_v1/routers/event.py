@@ -1,15 +1,20 @@
 """Endpoints for managing Family Event entities."""
 
 import logging
+from typing import Annotated, Union
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 import app.service.event as event_service
+from app.api.api_v1.etag import not_modified
 from app.api.api_v1.query_params import (
     get_query_params_as_dict,
+    parse_fields,
     set_default_query_params,
     validate_query_params,
 )
+from app.api.api_v1.responses import dto_response
+from app.clients.db.session import run_blocking
 from app.errors import AuthorisationError, RepositoryError, ValidationError
 from app.model.event import EventCreateDTO, EventReadDTO, EventWriteDTO
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
@@ -23,13 +28,44 @@ _LOGGER = logging.getLogger(__name__)
     "/events",
     response_model=list[EventReadDTO],
 )
-async def get_all_events(request: Request) -> list[EventReadDTO]:
+async def get_all_events(
+    request: Request,
+    response: Response,
+    ids: Annotated[list[str] | None, Query()] = None,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[list[EventReadDTO], Response]:
     """
-    Returns all family events.
-
+    Returns all family events, or only those with the given import ids.
+
+    :param Optional[list[str]] ids: import ids to fetch in one request,
+        events that are missing or not visible to the user are omitted.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "event_title,date").
+    :raises HTTPException: If an import id is invalid or too many are
+        requested a 400 is returned.
     :return EventDTO: returns a EventDTO if the event is found.
     """
-    found_events = event_service.all(request.state.user)
+    sparse_fields = parse_fields(fields, EventReadDTO)
+    version = await run_blocking(event_service.version, request.state.user)
+    if cached := not_modified(request, response, version):
+        return cached
+
+    if ids is not None:
+        try:
+            found_events = await run_blocking(
+                event_service.get_many, ids, request.state.user
+            )
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=e.message
+            )
+        except RepositoryError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
+            )
+        return dto_response(found_events, response, sparse_fields)
+
+    found_events = await run_blocking(event_service.all, request.state.user)
 
     if not found_events:
         raise HTTPException(
@@ -37,20 +73,26 @@ async def get_all_events(request: Request) -> list[EventReadDTO]:
             detail="No family events found",
         )
 
-    return found_events
+    return dto_response(found_events, response, sparse_fields)
 
 
 @r.get(
     "/events/",
     response_model=list[EventReadDTO],
 )
-async def search_event(request: Request) -> list[EventReadDTO]:
+async def search_event(
+    request: Request,
+    response: Response,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[list[EventReadDTO], Response]:
     """
     Searches for family events matching URL parameters ("q" by default).
 
     :param Request request: The fields to match against and the values
         to search for. Defaults to searching for "" in event titles and
         type names.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "event_title,date").
     :raises HTTPException: If invalid fields passed a 400 is returned.
     :raises HTTPException: If a DB error occurs a 503 is returned.
     :raises HTTPException: If the search request times out a 408 is
@@ -59,6 +101,8 @@ async def search_event(request: Request) -> list[EventReadDTO]:
         empty).
     """
     query_params = get_query_params_as_dict(request.query_params)
+    query_params.pop("fields", None)
+    sparse_fields = parse_fields(fields, EventReadDTO)
 
     query_params = set_default_query_params(query_params)
 
@@ -66,7 +110,12 @@ async def search_event(request: Request) -> list[EventReadDTO]:
     validate_query_params(query_params, VALID_PARAMS)
 
     try:
-        events_found = event_service.search(query_params, request.state.user)
+        version = await run_blocking(event_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        events_found = await run_blocking(
+            event_service.search, query_params, request.state.user
+        )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -84,23 +133,35 @@ async def search_event(request: Request) -> list[EventReadDTO]:
     if len(events_found) == 0:
         _LOGGER.info(f"Events not found for terms: {query_params}")
 
-    return events_found
+    return dto_response(events_found, response, sparse_fields)
 
 
 @r.get(
     "/events/{import_id}",
     response_model=EventReadDTO,
 )
-async def get_event(import_id: str) -> EventReadDTO:
+async def get_event(
+    request: Request,
+    response: Response,
+    import_id: str,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[EventReadDTO, Response]:
     """
     Returns a specific family event given an import id.
 
     :param str import_id: Specified import_id.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "event_title,date").
     :raises HTTPException: If the event is not found a 404 is returned.
-    :return EventDTO: returns a EventDTO if the event is found.
+    :return EventDTO: returns a EventDTO if the event is found, or a 304
+        if the client's copy (If-None-Match) is current.
     """
+    sparse_fields = parse_fields(fields, EventReadDTO)
     try:
-        event = event_service.get(import_id)
+        version = await run_blocking(event_service.entity_version, import_id)
+        if version is not None and (cached := not_modified(request, response, version)):
+            return cached
+        event = await run_blocking(event_service.get, import_id)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -114,7 +175,7 @@ async def get_event(import_id: str) -> EventReadDTO:
             detail=f"Event not found: {import_id}",
         )
 
-    return event
+    return dto_response(event, response, sparse_fields)
 
 
 @r.post("/events", response_model=str, status_code=status.HTTP_201_CREATED)
@@ -134,7 +195,7 @@ async def create_event(
     :return str: returns a the import_id of the event created.
     """
     try:
-        return event_service.create(new_event, request.state.user)
+        return await run_blocking(event_service.create, new_event, request.state.user)
 
     except AuthorisationError as e:
         _LOGGER.error(e.message)
@@ -167,7 +228,9 @@ async def update_event(
     :return EventDTO: returns a EventDTO of the event updated.
     """
     try:
-        event = event_service.update(import_id, new_event, request.state.user)
+        event = await run_blocking(
+            event_service.update, import_id, new_event, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -196,7 +259,9 @@ async def delete_event(request: Request, import_id: str) -> None:
     :raises HTTPException: If the event is not found a 404 is returned.
     """
     try:
-        event_deleted = event_service.delete(import_id, request.state.user)
+        event_deleted = await run_blocking(
+            event_service.delete, import_id, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -8,16 +8,20 @@ implemented directly accesses the "repository" layer.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Union
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 import app.service.family as family_service
+from app.api.api_v1.etag import not_modified
 from app.api.api_v1.query_params import (
     get_query_params_as_dict,
+    parse_fields,
     set_default_query_params,
     validate_query_params,
 )
+from app.api.api_v1.responses import dto_response
+from app.clients.db.session import run_blocking
 from app.errors import AuthorisationError, RepositoryError, ValidationError
 from app.model.family import FamilyCreateDTO, FamilyReadDTO, FamilyWriteDTO
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
@@ -31,16 +35,28 @@ _LOGGER = logging.getLogger(__name__)
     "/families/{import_id}",
     response_model=FamilyReadDTO,
 )
-async def get_family(import_id: str) -> FamilyReadDTO:
+async def get_family(
+    request: Request,
+    response: Response,
+    import_id: str,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[FamilyReadDTO, Response]:
     """
     Returns a specific family given the import id.
 
     :param str import_id: Specified import_id.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "title,status"), the rest are neither computed nor returned.
     :raises HTTPException: If the family is not found a 404 is returned.
-    :return FamilyDTO: returns a FamilyDTO of the family found.
+    :return FamilyDTO: returns a FamilyDTO of the family found, or a 304
+        if the client's copy (If-None-Match) is current.
     """
+    sparse_fields = parse_fields(fields, FamilyReadDTO)
     try:
-        family = family_service.get(import_id)
+        version = await run_blocking(family_service.entity_version, import_id)
+        if version is not None and (cached := not_modified(request, response, version)):
+            return cached
+        family = await run_blocking(family_service.get, import_id, sparse_fields)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
@@ -54,19 +70,44 @@ async def get_family(import_id: str) -> FamilyReadDTO:
             detail=f"Family not found: {import_id}",
         )
 
-    return family
+    return dto_response(family, response, sparse_fields)
 
 
 @r.get("/families", response_model=list[FamilyReadDTO])
-async def get_all_families(request: Request) -> list[FamilyReadDTO]:
+async def get_all_families(
+    request: Request,
+    response: Response,
+    ids: Annotated[list[str] | None, Query()] = None,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[list[FamilyReadDTO], Response]:
     """
-    Returns all families
+    Returns all families, or only those with the given import ids.
 
     :param Request request: Request object.
+    :param Optional[list[str]] ids: import ids to fetch in one request,
+        families that are missing or not visible to the user are omitted.
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "title,status"), the rest are neither computed nor returned.
+    :raises HTTPException: If an import id is invalid or too many are
+        requested a 400 is returned.
     :return FamilyDTO: returns a FamilyDTO of the family found.
     """
+    sparse_fields = parse_fields(fields, FamilyReadDTO)
     try:
-        return family_service.all(request.state.user)
+        version = await run_blocking(family_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        if ids is not None:
+            families = await run_blocking(
+                family_service.get_many, ids, request.state.user, sparse_fields
+            )
+        else:
+            families = await run_blocking(
+                family_service.all, request.state.user, sparse_fields
+            )
+        return dto_response(families, response, sparse_fields)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -78,17 +119,25 @@ async def get_all_families(request: Request) -> list[FamilyReadDTO]:
 @r.get("/families/", response_model=list[FamilyReadDTO])
 async def search_family(
     request: Request,
+    response: Response,
     # We have used the built in parsers here for geography and corpus specifically
     # so that we do not have to build our own
     geography: Annotated[list[str] | None, Query()] = None,
     corpus: Annotated[list[str] | None, Query()] = None,
-) -> list[FamilyReadDTO]:
+    include_sub_geographies: Annotated[bool, Query()] = False,
+    fields: Annotated[str | None, Query()] = None,
+) -> Union[list[FamilyReadDTO], Response]:
     """
     Searches for families matching URL parameters ("q" by default).
 
     :param Request request: The fields to match against and the values
         to search for. Defaults to searching for "" in family titles and
         summaries.
+    :param bool include_sub_geographies: Also match families linked to
+        any descendant of the requested geographies (e.g. the countries
+        within a region).
+    :param Optional[str] fields: comma separated fields to return (e.g.
+        "title,status"), the rest are neither computed nor returned.
     :raises HTTPException: If invalid fields passed a 400 is returned.
     :raises HTTPException: If a DB error occurs a 503 is returned.
     :raises HTTPException: If the search request times out a 408 is
@@ -97,6 +146,8 @@ async def search_family(
         empty).
     """
     query_params = get_query_params_as_dict(request.query_params)
+    query_params.pop("fields", None)
+    sparse_fields = parse_fields(fields, FamilyReadDTO)
 
     query_params = set_default_query_params(query_params)
 
@@ -108,12 +159,22 @@ async def search_family(
         "geography",
         "status",
         "max_results",
+        "include_sub_geographies",
     ]
     validate_query_params(query_params, VALID_PARAMS)
 
     try:
-        families = family_service.search(
-            query_params, request.state.user, geography, corpus
+        version = await run_blocking(family_service.version, request.state.user)
+        if cached := not_modified(request, response, version):
+            return cached
+        families = await run_blocking(
+            family_service.search,
+            query_params,
+            request.state.user,
+            geography,
+            corpus,
+            include_sub_geographies,
+            sparse_fields,
         )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
@@ -134,7 +195,7 @@ async def search_family(
     if len(families) == 0:
         _LOGGER.info(f"Families not found for terms: {query_params}")
 
-    return families
+    return dto_response(families, response, sparse_fields)
 
 
 @r.put("/families/{import_id}", response_model=FamilyReadDTO)
@@ -149,7 +210,9 @@ async def update_family(
     :return FamilyDTO: returns a FamilyDTO of the family updated.
     """
     try:
-        family = family_service.update(import_id, request.state.user, new_family)
+        family = await run_blocking(
+            family_service.update, import_id, request.state.user, new_family
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -179,7 +242,9 @@ async def create_family(request: Request, new_family: FamilyCreateDTO) -> str:
     :return FamilyDTO: returns a FamilyDTO of the new family.
     """
     try:
-        family = family_service.create(new_family, request.state.user)
+        family = await run_blocking(
+            family_service.create, new_family, request.state.user
+        )
     except AuthorisationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     except ValidationError as e:
@@ -204,7 +269,9 @@ async def delete_family(request: Request, import_id: str) -> None:
     :raises HTTPException: If the family is not found a 404 is returned.
     """
     try:
-        family_deleted = family_service.delete(import_id, request.state.user)
+        family_deleted = await run_blocking(
+            family_service.delete, import_id, request.state.user
+        )
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
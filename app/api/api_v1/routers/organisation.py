@@ -2,6 +2,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.clients.db.session import run_blocking
 from app.errors import RepositoryError, ValidationError
 from app.model.organisation import (
     OrganisationCreateDTO,
@@ -27,7 +28,7 @@ async def get_all_organisations() -> list[OrganisationReadDTO]:
     :return CorpusTypeReadDTO: The requested corpus type.
     """
     try:
-        return organisation_service.all()
+        return await run_blocking(organisation_service.all)
     except RepositoryError as e:
         _LOGGER.error(e)
         raise HTTPException(
@@ -47,7 +48,7 @@ async def get_organisation(organisation_id: int) -> OrganisationReadDTO:
     :return OrganisationReadDTO: The requested organisation.
     """
     try:
-        org = organisation_service.get(organisation_id)
+        org = await run_blocking(organisation_service.get, organisation_id)
     except ValidationError as e:
         _LOGGER.error(e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
@@ -81,7 +82,9 @@ async def create_organisation(new_organisation: OrganisationCreateDTO) -> int:
     :return int: The id of the newly created organisation.
     """
     try:
-        created_org_id = organisation_service.create(new_organisation)
+        created_org_id = await run_blocking(
+            organisation_service.create, new_organisation
+        )
         return created_org_id
 
     except RepositoryError as e:
@@ -112,7 +115,9 @@ async def update_organisation(
     :return OrganisationReadDTO: The updated organisation.
     """
     try:
-        updated_org = organisation_service.update(id, updated_organisation)
+        updated_org = await run_blocking(
+            organisation_service.update, id, updated_organisation
+        )
 
     except RepositoryError as e:
         _LOGGER.error(e)
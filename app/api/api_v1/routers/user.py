@@ -2,6 +2,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.clients.db.session import run_blocking
 from app.errors import RepositoryError, ValidationError
 from app.model.user import UserReadDTO, UserWriteDTO
 from app.service import app_user as user_service
@@ -16,7 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 async def get_all_users() -> list[UserReadDTO]:
     """Return all users with their organisation memberships."""
     try:
-        return user_service.all_users()
+        return await run_blocking(user_service.all_users)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -27,7 +28,7 @@ async def get_all_users() -> list[UserReadDTO]:
 async def get_user(email: str) -> UserReadDTO:
     """Return a single user by email."""
     try:
-        user = user_service.get_user(email)
+        user = await run_blocking(user_service.get_user, email)
     except RepositoryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message
@@ -49,7 +50,7 @@ async def update_user(email: str, user_write: UserWriteDTO) -> UserReadDTO:
     Superuser only.
     """
     try:
-        updated = user_service.update_user(email, user_write)
+        updated = await run_blocking(user_service.update_user, email, user_write)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except RepositoryError as e:
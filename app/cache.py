@@ -0,0 +1,114 @@
+"""
+Small in-process caches.
+
+These hold derived data (counts, serialised payloads, verified tokens) for a
+short time so hot read endpoints can skip the database. Each worker process
+has its own copy, so entries must have a TTL that bounds how stale they can
+get when a write happens in another process.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A thread-safe mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Returns the cached value for key if it has not expired.
+
+        :param K key: The cache key.
+        :return Optional[V]: The value or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Stores a value for key, replacing any existing entry.
+
+        :param K key: The cache key.
+        :param V value: The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drops every entry, e.g. after a write that affects them all."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe mapping holding at most ``maxsize`` entries.
+
+    Each entry carries its own expiry as a unix timestamp, and the least
+    recently used entry is evicted when the cache is full. Hits and misses
+    are counted so the cache can be monitored.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Returns the cached value for key if it has not expired.
+
+        :param K key: The cache key.
+        :return Optional[V]: The value or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, expires_at: float) -> None:
+        """
+        Stores a value for key until expires_at, evicting if full.
+
+        :param K key: The cache key.
+        :param V value: The value to cache.
+        :param float expires_at: The unix timestamp the entry expires at.
+        """
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops every entry and resets the hit and miss counts."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,141 @@
+"""
+Connection pool metrics.
+
+The engine's pool is the first thing to run out under load, e.g. during a
+bulk import, and until now the only sign of it was a request failing after
+pool_timeout. `instrument_pool` reports through the Telemetry meter:
+
+- db.pool.checked_out: connections currently in use.
+- db.pool.overflow: connections open beyond pool_size.
+- db.pool.checkout_wait: how long each checkout waited for a connection.
+- db.pool.connection_age: how old each connection was when checked out.
+- db.pool.timeouts: checkouts that gave up after pool_timeout.
+
+Each figure carries a `pool` attribute naming the engine's pool, taken from
+create_engine's pool_logging_name ("primary" when unset), so the primary and
+the read replica are reported apart.
+"""
+
+import time
+from typing import NamedTuple, Optional
+
+from opentelemetry.metrics import (
+    CallbackOptions,
+    Counter,
+    Histogram,
+    Meter,
+    Observation,
+)
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class _PoolInstruments(NamedTuple):
+    checkout_wait: Histogram
+    connection_age: Histogram
+    timeouts: Counter
+
+
+_instruments: Optional[_PoolInstruments] = None
+
+# The instrumented engines by pool name, read by the gauges on each collection.
+_engines: dict[str, Engine] = {}
+
+
+def _pool_name(pool: Pool) -> str:
+    return pool.logging_name or "primary"
+
+
+class InstrumentedQueuePool(QueuePool):
+    """A QueuePool that records how long checkouts wait, once instrumented."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        attributes = {"pool": _pool_name(self)}
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if _instruments is not None:
+                _instruments.timeouts.add(1, attributes)
+            raise
+        finally:
+            if _instruments is not None:
+                _instruments.checkout_wait.record(
+                    (time.perf_counter() - start) * 1000, attributes
+                )
+
+
+def instrument_pool(engine: Engine, meter: Meter) -> None:
+    """
+    Reports the engine's pool metrics through the given meter.
+
+    Call once per engine. The instruments are created on the first call and
+    shared by later ones, which add their engine under its own pool name.
+    The pool is read through the engine on each collection, so metrics
+    carry on after the engine is disposed and its pool recreated.
+
+    :param Engine engine: The engine, built with InstrumentedQueuePool.
+    :param Meter meter: The meter to report through.
+    """
+    global _instruments
+
+    if _instruments is None:
+        _engines.clear()
+        _instruments = _create_instruments(meter)
+
+    name = _pool_name(engine.pool)
+    _engines[name] = engine
+    attributes = {"pool": name}
+
+    @event.listens_for(engine, "checkout")
+    def _record_age(dbapi_connection, connection_record, connection_proxy):
+        if _instruments is not None:
+            _instruments.connection_age.record(
+                time.time() - connection_record.starttime, attributes
+            )
+
+
+def _create_instruments(meter: Meter) -> _PoolInstruments:
+    def _checked_out(_: CallbackOptions) -> list[Observation]:
+        return [
+            Observation(engine.pool.checkedout(), {"pool": name})
+            for name, engine in _engines.items()
+        ]
+
+    def _overflow(_: CallbackOptions) -> list[Observation]:
+        # QueuePool counts overflow from -pool_size, so clamp at zero.
+        return [
+            Observation(max(0, engine.pool.overflow()), {"pool": name})
+            for name, engine in _engines.items()
+        ]
+
+    meter.create_observable_gauge(
+        "db.pool.checked_out",
+        callbacks=[_checked_out],
+        unit="{connection}",
+        description="Connections currently checked out of the pool",
+    )
+    meter.create_observable_gauge(
+        "db.pool.overflow",
+        callbacks=[_overflow],
+        unit="{connection}",
+        description="Connections open beyond the pool size",
+    )
+    return _PoolInstruments(
+        checkout_wait=meter.create_histogram(
+            "db.pool.checkout_wait",
+            unit="ms",
+            description="Time spent waiting to check out a connection",
+        ),
+        connection_age=meter.create_histogram(
+            "db.pool.connection_age",
+            unit="s",
+            description="Age of a connection when it is checked out",
+        ),
+        timeouts=meter.create_counter(
+            "db.pool.timeouts",
+            unit="{checkout}",
+            description="Checkouts that timed out waiting for a connection",
+        ),
+    )
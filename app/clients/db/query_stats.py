@@ -0,0 +1,138 @@
+"""
+Per-request SQL statistics.
+
+Listeners on every engine add each statement's run time and row count to
+the QueryStats of the request being served. It is held in a context
+variable, which run_blocking carries into the DB thread pool. The request
+middleware returns the totals as a Server-Timing header and as span
+attributes. It also logs any statement run more than QUERY_REPEAT_WARNING
+times in one request, which usually means an N+1 query. `observe` adds the
+figures for its own span.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Generator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# A run of bound parameters, e.g. an expanded IN list, so statements that
+# differ only in how many values they were given count as the same one.
+_PARAM_LIST = re.compile(r"\(\s*%\(\w+\)s(?:\s*,\s*%\(\w+\)s)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """The statements run for one request."""
+
+    statements: int = 0
+    duration_ms: float = 0.0
+    rows: int = 0
+    by_statement: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_ms: float, rows: int) -> None:
+        """
+        Adds a statement that has run.
+
+        :param str statement: The SQL as sent to the database.
+        :param float duration_ms: How long it took.
+        :param int rows: How many rows it returned or changed.
+        """
+        self.statements += 1
+        self.duration_ms += duration_ms
+        self.rows += rows
+        self.by_statement[normalise(statement)] += 1
+
+    def snapshot(self) -> tuple[int, float, int]:
+        """The running totals, to compare against later with `since`."""
+        return self.statements, self.duration_ms, self.rows
+
+    def since(self, snapshot: tuple[int, float, int]) -> dict[str, Any]:
+        """
+        The statements run since a snapshot, as span attributes.
+
+        :param tuple[int, float, int] snapshot: An earlier `snapshot`.
+        :return dict[str, Any]: The counts, keyed by attribute name.
+        """
+        statements, duration_ms, rows = snapshot
+        return {
+            "db.statements": self.statements - statements,
+            "db.duration_ms": round(self.duration_ms - duration_ms, 3),
+            "db.rows": self.rows - rows,
+        }
+
+    def attributes(self) -> dict[str, Any]:
+        """Every statement recorded, as span attributes."""
+        return self.since((0, 0.0, 0))
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        The statements run more than threshold times, most repeated first.
+
+        :param int threshold: How many runs of one statement are expected.
+        :return list[tuple[str, int]]: Each statement and its count.
+        """
+        return [(s, n) for s, n in self.by_statement.most_common() if n > threshold]
+
+    def server_timing(self) -> str:
+        """The totals as a Server-Timing header value."""
+        return (
+            f"db;dur={self.duration_ms:.1f};"
+            f'desc="{self.statements} statements, {self.rows} rows"'
+        )
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def normalise(statement: str) -> str:
+    """
+    Reduces a statement to its shape, to spot the same one being repeated.
+
+    :param str statement: The SQL as sent to the database.
+    :return str: The SQL with whitespace and parameter lists collapsed.
+    """
+    return _PARAM_LIST.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def current() -> Optional[QueryStats]:
+    """The stats being recorded for the current request, if any."""
+    return _current.get()
+
+
+@contextmanager
+def recording() -> Generator[QueryStats, None, None]:
+    """
+    Records the statements run in this context, e.g. for one request.
+
+    :return: The stats, filled in as statements run.
+    :rtype: Generator[QueryStats, None, None]
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info["query_stats_start"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop("query_stats_start", None)
+    stats = _current.get()
+    if stats is None or start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    stats.record(statement, duration_ms, max(cursor.rowcount, 0))
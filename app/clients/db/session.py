@@ -25,38 +25,116 @@ if db is None:
         ...
 """
 
+import asyncio
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import wraps
-from typing import Generator
+from functools import partial, wraps
+from typing import Callable, Generator, Optional, TypeVar
 
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-from sqlalchemy import create_engine, exc
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.config import SQLALCHEMY_DATABASE_URI, STATEMENT_TIMEOUT
+from app.cache import TTLCache
+from app.clients.db.pool import InstrumentedQueuePool
+from app.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    READ_YOUR_WRITES_WINDOW,
+    SQLALCHEMY_DATABASE_URI,
+    SQLALCHEMY_READ_DATABASE_URI,
+    STATEMENT_TIMEOUT,
+)
 from app.errors import RepositoryError
 
 _LOGGER = logging.getLogger(__name__)
 
-# Engine with connection pooling to prevent connection leaks
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,  # Verify connections before use
-    pool_size=10,  # Base connection pool size
-    max_overflow=20,  # Additional connections when pool exhausted
-    pool_recycle=1800,  # Recycle connections after 30 minutes
-    pool_timeout=30,  # Wait up to 30s for a connection before error
-    pool_reset_on_return="rollback",  # Clear connection state on return to pool
-    connect_args={"options": f"-c statement_timeout={STATEMENT_TIMEOUT}"},
+T = TypeVar("T")
+
+
+def _create_engine(uri: str, name: str) -> Engine:
+    # Engine with connection pooling to prevent connection leaks
+    new_engine = create_engine(
+        uri,
+        poolclass=InstrumentedQueuePool,  # Records checkout waits and timeouts
+        pool_logging_name=name,  # Tells this pool apart in logs and metrics
+        pool_pre_ping=DB_POOL_PRE_PING,  # Verify connections before use
+        pool_size=DB_POOL_SIZE,  # Base connection pool size
+        max_overflow=DB_MAX_OVERFLOW,  # Additional connections when pool exhausted
+        pool_recycle=DB_POOL_RECYCLE,  # Recycle connections after this many seconds
+        pool_timeout=DB_POOL_TIMEOUT,  # Wait this long for a connection before error
+        pool_reset_on_return="rollback",  # Clear connection state on return to pool
+        connect_args={"options": f"-c statement_timeout={STATEMENT_TIMEOUT}"},
+    )
+
+    # OpenTelemetry instrumentation
+    SQLAlchemyInstrumentor().instrument(engine=new_engine)
+    return new_engine
+
+
+engine = _create_engine(SQLALCHEMY_DATABASE_URI, "primary")
+read_engine: Optional[Engine] = (
+    _create_engine(SQLALCHEMY_READ_DATABASE_URI, "replica")
+    if SQLALCHEMY_READ_DATABASE_URI
+    else None
 )
 
-# OpenTelemetry instrumentation
-SQLAlchemyInstrumentor().instrument(engine=engine)
 
-
-# Session factory
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    if read_engine is not None
+    else SessionLocal
+)
+
+# The user the current request is for, set by check_user_auth. Their commits
+# are remembered so their next reads go to the primary (read-your-writes).
+current_user: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_user", default=None
+)
+_recent_writers: TTLCache[str, bool] = TTLCache(READ_YOUR_WRITES_WINDOW)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _remember_writer(session: Session) -> None:
+    if (email := current_user.get()) is not None:
+        _recent_writers.set(email, True)
+
+
+# Blocking DB work is run here rather than on the event loop. There is one
+# thread per pooled connection, so a burst of requests queues for a thread
+# instead of each holding one while waiting out pool_timeout. Threads are
+# only started on first use, so none exist before uvicorn forks its workers.
+db_executor = ThreadPoolExecutor(
+    max_workers=DB_POOL_SIZE + DB_MAX_OVERFLOW, thread_name_prefix="db"
+)
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs a blocking (e.g. service layer) call on the DB thread pool.
+
+    The caller's context variables, such as the current telemetry span,
+    are carried over to the worker thread.
+
+    Usage:
+        families = await run_blocking(family_service.all, request.state.user)
+
+    :param Callable[..., T] func: the blocking function to call.
+    :return T: whatever func returns, exceptions it raises are re-raised.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        db_executor, partial(context.run, func, *args, **kwargs)
+    )
 
 
 @contextmanager
@@ -75,7 +153,35 @@ def get_db() -> Generator[Session, None, None]:
     :return: Database session generator
     :rtype: Generator[Session, None, None]
     """
-    db = SessionLocal()
+    yield from _session(SessionLocal)
+
+
+@contextmanager
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Context manager for read-only database sessions in service layer.
+
+    Uses the read replica if one is configured. A user who committed a
+    write within READ_YOUR_WRITES_WINDOW reads from the primary instead,
+    so they do not see the replica lagging behind their own changes.
+
+    Usage:
+        with get_read_db() as db:
+            # Only read here
+            ...
+
+    :return: Database session generator
+    :rtype: Generator[Session, None, None]
+    """
+    email = current_user.get()
+    if email is not None and _recent_writers.get(email):
+        yield from _session(SessionLocal)
+    else:
+        yield from _session(ReadSessionLocal)
+
+
+def _session(factory: sessionmaker) -> Generator[Session, None, None]:
+    db = factory()
     try:
         yield db
     finally:
@@ -13,7 +13,77 @@ SQLALCHEMY_DATABASE_URI = (
 # This used by db-client and alembic script for migrations
 os.environ["DATABASE_URL"] = SQLALCHEMY_DATABASE_URI
 
+# Optional read replica for heavy list reads. Without a host every read goes to
+# the primary. The user and password default to the primary's.
+ADMIN_POSTGRES_READ_HOST = os.getenv("ADMIN_POSTGRES_READ_HOST")
+ADMIN_POSTGRES_READ_USER = os.getenv("ADMIN_POSTGRES_READ_USER", ADMIN_POSTGRES_USER)
+ADMIN_POSTGRES_READ_PASSWORD = os.getenv(
+    "ADMIN_POSTGRES_READ_PASSWORD", ADMIN_POSTGRES_PASSWORD
+)
+SQLALCHEMY_READ_DATABASE_URI = (
+    f"postgresql://{ADMIN_POSTGRES_READ_USER}:{ADMIN_POSTGRES_READ_PASSWORD}"
+    f"@{ADMIN_POSTGRES_READ_HOST}:5432/{ADMIN_POSTGRES_DATABASE}"
+    if ADMIN_POSTGRES_READ_HOST
+    else None
+)
+
+# How long (seconds) after a user's own write their reads stay on the primary,
+# so they see what they wrote. This should exceed the replica's usual lag.
+READ_YOUR_WRITES_WINDOW = float(os.getenv("READ_YOUR_WRITES_WINDOW", 10))
+
 STATEMENT_TIMEOUT = os.getenv("STATEMENT_TIMEOUT", 10000)  # ms
 
+# Connection pool, per worker process. The DB thread pool is sized to match,
+# so size RDS max_connections for DB_POOL_SIZE + DB_MAX_OVERFLOW per worker.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # s
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # s
+# Pinging each connection on checkout costs a round trip but spares requests
+# from failing on a connection the server dropped. Set to "false" to rely on
+# DB_POOL_RECYCLE and disconnect handling alone.
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
 TOKEN_SECRET_KEY = os.getenv("TOKEN_SECRET_KEY")
 ENV = os.getenv("ENV", "development")
+
+# How long (seconds) an analytics summary is served from the in-process cache.
+ANALYTICS_SUMMARY_TTL = float(os.getenv("ANALYTICS_SUMMARY_TTL", 30))
+
+# How long (seconds) a serialised /config payload is served from memory. Writes
+# made through this process clear it straight away; this bounds staleness for
+# writes made elsewhere (other workers, migrations to reference tables).
+CONFIG_CACHE_TTL = float(os.getenv("CONFIG_CACHE_TTL", 300))
+
+# How long (seconds) corpus and organisation lookups are kept in the in-process
+# registry. Writes made through this process clear it straight away.
+REGISTRY_TTL = float(os.getenv("REGISTRY_TTL", 300))
+
+# How many verified tokens are kept, each until it expires, so repeat requests
+# with the same token skip JWT verification.
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 1024))
+
+# How many password hashes may be checked at once. bcrypt is deliberately slow,
+# so a burst of logins queues here rather than using up the DB thread pool.
+LOGIN_CONCURRENCY = int(os.getenv("LOGIN_CONCURRENCY", 4))
+
+# Request bodies larger than this (bytes) are truncated in audit records and
+# identified by their hash instead.
+AUDIT_MAX_PAYLOAD = int(os.getenv("AUDIT_MAX_PAYLOAD", 2048))
+
+# How many audit records may wait for the background writer. Past this records
+# are dropped (and counted) rather than slowing requests down.
+AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", 10000))
+
+# How long (seconds) shutdown waits for queued audit records to be written.
+AUDIT_SHUTDOWN_TIMEOUT = float(os.getenv("AUDIT_SHUTDOWN_TIMEOUT", 10))
+
+# A request running the same statement more than this many times is logged as a
+# likely N+1 query.
+QUERY_REPEAT_WARNING = int(os.getenv("QUERY_REPEAT_WARNING", 10))
+
+# Repositories build read DTOs from trusted DB rows without pydantic validation.
+# Set to "true" to validate them again, e.g. while debugging a schema change.
+VALIDATE_REPOSITORY_DTOS = (
+    os.getenv("VALIDATE_REPOSITORY_DTOS", "false").lower() == "true"
+)
@@ -11,12 +11,16 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 from db_client import run_migrations
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_health import health
 from fastapi_pagination import add_pagination
 from fastapi_utils.timing import add_timing_middleware
+from opentelemetry import trace
 
+import app.service.audit as audit_service
+import app.service.authorisation as auth_service
+import app.service.token as token_service
 from app import config
 from app.api.api_v1.routers import (
     analytics_router,
@@ -34,7 +38,9 @@ from app.api.api_v1.routers import (
     user_router,
 )
 from app.api.api_v1.routers.auth import check_user_auth
-from app.clients.db.session import engine
+from app.clients.db import query_stats
+from app.clients.db.pool import instrument_pool
+from app.clients.db.session import engine, read_engine
 from app.logging_config import DEFAULT_LOGGING, setup_json_logging
 from app.service.health import is_database_online
 from app.telemetry import Telemetry
@@ -62,6 +68,7 @@ async def lifespan(app_: FastAPI):
     """Run startup and shutdown events."""
     run_migrations(engine)
     yield
+    audit_service.shutdown(config.AUDIT_SHUTDOWN_TIMEOUT)
 
 
 try:
@@ -87,6 +94,11 @@ except Exception as e:
 
 telemetry = Telemetry(otel_config)
 tracer = telemetry.get_tracer()
+instrument_pool(engine, telemetry.get_meter())
+if read_engine is not None:
+    instrument_pool(read_engine, telemetry.get_meter())
+audit_service.instrument(telemetry.get_meter())
+token_service.instrument(telemetry.get_meter())
 
 
 app = FastAPI(
@@ -97,6 +109,24 @@ setup_json_logging(app)
 add_pagination(app)
 add_timing_middleware(app, record=_LOGGER.info, exclude="health")
 
+
+@app.middleware("http")
+async def record_query_stats(request: Request, call_next):
+    """Reports the SQL each request ran, and warns of repeated statements."""
+    with query_stats.recording() as stats:
+        response = await call_next(request)
+
+    response.headers.append("Server-Timing", stats.server_timing())
+    trace.get_current_span().set_attributes(stats.attributes())
+    for statement, count in stats.repeated(config.QUERY_REPEAT_WARNING):
+        _LOGGER.warning(
+            f"{request.method} {request.url.path} ran a statement {count} times, "
+            "likely an N+1 query",
+            extra={"props": {"statement": statement[:500], "count": count}},
+        )
+    return response
+
+
 app.include_router(
     config_router,
     prefix="/api/v1",
@@ -201,6 +231,10 @@ async def root():
     return {"message": "CPR Navigator Admin API v1"}
 
 
+# Must follow every include_router above
+auth_service.compile_route_access(app.routes)
+
+
 if __name__ == "__main__":
     uvicorn.run(
         app,
@@ -30,3 +30,35 @@ class ConfigReadDTO(BaseModel):
     corpus_types: Sequence[dict]
     languages: Mapping[str, str]
     document: DocumentConfig
+
+
+class CompactCorpusData(BaseModel):
+    """A corpus that refers to its corpus type (and taxonomy) by name."""
+
+    corpus_import_id: str
+    title: str
+    description: Optional[str] = None
+    corpus_type: str
+    organisation: Mapping[str, Union[int, str]]
+
+
+class CorpusTypeConfig(BaseModel):
+    """A corpus type and its taxonomy."""
+
+    name: str
+    description: str
+    taxonomy: TaxonomyData
+
+
+class CompactConfigReadDTO(BaseModel):
+    """
+    The config with each corpus type's taxonomy included only once.
+
+    Corpora name their corpus type, which is found in corpus_types.
+    """
+
+    geographies: Sequence[dict]
+    corpora: Sequence[CompactCorpusData]
+    corpus_types: Sequence[CorpusTypeConfig]
+    languages: Mapping[str, str]
+    document: DocumentConfig
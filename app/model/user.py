@@ -20,6 +20,24 @@ class OrgMembership(BaseModel):
     is_admin: bool = False
 
 
+class OrgAuthorisation(BaseModel):
+    """An organisation a user belongs to, as written into their token."""
+
+    id: int
+    name: str
+    is_admin: bool = False
+
+
+class UserLogin(BaseModel):
+    """What is needed to log a user in."""
+
+    email: str
+    hashed_password: str
+    is_superuser: bool
+    is_active: bool
+    organisations: list[OrgAuthorisation]
+
+
 class UserReadDTO(BaseModel):
     """Representation of a user returned from the API."""
 
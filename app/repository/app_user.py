@@ -1,15 +1,52 @@
-from typing import Optional, Tuple, cast
+from typing import Optional, cast
 
 from db_client.models.organisation import AppUser, Organisation, OrganisationUser
 from sqlalchemy.orm import Session
 
-from app.model.user import OrgMembership, UserReadDTO
+from app.model.user import (
+    OrgAuthorisation,
+    OrgMembership,
+    UserLogin,
+    UserReadDTO,
+)
 
-MaybeAppUser = Optional[AppUser]
 
+def get_user_login(db: Session, email: str) -> Optional[UserLogin]:
+    """Get what is needed to log a user in, in one query.
 
-def get_user_by_email(db: Session, email: str) -> MaybeAppUser:
-    return db.query(AppUser).filter(AppUser.email == email).one()
+    :param db Session: DB session to connect use.
+    :param email str: User email.
+    :return Optional[UserLogin]: The user with their organisations, or None if
+        the user does not exist.
+    """
+    rows = (
+        db.query(
+            AppUser.hashed_password,
+            AppUser.is_superuser,
+            OrganisationUser.is_active,
+            OrganisationUser.is_admin,
+            Organisation.id,
+            Organisation.name,
+        )
+        .outerjoin(OrganisationUser, OrganisationUser.appuser_email == AppUser.email)
+        .outerjoin(Organisation, Organisation.id == OrganisationUser.organisation_id)
+        .filter(AppUser.email == email)
+        .all()
+    )
+    if not rows:
+        return None
+
+    return UserLogin(
+        email=email,
+        hashed_password=rows[0].hashed_password or "",
+        is_superuser=bool(rows[0].is_superuser),
+        is_active=any(r.is_active for r in rows),
+        organisations=[
+            OrgAuthorisation(id=r.id, name=r.name, is_admin=bool(r.is_admin))
+            for r in rows
+            if r.id is not None
+        ],
+    )
 
 
 def is_superuser(db: Session, email: str) -> bool:
@@ -28,28 +65,6 @@ def is_superuser(db: Session, email: str) -> bool:
     )
 
 
-def is_active(db: Session, email: str) -> bool:
-    # NOTE: DO NOT be tempted to fix the below to "is True" - this breaks things
-    return (
-        db.query(OrganisationUser)
-        .filter(OrganisationUser.appuser_email == email)
-        .filter(OrganisationUser.is_active == True)  # noqa: E712
-        .count()
-        > 0
-    )
-
-
-def get_app_user_authorisation(
-    db: Session, app_user: AppUser
-) -> list[Tuple[OrganisationUser, Organisation]]:
-    query = (
-        db.query(OrganisationUser, Organisation)
-        .filter(OrganisationUser.appuser_email == app_user.email)
-        .join(Organisation, Organisation.id == OrganisationUser.organisation_id)
-    )
-    return [(r[0], r[1]) for r in query.all()]
-
-
 def get_user(db: Session, email: str) -> Optional[UserReadDTO]:
     """Get a user and their organisation memberships by email."""
     user = db.query(AppUser).filter(AppUser.email == email).one_or_none()
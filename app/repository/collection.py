@@ -3,22 +3,22 @@
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import Mapping, Optional, Tuple, Union, cast
 
+import sqlalchemy
 from db_client.models.dfce import Collection
 from db_client.models.dfce.collection import CollectionFamily, CollectionOrganisation
-from db_client.models.dfce.family import (
-    Family,
-    Slug,
-)
+from db_client.models.dfce.family import Family, Slug
 from db_client.models.organisation.counters import CountedEntity
 from db_client.models.organisation.users import Organisation
 from sqlalchemy import Column, and_
 from sqlalchemy import delete as db_delete
-from sqlalchemy import desc, or_
+from sqlalchemy import desc, func, or_, select
 from sqlalchemy import update as db_update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.exc import NoResultFound, OperationalError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 from sqlalchemy_utils import escape_like
 
 from app.errors import RepositoryError
@@ -29,15 +29,20 @@ from app.model.collection import (
 )
 from app.model.general import Json
 from app.repository.helpers import (
+    IMPORT_ID,
+    IMPORT_IDS,
+    ORG_IDS,
+    PREPARED_STATEMENTS,
+    bound,
+    build_dto,
     generate_import_id,
     generate_slug,
+    select_aggregates,
 )
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
-CollectionOrg = Tuple[Collection, Organisation, Slug]
-
 
 def get_org_from_collection_id(db: Session, collection_import_id: str) -> Optional[int]:
     return (
@@ -47,6 +52,26 @@ def get_org_from_collection_id(db: Session, collection_import_id: str) -> Option
     )
 
 
+def collection_orgs(db: Session, import_ids: set[str]) -> dict[str, int]:
+    """
+    Gets the owning organisation of each of the given collections.
+
+    :param Session db: The DB session to connect to.
+    :param set[str] import_ids: The collection import IDs to look up.
+    :return dict[str, int]: The organisation id of each collection found,
+        keyed by import id. Collections that do not exist are left out.
+    """
+    if not import_ids:
+        return {}
+    rows = db.execute(
+        select(
+            CollectionOrganisation.collection_import_id,
+            CollectionOrganisation.organisation_id,
+        ).where(CollectionOrganisation.collection_import_id.in_(import_ids))
+    )
+    return {str(c): int(o) for c, o in rows}
+
+
 def _collection_org_from_dto(
     dto: CollectionCreateDTO, org_id: int
 ) -> Tuple[Collection, CollectionOrganisation]:
@@ -61,41 +86,96 @@ def _collection_org_from_dto(
     )
 
 
-def _get_query(db: Session) -> Query:
-    # NOTE: SqlAlchemy will make a complete hash of the query generation
-    #       if columns are used in the query() call. Therefore, entire
-    #       objects are returned.
+def _get_query() -> sqlalchemy.sql.Select:
+    """
+    Build a projection-only SELECT for collections.
+
+    Family import_ids and the current slug are aggregated in SQL so each
+    collection maps to a single row, without any per-collection queries.
+    """
+    families_subq = (
+        select(
+            CollectionFamily.collection_import_id.label("col_id"),
+            func.array_agg(CollectionFamily.family_import_id).label("families"),
+        )
+        .group_by(CollectionFamily.collection_import_id)
+        .subquery()
+    )
+
+    # Most recent slug per collection (ordered by created desc, take first)
+    slugs_subq = (
+        select(
+            Slug.collection_import_id.label("col_id"),
+            func.array_agg(aggregate_order_by(Slug.name, Slug.created.desc())).label(
+                "slugs"
+            ),
+        )
+        .where(Slug.collection_import_id.isnot(None))
+        .group_by(Slug.collection_import_id)
+        .subquery()
+    )
+
     return (
-        db.query(Collection, Organisation, Slug)
+        select(
+            Collection.import_id.label("import_id"),
+            Collection.title.label("title"),
+            Collection.description.label("description"),
+            Collection.valid_metadata.label("metadata"),
+            Collection.created.label("created"),
+            Collection.last_modified.label("last_modified"),
+            Organisation.name.label("organisation"),
+            families_subq.c.families,
+            slugs_subq.c.slugs,
+        )
         .join(
             CollectionOrganisation,
             CollectionOrganisation.collection_import_id == Collection.import_id,
         )
         .join(Organisation, Organisation.id == CollectionOrganisation.organisation_id)
-        .outerjoin(Slug, Slug.collection_import_id == Collection.import_id)
+        .outerjoin(families_subq, families_subq.c.col_id == Collection.import_id)
+        .outerjoin(slugs_subq, slugs_subq.c.col_id == Collection.import_id)
     )
 
 
-def _collection_to_dto(db: Session, co: CollectionOrg) -> CollectionReadDTO:
-    collection, org, slug = co
-    db_families = (
-        db.query(Family.import_id)
-        .join(CollectionFamily, CollectionFamily.family_import_id == Family.import_id)
-        .filter(CollectionFamily.collection_import_id == collection.import_id)
-        .all()
-    )
-    families = [cast(str, f[0]) for f in db_families]
-
-    return CollectionReadDTO(
-        import_id=str(collection.import_id),
-        title=str(collection.title),
-        description=str(collection.description),
-        metadata=cast(Json, collection.valid_metadata),
-        organisation=cast(str, org.name),
-        families=families,
-        created=cast(datetime, collection.created),
-        last_modified=cast(datetime, collection.last_modified),
-        slug=cast(str, slug.name) if slug else None,
+@lru_cache(maxsize=PREPARED_STATEMENTS)
+def _prepared(by: str, by_org: bool) -> sqlalchemy.sql.Select:
+    """
+    The read statement for one shape of query, built once and then reused.
+
+    :param str by: "all" for every collection newest first, "import_id"
+        for one collection or "import_ids" for several.
+    :param bool by_org: whether to restrict to the ORG_IDS parameter.
+    :return Select: the statement, with its values left to be bound.
+    """
+    stmt = _get_query()
+    if by == "import_id":
+        stmt = stmt.where(Collection.import_id == IMPORT_ID)
+    elif by == "import_ids":
+        stmt = stmt.where(Collection.import_id.in_(IMPORT_IDS))
+    else:
+        stmt = stmt.order_by(desc(Collection.last_modified))
+    if by_org:
+        stmt = stmt.where(CollectionOrganisation.organisation_id.in_(ORG_IDS))
+    return stmt
+
+
+def _row_to_dto(row: Mapping) -> CollectionReadDTO:
+    """
+    Map a projected row (dict-like) into CollectionReadDTO without touching
+    ORM objects.
+    """
+    slugs = row["slugs"] or []
+    return build_dto(
+        CollectionReadDTO,
+        import_id=str(row["import_id"]),
+        title=str(row["title"]),
+        description=str(row["description"]),
+        metadata=cast(Json, row["metadata"]),
+        organisation=str(row["organisation"]),
+        families=[str(f) for f in (row["families"] or [])],
+        created=cast(datetime, row["created"]),
+        last_modified=cast(datetime, row["last_modified"]),
+        slug=str(slugs[0]) if slugs else None,
     )
 
 
@@ -121,17 +201,9 @@ def all(db: Session, org_ids: Optional[list[int]]) -> list[CollectionReadDTO]:
     :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
     :return Optional[CollectionResponse]: All of things
     """
-    query = _get_query(db)
-    if org_ids is not None:
-        query = query.filter(Organisation.id.in_(org_ids))
-    collections = query.order_by(desc(Collection.last_modified)).all()
-
-    if not collections:
-        return []
-
-    result = [_collection_to_dto(db, c) for c in collections]
-
-    return result
+    stmt = _prepared("all", org_ids is not None)
+    rows = db.execute(stmt, bound(org_ids=org_ids)).mappings().fetchall()
+    return [_row_to_dto(r) for r in rows]
 
 
 def get(db: Session, import_id: str) -> Optional[CollectionReadDTO]:
@@ -143,12 +215,31 @@ def get(db: Session, import_id: str) -> Optional[CollectionReadDTO]:
     :return Optional[CollectionResponse]: A single collection or nothing
     """
     try:
-        collection_org = _get_query(db).filter(Collection.import_id == import_id).one()
+        stmt = _prepared("import_id", False)
+        row = db.execute(stmt, bound(import_id=import_id)).mappings().one()
     except NoResultFound as e:
         _LOGGER.debug(e)
         return
 
-    return _collection_to_dto(db, collection_org)
+    return _row_to_dto(row)
+
+
+def get_many(
+    db: Session, import_ids: list[str], org_ids: Optional[list[int]]
+) -> list[CollectionReadDTO]:
+    """
+    Gets several collections with a single projection query.
+
+    :param db Session: the database connection
+    :param list[str] import_ids: The import_ids of the collections
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :return list[CollectionReadDTO]: The collections found, in the
+        requested order
+    """
+    stmt = _prepared("import_ids", org_ids is not None)
+    params = bound(import_ids=import_ids, org_ids=org_ids)
+    found = {r["import_id"]: r for r in db.execute(stmt, params).mappings()}
+    return [_row_to_dto(found[i]) for i in import_ids if i in found]
 
 
 def search(
@@ -175,13 +266,17 @@ def search(
 
     condition = and_(*search) if len(search) > 1 else search[0]
     try:
-        query = _get_query(db).filter(condition)
+        stmt = _get_query().where(condition)
         if org_ids is not None:
-            query = query.filter(Organisation.id.in_(org_ids))
-        found = (
-            query.order_by(desc(Collection.last_modified))
-            .limit(search_params["max_results"])
-            .all()
+            stmt = stmt.where(CollectionOrganisation.organisation_id.in_(org_ids))
+        rows = (
+            db.execute(
+                stmt.order_by(desc(Collection.last_modified)).limit(
+                    search_params["max_results"]
+                )
+            )
+            .mappings()
+            .fetchall()
         )
 
     except OperationalError as e:
@@ -189,7 +284,7 @@ def search(
             raise TimeoutError
         raise RepositoryError(e)
 
-    return [_collection_to_dto(db, f) for f in found]
+    return [_row_to_dto(r) for r in rows]
 
 
 def update(db: Session, import_id: str, collection: CollectionWriteDTO) -> bool:
@@ -329,12 +424,69 @@ def count(db: Session, org_ids: Optional[list[int]]) -> Optional[int]:
     :return Optional[int]: The number of collections in the repository or none.
     """
     try:
-        query = _get_query(db)
+        stmt = select(func.count(CollectionOrganisation.collection_import_id))
         if org_ids is not None:
-            query = query.filter(Organisation.id.in_(org_ids))
-        n_collections = query.count()
+            stmt = stmt.where(CollectionOrganisation.organisation_id.in_(org_ids))
+        n_collections = db.execute(stmt).scalar()
     except Exception as e:
         _LOGGER.error(e)
         return
 
-    return n_collections
+    return n_collections if n_collections is not None else 0
+
+
+def _version_query(collection_ids: sqlalchemy.sql.Select) -> sqlalchemy.sql.Select:
+    """
+    Builds the fingerprint query for the collections selected.
+
+    The families listed on a collection change through family writes, so
+    the membership count and the latest member last_modified are included.
+
+    :param Select collection_ids: a statement selecting collection import ids
+    :return Select: a single row statement
+    """
+    collections = select(
+        func.count(Collection.import_id).label("n_collections"),
+        func.max(Collection.last_modified).label("collections_modified"),
+    ).where(Collection.import_id.in_(collection_ids))
+    members = (
+        select(
+            func.count(CollectionFamily.family_import_id).label("n_members"),
+            func.max(Family.last_modified).label("members_modified"),
+        )
+        .join(Family, Family.import_id == CollectionFamily.family_import_id)
+        .where(CollectionFamily.collection_import_id.in_(collection_ids))
+    )
+    return select_aggregates(collections, members)
+
+
+def version(db: Session, org_ids: Optional[list[int]]) -> tuple:
+    """
+    Gets a cheap fingerprint of the collections visible to the given orgs.
+
+    :param db Session: the database connection
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :return tuple: a value that changes whenever any of the collections do
+    """
+    collection_ids = select(CollectionOrganisation.collection_import_id)
+    if org_ids is not None:
+        collection_ids = collection_ids.where(
+            CollectionOrganisation.organisation_id.in_(org_ids)
+        )
+    return tuple(db.execute(_version_query(collection_ids)).one())
+
+
+def entity_version(db: Session, import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single collection.
+
+    :param db Session: the database connection
+    :param str import_id: The import_id of the collection
+    :return Optional[tuple]: a value that changes whenever the collection
+        does, or None if the collection does not exist
+    """
+    collection_ids = select(Collection.import_id).where(
+        Collection.import_id == import_id
+    )
+    row = tuple(db.execute(_version_query(collection_ids)).one())
+    return row if row[0] else None
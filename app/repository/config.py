@@ -1,12 +1,10 @@
 import logging
-from typing import Any, Sequence
+from typing import Sequence
 
-from db_client.models.base import AnyModel
 from db_client.models.dfce.family import Variant
-from db_client.models.dfce.geography import Geography
 from db_client.models.document.physical_document import Language
 from db_client.models.organisation import Corpus, CorpusType, Organisation
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 from app.model.config import ConfigReadDTO, CorpusData, DocumentConfig
 from app.model.user import UserContext
@@ -14,32 +12,6 @@ from app.model.user import UserContext
 _LOGGER = logging.getLogger(__name__)
 
 
-def _tree_table_to_json(
-    query: "Query[AnyModel]",
-    db: Session,
-) -> list[dict]:
-    json_out = []
-    child_list_map: dict[int, Any] = {}
-
-    for row in query.all():
-        row_object = {col.name: getattr(row, col.name) for col in row.__table__.columns}
-        row_children: list[dict[str, Any]] = []
-        child_list_map[row_object["id"]] = row_children
-
-        # No parent indicates a top level element
-        node_row_object = {"node": row_object, "children": row_children}
-        node_id = row_object["parent_id"]
-        if node_id is None:
-            json_out.append(node_row_object)
-        else:
-            append_list = child_list_map.get(node_id)
-            if append_list is None:
-                raise RuntimeError(f"Could not locate parent node with id {node_id}")
-            append_list.append(node_row_object)
-
-    return json_out
-
-
 def _to_corpus_data(row) -> CorpusData:
     """Convert database row to CorpusData model.
 
@@ -108,19 +80,16 @@ def get_corpora(db: Session, user: UserContext) -> Sequence[CorpusData]:
     return corpus_data_list
 
 
-def get(db: Session, user: UserContext) -> ConfigReadDTO:
+def get(db: Session, user: UserContext, geographies: Sequence[dict]) -> ConfigReadDTO:
     """
     Returns the configuration for the admin service.
 
     :param Session db: connection to the database
+    :param UserContext user: User context for filtering
+    :param Sequence[dict] geographies: the geography hierarchy, which is
+        compiled and cached by the geography service.
     :return ConfigReadDTO: The config data
     """
-    geographies = _tree_table_to_json(
-        query=db.query(Geography)
-        .filter(Geography.type != "ISO-3166-2")
-        .order_by(Geography.id),
-        db=db,
-    )
     corpora = get_corpora(db, user)
     languages = {lang.language_code: lang.name for lang in db.query(Language).all()}
 
@@ -4,7 +4,7 @@ from typing import Optional, Union, cast
 
 from db_client.models.organisation import Corpus, CorpusType, Organisation
 from db_client.models.organisation.counters import CountedEntity
-from sqlalchemy import and_, asc, or_
+from sqlalchemy import and_, asc, exists, or_
 from sqlalchemy import update as db_update
 from sqlalchemy.exc import NoResultFound, OperationalError
 from sqlalchemy.orm import Query, Session
@@ -93,8 +93,23 @@ def verify_corpus_exists(db: Session, corpus_id: str) -> bool:
     :param str corpus_id: The corpus import ID we want to validate.
     :return bool: Return whether or not the corpus exists in the DB.
     """
-    corpora = [corpus[0] for corpus in db.query(Corpus.import_id).distinct().all()]
-    return bool(corpus_id in corpora)
+    return bool(db.query(exists().where(Corpus.import_id == corpus_id)).scalar())
+
+
+def get_corpus_org_ids(db: Session, corpus_ids: list[str]) -> dict[str, int]:
+    """Get the organisation IDs of several corpora in one query.
+
+    :param Session db: The DB session to connect to.
+    :param list[str] corpus_ids: The corpus import IDs to look up.
+    :return dict[str, int]: The organisation ID of each corpus found,
+        keyed by corpus import ID. Missing corpora are left out.
+    """
+    rows = (
+        db.query(Corpus.import_id, Corpus.organisation_id)
+        .filter(Corpus.import_id.in_(corpus_ids))
+        .all()
+    )
+    return {str(import_id): int(org_id) for import_id, org_id in rows}
 
 
 def all(db: Session, org_ids: Optional[list[int]]) -> list[CorpusReadDTO]:
@@ -1,14 +1,21 @@
+"""Operations on the repository for the Document entity.
+
+Read paths use projection only SELECTs with SQL side aggregation of slugs
+and languages, mapping rows directly to DTOs rather than materialising
+ORM entities.
+"""
+
 import logging
 import os
-from collections import defaultdict
 from datetime import datetime
-from typing import Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import Mapping, Optional, Tuple, Union, cast
 
+import sqlalchemy
 from db_client.models.dfce import FamilyDocument
 from db_client.models.dfce.family import (
     Corpus,
     DocumentStatus,
-    Family,
     FamilyCorpus,
     Slug,
 )
@@ -18,54 +25,138 @@ from db_client.models.document.physical_document import (
     PhysicalDocument,
     PhysicalDocumentLanguage,
 )
-from db_client.models.organisation import Organisation
-from db_client.models.organisation.corpus import CorpusType
 from db_client.models.organisation.counters import CountedEntity
 from pydantic import AnyHttpUrl
 from sqlalchemy import Column, and_
 from sqlalchemy import delete as db_delete
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from sqlalchemy import insert as db_insert
+from sqlalchemy import select
 from sqlalchemy import update as db_update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.exc import MultipleResultsFound, NoResultFound, OperationalError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 from sqlalchemy_utils import escape_like
 
 from app.errors import RepositoryError, ValidationError
 from app.model.document import DocumentCreateDTO, DocumentReadDTO, DocumentWriteDTO
 from app.repository import family as family_repo
-from app.repository.helpers import generate_import_id, generate_slug
+from app.repository.helpers import (
+    IMPORT_ID,
+    IMPORT_IDS,
+    ORG_IDS,
+    PREPARED_STATEMENTS,
+    bound,
+    build_dto,
+    family_ids_in_orgs,
+    freeze_fields,
+    generate_import_id,
+    generate_slug,
+)
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
 CreateObjects = Tuple[PhysicalDocumentLanguage, FamilyDocument, PhysicalDocument]
-ReadObj = Tuple[FamilyDocument, PhysicalDocument, CorpusType, Organisation]
 
 
-def _get_query(db: Session) -> Query:
-    # NOTE: SqlAlchemy will make a complete hash of the query generation
-    #       if columns are used in the query() call. Therefore, entire
-    #       objects are returned.
-    return (
-        db.query(
-            FamilyDocument,
-            PhysicalDocument,
-            CorpusType,
-            Organisation,
+_LANGUAGE_FIELDS = (
+    "user_language_name",
+    "calc_language_name",
+    "user_language_names",
+    "calc_language_names",
+)
+
+
+def _get_query(fields: Optional[set[str]] = None) -> sqlalchemy.sql.Select:
+    """
+    Build a projection-only SELECT for documents.
+
+    Only the columns needed for a DocumentReadDTO are selected, the most
+    recent slug and the user/model language names are aggregated in SQL,
+    so no ORM entities (or per-row lazy loads) are involved.
+
+    :param Optional[set[str]] fields: a sparse fieldset of DocumentReadDTO
+        fields; the slug and language aggregates are only joined when one
+        of their fields is requested. None selects everything.
+    """
+    # Most recent slug per document (ordered by created desc, take first)
+    slugs_subq = (
+        select(
+            Slug.family_document_import_id.label("doc_id"),
+            func.array_agg(aggregate_order_by(Slug.name, Slug.created.desc())).label(
+                "slugs"
+            ),
+        )
+        .where(Slug.family_document_import_id.isnot(None))
+        .group_by(Slug.family_document_import_id)
+        .subquery()
+    )
+
+    # Language names per physical document, split by source
+    language_order = aggregate_order_by(
+        Language.name,
+        PhysicalDocumentLanguage.visible.desc(),
+        Language.name.asc(),
+    )
+    languages_subq = (
+        select(
+            PhysicalDocumentLanguage.document_id.label("physical_id"),
+            func.array_agg(language_order)
+            .filter(PhysicalDocumentLanguage.source == LanguageSource.USER)
+            .label("user_language_names"),
+            func.array_agg(language_order)
+            .filter(PhysicalDocumentLanguage.source == LanguageSource.MODEL)
+            .label("calc_language_names"),
+        )
+        .join(Language, Language.id == PhysicalDocumentLanguage.language_id)
+        .group_by(PhysicalDocumentLanguage.document_id)
+        .subquery()
+    )
+
+    stmt = (
+        select(
+            FamilyDocument.import_id.label("import_id"),
+            FamilyDocument.family_import_id.label("family_import_id"),
+            FamilyDocument.variant_name.label("variant_name"),
+            FamilyDocument.document_status.label("status"),
+            FamilyDocument.created.label("created"),
+            FamilyDocument.last_modified.label("last_modified"),
+            FamilyDocument.valid_metadata.label("metadata"),
+            PhysicalDocument.id.label("physical_id"),
+            PhysicalDocument.title.label("title"),
+            PhysicalDocument.md5_sum.label("md5_sum"),
+            PhysicalDocument.cdn_object.label("cdn_object"),
+            PhysicalDocument.source_url.label("source_url"),
+            PhysicalDocument.content_type.label("content_type"),
+            Corpus.corpus_type_name.label("corpus_type"),
+            Corpus.organisation_id.label("org_id"),
         )
-        .filter(FamilyDocument.family_import_id == Family.import_id)
-        .join(Family, FamilyDocument.family_import_id == Family.import_id)
+        .select_from(FamilyDocument)
         .join(
             PhysicalDocument,
             FamilyDocument.physical_document_id == PhysicalDocument.id,
             isouter=True,
         )
-        .join(FamilyCorpus, FamilyCorpus.family_import_id == Family.import_id)
+        .join(
+            FamilyCorpus,
+            FamilyCorpus.family_import_id == FamilyDocument.family_import_id,
+        )
         .join(Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id)
-        .join(CorpusType, Corpus.corpus_type_name == CorpusType.name)
-        .join(Organisation, Corpus.organisation_id == Organisation.id)
     )
+    if fields is None or "slug" in fields:
+        stmt = stmt.add_columns(slugs_subq.c.slugs).outerjoin(
+            slugs_subq, slugs_subq.c.doc_id == FamilyDocument.import_id
+        )
+    if fields is None or not fields.isdisjoint(_LANGUAGE_FIELDS):
+        stmt = stmt.add_columns(
+            languages_subq.c.user_language_names,
+            languages_subq.c.calc_language_names,
+        ).outerjoin(
+            languages_subq,
+            languages_subq.c.physical_id == FamilyDocument.physical_document_id,
+        )
+    return stmt
 
 
 def _dto_to_family_document_dict(dto: DocumentCreateDTO) -> dict:
@@ -99,30 +190,63 @@ def _document_tuple_from_create_dto(
     return language, fam_doc, phys_doc
 
 
-def _doc_to_dto(
-    doc_query_return: ReadObj,
-    user_language_names: list[str],
-    calc_language_names: list[str],
-) -> DocumentReadDTO:
-    fdoc, pdoc, corpus_type, _ = doc_query_return
-    return DocumentReadDTO(
-        import_id=str(fdoc.import_id),
-        family_import_id=str(fdoc.family_import_id),
-        corpus_type=str(corpus_type.name),
-        variant_name=str(fdoc.variant_name) if fdoc.variant_name is not None else None,
-        status=cast(DocumentStatus, fdoc.document_status),
-        created=cast(datetime, fdoc.created),
-        last_modified=cast(datetime, fdoc.last_modified),
-        slug=str(fdoc.slugs[0].name if len(fdoc.slugs) > 0 else ""),
-        metadata=cast(dict, fdoc.valid_metadata),
-        physical_id=cast(int, pdoc.id),
-        title=str(pdoc.title),
-        md5_sum=str(pdoc.md5_sum) if pdoc.md5_sum is not None else None,
-        cdn_object=str(pdoc.cdn_object) if pdoc.cdn_object is not None else None,
+@lru_cache(maxsize=PREPARED_STATEMENTS)
+def _prepared(
+    fields: Optional[frozenset[str]], by: str, by_org: bool
+) -> sqlalchemy.sql.Select:
+    """
+    The read statement for one shape of query, built once and then reused.
+
+    :param Optional[frozenset[str]] fields: the sparse fieldset, see
+        `_get_query`.
+    :param str by: "all" for every document newest first, "import_id" for
+        one document or "import_ids" for several.
+    :param bool by_org: whether to restrict to the ORG_IDS parameter.
+    :return Select: the statement, with its values left to be bound.
+    """
+    stmt = _get_query(set(fields) if fields is not None else None)
+    if by == "import_id":
+        stmt = stmt.where(FamilyDocument.import_id == IMPORT_ID)
+    elif by == "import_ids":
+        stmt = stmt.where(FamilyDocument.import_id.in_(IMPORT_IDS))
+    else:
+        stmt = stmt.order_by(desc(FamilyDocument.last_modified))
+    if by_org:
+        stmt = stmt.where(Corpus.organisation_id.in_(ORG_IDS))
+    return stmt
+
+
+def _row_to_dto(row: Mapping) -> DocumentReadDTO:
+    """
+    Map a projected row (dict-like) into DocumentReadDTO without touching
+    ORM objects. Columns left out of a sparse query are given empty values.
+    """
+    slugs = row.get("slugs") or []
+    user_language_names = [str(n) for n in (row.get("user_language_names") or [])]
+    calc_language_names = [str(n) for n in (row.get("calc_language_names") or [])]
+    return build_dto(
+        DocumentReadDTO,
+        import_id=str(row["import_id"]),
+        family_import_id=str(row["family_import_id"]),
+        corpus_type=str(row["corpus_type"]),
+        variant_name=(
+            str(row["variant_name"]) if row["variant_name"] is not None else None
+        ),
+        status=DocumentStatus(row["status"]),
+        created=cast(datetime, row["created"]),
+        last_modified=cast(datetime, row["last_modified"]),
+        slug=str(slugs[0]) if slugs else "",
+        metadata=cast(dict, row["metadata"]),
+        physical_id=cast(int, row["physical_id"]),
+        title=str(row["title"]),
+        md5_sum=str(row["md5_sum"]) if row["md5_sum"] is not None else None,
+        cdn_object=str(row["cdn_object"]) if row["cdn_object"] is not None else None,
         source_url=(
-            cast(AnyHttpUrl, pdoc.source_url) if pdoc.source_url is not None else None
+            AnyHttpUrl(row["source_url"]) if row["source_url"] is not None else None
+        ),
+        content_type=(
+            str(row["content_type"]) if row["content_type"] is not None else None
         ),
-        content_type=str(pdoc.content_type) if pdoc.content_type is not None else None,
         user_language_name=user_language_names[0] if user_language_names else None,
         calc_language_name=calc_language_names[0] if calc_language_names else None,
         user_language_names=user_language_names,
@@ -130,85 +254,38 @@ def _doc_to_dto(
     )
 
 
-def _get_language_names_by_document_id(
-    db: Session, physical_document_ids: list[int]
-) -> dict[int, dict[LanguageSource, list[str]]]:
-    if not physical_document_ids:
-        return {}
-
-    rows = (
-        db.query(
-            PhysicalDocumentLanguage.document_id,
-            PhysicalDocumentLanguage.source,
-            Language.name,
-        )
-        .join(Language, Language.id == PhysicalDocumentLanguage.language_id)
-        .filter(PhysicalDocumentLanguage.document_id.in_(physical_document_ids))
-        .order_by(
-            PhysicalDocumentLanguage.document_id.asc(),
-            PhysicalDocumentLanguage.source.asc(),
-            PhysicalDocumentLanguage.visible.desc(),
-            Language.name.asc(),
-        )
-        .all()
-    )
-    language_map: dict[int, dict[LanguageSource, list[str]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-    for document_id, source, language_name in rows:
-        if language_name is None:
-            continue
-        if language_name not in language_map[document_id][source]:
-            language_map[document_id][source].append(str(language_name))
-    return language_map
-
-
-def _rows_to_dtos(db: Session, rows: list[ReadObj]) -> list[DocumentReadDTO]:
-    if not rows:
-        return []
-
-    physical_document_ids = [cast(int, row[1].id) for row in rows]
-    language_map = _get_language_names_by_document_id(db, physical_document_ids)
-    return [
-        _doc_to_dto(
-            row,
-            language_map.get(cast(int, row[1].id), {}).get(LanguageSource.USER, []),
-            language_map.get(cast(int, row[1].id), {}).get(LanguageSource.MODEL, []),
-        )
-        for row in rows
-    ]
-
-
-def all(db: Session, org_ids: Optional[list[int]]) -> list[DocumentReadDTO]:
+def all(
+    db: Session, org_ids: Optional[list[int]], fields: Optional[set[str]] = None
+) -> list[DocumentReadDTO]:
     """
     Returns all the documents.
 
     :param db Session: the database connection
     :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
     :return Optional[DocumentResponse]: All of things
     """
-    query = _get_query(db)
-    if org_ids is not None:
-        query = query.filter(Organisation.id.in_(org_ids))
-
-    result = query.order_by(desc(FamilyDocument.last_modified)).all()
-
-    if not result:
-        return []
+    stmt = _prepared(freeze_fields(fields), "all", org_ids is not None)
+    rows = db.execute(stmt, bound(org_ids=org_ids)).mappings().fetchall()
+    return [_row_to_dto(r) for r in rows]
 
-    return _rows_to_dtos(db, result)
 
-
-def get(db: Session, import_id: str) -> Optional[DocumentReadDTO]:
+def get(
+    db: Session, import_id: str, fields: Optional[set[str]] = None
+) -> Optional[DocumentReadDTO]:
     """
     Gets a single document from the repository.
 
     :param db Session: the database connection
     :param str import_id: The import_id of the document
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
     :return Optional[DocumentResponse]: A single document or nothing
     """
     try:
-        row = _get_query(db).filter(FamilyDocument.import_id == import_id).one()
+        stmt = _prepared(freeze_fields(fields), "import_id", False)
+        row = db.execute(stmt, bound(import_id=import_id)).mappings().one()
     except MultipleResultsFound as e:
         msg = f"Multiple documents found for import_id {import_id}: {e}"
         _LOGGER.error(msg)
@@ -216,11 +293,36 @@ def get(db: Session, import_id: str) -> Optional[DocumentReadDTO]:
     except NoResultFound:
         _LOGGER.error(f"No document found for import_id {import_id}")
         return
-    return _rows_to_dtos(db, [row])[0]
+    return _row_to_dto(row)
+
+
+def get_many(
+    db: Session,
+    import_ids: list[str],
+    org_ids: Optional[list[int]],
+    fields: Optional[set[str]] = None,
+) -> list[DocumentReadDTO]:
+    """
+    Gets several documents with a single projection query.
+
+    :param db Session: the database connection
+    :param list[str] import_ids: The import_ids of the documents
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
+    :return list[DocumentReadDTO]: The documents found, in the requested order
+    """
+    stmt = _prepared(freeze_fields(fields), "import_ids", org_ids is not None)
+    params = bound(import_ids=import_ids, org_ids=org_ids)
+    found = {r["import_id"]: r for r in db.execute(stmt, params).mappings()}
+    return [_row_to_dto(found[i]) for i in import_ids if i in found]
 
 
 def search(
-    db: Session, search_params: dict[str, Union[str, int]], org_ids: Optional[list[int]]
+    db: Session,
+    search_params: dict[str, Union[str, int]],
+    org_ids: Optional[list[int]],
+    fields: Optional[set[str]] = None,
 ) -> list[DocumentReadDTO]:
     """
     Gets a list of documents from the repository searching the title.
@@ -229,6 +331,8 @@ def search(
     :param dict search_params: Any search terms to filter on specified
         fields (title by default if 'q' specified).
     :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
     :raises HTTPException: If a DB error occurs a 503 is returned.
     :raises HTTPException: If the search request times out a 408 is
         returned.
@@ -241,20 +345,24 @@ def search(
 
     condition = and_(*search) if len(search) > 1 else search[0]
     try:
-        query = _get_query(db).filter(condition)
+        stmt = _get_query(fields).where(condition)
         if org_ids is not None:
-            query = query.filter(Organisation.id.in_(org_ids))
-        result = (
-            query.order_by(desc(FamilyDocument.last_modified))
-            .limit(search_params["max_results"])
-            .all()
+            stmt = stmt.where(Corpus.organisation_id.in_(org_ids))
+        rows = (
+            db.execute(
+                stmt.order_by(desc(FamilyDocument.last_modified)).limit(
+                    search_params["max_results"]
+                )
+            )
+            .mappings()
+            .fetchall()
         )
     except OperationalError as e:
         if "canceling statement due to statement timeout" in str(e):
             raise TimeoutError
         raise RepositoryError(e)
 
-    return _rows_to_dtos(db, result)
+    return [_row_to_dto(r) for r in rows]
 
 
 def update(
@@ -514,20 +622,70 @@ def count(db: Session, org_ids: Optional[list[int]]) -> Optional[int]:
     :return Optional[int]: The number of documents in the repository or none.
     """
     try:
-        query = _get_query(db)
+        stmt = select(func.count(FamilyDocument.import_id))
         if org_ids is not None:
-            query = query.filter(Organisation.id.in_(org_ids))
-        n_documents = query.count()
+            stmt = (
+                stmt.join(
+                    FamilyCorpus,
+                    FamilyCorpus.family_import_id == FamilyDocument.family_import_id,
+                )
+                .join(Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id)
+                .where(Corpus.organisation_id.in_(org_ids))
+            )
+        n_documents = db.execute(stmt).scalar()
     except NoResultFound as e:
         _LOGGER.debug(e)
         return
 
-    return n_documents
+    return n_documents if n_documents is not None else 0
+
+
+def version(db: Session, org_ids: Optional[list[int]]) -> tuple:
+    """
+    Gets a cheap fingerprint of the documents visible to the given orgs.
+
+    Every document write updates its family_document row, so the row
+    count and latest last_modified are enough to detect changes.
+
+    :param db Session: the database connection
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :return tuple: a value that changes whenever any of the documents do
+    """
+    stmt = select(
+        func.count(FamilyDocument.import_id), func.max(FamilyDocument.last_modified)
+    )
+    if org_ids is not None:
+        stmt = stmt.where(
+            FamilyDocument.family_import_id.in_(family_ids_in_orgs(org_ids))
+        )
+    return tuple(db.execute(stmt).one())
+
+
+def entity_version(db: Session, import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single document.
+
+    :param db Session: the database connection
+    :param str import_id: The import_id of the document
+    :return Optional[tuple]: a value that changes whenever the document
+        does, or None if the document does not exist
+    """
+    last_modified = db.execute(
+        select(FamilyDocument.last_modified).where(
+            FamilyDocument.import_id == import_id
+        )
+    ).scalar_one_or_none()
+    return (last_modified,) if last_modified is not None else None
 
 
 def get_org_from_import_id(db: Session, import_id: str) -> Optional[int]:
-    result = _get_query(db).filter(FamilyDocument.import_id == import_id).one_or_none()
-    if result is None:
-        return None
-    _, _, _, org = result
-    return org.id
+    return (
+        db.query(Corpus.organisation_id)
+        .join(FamilyCorpus, FamilyCorpus.corpus_import_id == Corpus.import_id)
+        .join(
+            FamilyDocument,
+            FamilyDocument.family_import_id == FamilyCorpus.family_import_id,
+        )
+        .filter(FamilyDocument.import_id == import_id)
+        .scalar()
+    )
@@ -1,71 +1,121 @@
-"""Operations on the repository for the Family entity."""
+"""Operations on the repository for the Event entity."""
 
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import Mapping, Optional, Union, cast
 
-from db_client.models.dfce import EventStatus, Family, FamilyDocument, FamilyEvent
+import sqlalchemy
+from db_client.models.dfce import EventStatus, FamilyEvent
 from db_client.models.dfce.family import FamilyCorpus
-from db_client.models.organisation import Organisation
 from db_client.models.organisation.corpus import Corpus
 from db_client.models.organisation.counters import CountedEntity
 from sqlalchemy import Column, and_
 from sqlalchemy import delete as db_delete
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 from sqlalchemy import update as db_update
 from sqlalchemy.exc import NoResultFound, OperationalError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 from sqlalchemy_utils import escape_like
 
 from app.errors import RepositoryError, ValidationError
 from app.model.event import EventCreateDTO, EventReadDTO, EventWriteDTO
 from app.repository import family as family_repo
-from app.repository.helpers import generate_import_id
+from app.repository.helpers import (
+    IMPORT_ID,
+    IMPORT_IDS,
+    ORG_IDS,
+    PREPARED_STATEMENTS,
+    bound,
+    build_dto,
+    family_ids_in_orgs,
+    generate_import_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
-FamilyEventTuple = Tuple[FamilyEvent, Family, FamilyDocument, Organisation]
 
+def _get_query() -> sqlalchemy.sql.Select:
+    """
+    Build a projection-only SELECT for events.
 
-def _get_query(db: Session) -> Query:
-    # NOTE: SqlAlchemy will make a complete hash of the query generation
-    #       if columns are used in the query() call. Therefore, entire
-    #       objects are returned.
-    return (
-        db.query(FamilyEvent, Family, FamilyDocument, Organisation)
-        .filter(FamilyEvent.family_import_id == Family.import_id)
-        .join(
-            FamilyDocument,
-            FamilyDocument.family_import_id == FamilyEvent.family_document_import_id,
-            isouter=True,
-        )
-        .join(Family, FamilyEvent.family_import_id == Family.import_id)
-        .join(FamilyCorpus, FamilyCorpus.family_import_id == Family.import_id)
-        .join(Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id)
-        .join(Organisation, Corpus.organisation_id == Organisation.id)
+    Only the FamilyEvent columns needed for an EventReadDTO are selected;
+    org scoping is applied separately with _filter_by_orgs.
+    """
+    return select(
+        FamilyEvent.import_id.label("import_id"),
+        FamilyEvent.title.label("event_title"),
+        FamilyEvent.date.label("date"),
+        FamilyEvent.event_type_name.label("event_type_value"),
+        FamilyEvent.status.label("event_status"),
+        FamilyEvent.created.label("created"),
+        FamilyEvent.last_modified.label("last_modified"),
+        FamilyEvent.family_import_id.label("family_import_id"),
+        FamilyEvent.family_document_import_id.label("family_document_import_id"),
     )
 
 
-def _event_to_dto(family_event_meta: FamilyEventTuple) -> EventReadDTO:
-    family_event = family_event_meta[0]
-    family_document_import_id = (
-        None
-        if family_event.family_document_import_id is None
-        else cast(str, family_event.family_document_import_id)
-    )
+def _filter_by_orgs(
+    stmt: sqlalchemy.sql.Select, org_ids: Optional[list[int]]
+) -> sqlalchemy.sql.Select:
+    """
+    Restrict a statement over FamilyEvent to events of the given orgs.
+
+    Uses a semi-join on family_corpus/corpus instead of joining the
+    family, document and organisation tables into every row.
+
+    :param Select stmt: a statement selecting from FamilyEvent
+    :param Optional[list[int]] org_ids: org IDs to filter by, or None for all
+    :return Select: the filtered statement
+    """
+    if org_ids is None:
+        return stmt
+    return stmt.where(FamilyEvent.family_import_id.in_(family_ids_in_orgs(org_ids)))
+
 
-    return EventReadDTO(
-        import_id=cast(str, family_event.import_id),
-        event_title=cast(str, family_event.title),
-        date=cast(datetime, family_event.date),
-        family_import_id=cast(str, family_event.family_import_id),
-        family_document_import_id=family_document_import_id,
-        event_type_value=cast(str, family_event.event_type_name),
-        event_status=cast(EventStatus, family_event.status),
-        created=cast(datetime, family_event.created),
-        last_modified=cast(datetime, family_event.last_modified),
+@lru_cache(maxsize=PREPARED_STATEMENTS)
+def _prepared(by: str, by_org: bool) -> sqlalchemy.sql.Select:
+    """
+    The read statement for one shape of query, built once and then reused.
+
+    :param str by: "all" for every event, "import_id" for one event or
+        "import_ids" for several.
+    :param bool by_org: whether to restrict to the ORG_IDS parameter.
+    :return Select: the statement, with its values left to be bound.
+    """
+    stmt = _get_query()
+    if by == "import_id":
+        stmt = stmt.where(FamilyEvent.import_id == IMPORT_ID)
+    elif by == "import_ids":
+        stmt = stmt.where(FamilyEvent.import_id.in_(IMPORT_IDS))
+    if by_org:
+        stmt = stmt.where(FamilyEvent.family_import_id.in_(family_ids_in_orgs(ORG_IDS)))
+    return stmt
+
+
+def _row_to_dto(row: Mapping) -> EventReadDTO:
+    """
+    Map a projected row (dict-like) into EventReadDTO without touching ORM
+    objects.
+    """
+    family_document_import_id = row["family_document_import_id"]
+    return build_dto(
+        EventReadDTO,
+        import_id=str(row["import_id"]),
+        event_title=str(row["event_title"]),
+        date=cast(datetime, row["date"]),
+        family_import_id=str(row["family_import_id"]),
+        family_document_import_id=(
+            str(family_document_import_id)
+            if family_document_import_id is not None
+            else None
+        ),
+        event_type_value=str(row["event_type_value"]),
+        event_status=EventStatus(row["event_status"]),
+        created=cast(datetime, row["created"]),
+        last_modified=cast(datetime, row["last_modified"]),
     )
 
 
@@ -105,16 +155,9 @@ def all(db: Session, org_ids: Optional[list[int]]) -> list[EventReadDTO]:
     :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
     :return Optional[EventReadDTO]: All family events in the database.
     """
-    query = _get_query(db)
-    if org_ids is not None:
-        query = query.filter(Organisation.id.in_(org_ids))
-    family_event_metas = query.all()
-
-    if not family_event_metas:
-        return []
-
-    result = [_event_to_dto(event_meta) for event_meta in family_event_metas]
-    return result
+    stmt = _prepared("all", org_ids is not None)
+    rows = db.execute(stmt, bound(org_ids=org_ids)).mappings().fetchall()
+    return [_row_to_dto(r) for r in rows]
 
 
 def get(db: Session, import_id: str) -> Optional[EventReadDTO]:
@@ -125,14 +168,26 @@ def get(db: Session, import_id: str) -> Optional[EventReadDTO]:
     :param str import_id: The import_id of the event.
     :return Optional[EventReadDTO]: A single family event or nothing.
     """
-    try:
-        family_event_meta = (
-            _get_query(db).filter(FamilyEvent.import_id == import_id).one()
-        )
-    except NoResultFound as e:
-        _LOGGER.debug(e)
-        return
-    return _event_to_dto(family_event_meta)
+    stmt = _prepared("import_id", False)
+    row = db.execute(stmt, bound(import_id=import_id)).mappings().one_or_none()
+    return _row_to_dto(row) if row else None
+
+
+def get_many(
+    db: Session, import_ids: list[str], org_ids: Optional[list[int]]
+) -> list[EventReadDTO]:
+    """
+    Gets several family events with a single projection query.
+
+    :param db Session: The database connection.
+    :param list[str] import_ids: The import_ids of the events.
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :return list[EventReadDTO]: The events found, in the requested order.
+    """
+    stmt = _prepared("import_ids", org_ids is not None)
+    params = bound(import_ids=import_ids, org_ids=org_ids)
+    found = {r["import_id"]: r for r in db.execute(stmt, params).mappings()}
+    return [_row_to_dto(found[i]) for i in import_ids if i in found]
 
 
 def search(
@@ -159,16 +214,16 @@ def search(
 
     condition = and_(*search) if len(search) > 1 else search[0]
     try:
-        query = _get_query(db).filter(condition)
-        if org_ids is not None:
-            query = query.filter(Organisation.id.in_(org_ids))
-        found = query.limit(search_params["max_results"]).all()
+        stmt = _filter_by_orgs(_get_query().where(condition), org_ids)
+        rows = (
+            db.execute(stmt.limit(search_params["max_results"])).mappings().fetchall()
+        )
     except OperationalError as e:
         if "canceling statement due to statement timeout" in str(e):
             raise TimeoutError
         raise RepositoryError(e)
 
-    return [_event_to_dto(f) for f in found]
+    return [_row_to_dto(r) for r in rows]
 
 
 def create(db: Session, event: EventCreateDTO) -> str:
@@ -221,17 +276,9 @@ def update(
     """
     new_values = event.model_dump()
 
-    original_fe = (
-        db.query(FamilyEvent).filter(FamilyEvent.import_id == import_id).one_or_none()
-    )
-
-    if original_fe is None:  # Not found the event to update
-        _LOGGER.error(f"Unable to find event for update {import_id}")
-        return False
-
     result = db.execute(
         db_update(FamilyEvent)
-        .where(FamilyEvent.import_id == original_fe.import_id)
+        .where(FamilyEvent.import_id == import_id)
         .values(
             title=new_values["event_title"],
             event_type_name=new_values["event_type_value"],
@@ -242,9 +289,9 @@ def update(
     )
 
     if result.rowcount == 0:  # type: ignore
-        msg = f"Could not update event fields: {event}"
-        _LOGGER.error(msg)
-        raise RepositoryError(msg)
+        # Not found the event to update
+        _LOGGER.error(f"Unable to find event for update {import_id}")
+        return False
 
     return True
 
@@ -259,7 +306,9 @@ def delete(db: Session, import_id: str) -> bool:
     """
 
     found = (
-        db.query(FamilyEvent).filter(FamilyEvent.import_id == import_id).one_or_none()
+        db.query(FamilyEvent.import_id)
+        .filter(FamilyEvent.import_id == import_id)
+        .one_or_none()
     )
     if found is None:
         _LOGGER.error(f"Event with id {import_id} not found")
@@ -286,28 +335,68 @@ def count(db: Session, org_ids: Optional[list[int]]) -> Optional[int]:
         or nothing.
     """
     try:
-        query = _get_query(db)
-        if org_ids is not None:
-            query = query.filter(Organisation.id.in_(org_ids))
-        n_events = query.count()
+        stmt = _filter_by_orgs(select(func.count(FamilyEvent.import_id)), org_ids)
+        n_events = db.execute(stmt).scalar()
     except NoResultFound as e:
         _LOGGER.debug(e)
         return
 
-    return n_events
+    return n_events if n_events is not None else 0
+
 
+def version(db: Session, org_ids: Optional[list[int]]) -> tuple:
+    """
+    Gets a cheap fingerprint of the events visible to the given orgs.
 
-def get_org_from_import_id(db: Session, import_id: str) -> Optional[int]:
-    result = _get_query(db).filter(FamilyEvent.import_id == import_id).one_or_none()
-    if result is None:
-        return None
-    _, _, _, org = result
-    return org.id
+    :param db Session: The database connection.
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :return tuple: A value that changes whenever any of the events do.
+    """
+    stmt = _filter_by_orgs(
+        select(func.count(FamilyEvent.import_id), func.max(FamilyEvent.last_modified)),
+        org_ids,
+    )
+    return tuple(db.execute(stmt).one())
+
+
+def entity_version(db: Session, import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single event.
+
+    :param db Session: The database connection.
+    :param str import_id: The import_id of the event.
+    :return Optional[tuple]: A value that changes whenever the event
+        does, or None if the event does not exist.
+    """
+    last_modified = db.execute(
+        select(FamilyEvent.last_modified).where(FamilyEvent.import_id == import_id)
+    ).scalar_one_or_none()
+    return (last_modified,) if last_modified is not None else None
+
+
+def org_id_for_event(db: Session, import_id: str) -> Optional[int]:
+    """
+    Gets the id of the organisation that owns an event.
+
+    :param db Session: The database connection.
+    :param str import_id: The import_id of the event.
+    :return Optional[int]: The owning organisation id or None if the
+        event does not exist.
+    """
+    return (
+        db.query(Corpus.organisation_id)
+        .join(FamilyCorpus, FamilyCorpus.corpus_import_id == Corpus.import_id)
+        .join(
+            FamilyEvent, FamilyEvent.family_import_id == FamilyCorpus.family_import_id
+        )
+        .filter(FamilyEvent.import_id == import_id)
+        .scalar()
+    )
 
 
 def get_event_metadata(db: Session, import_id: str):
     return (
-        db.query(FamilyEvent)
+        db.query(FamilyEvent.valid_metadata)
         .filter(FamilyEvent.import_id == import_id)
         .one()
         .valid_metadata
@@ -322,18 +411,4 @@ def get_single_event(db: Session, import_id: str) -> Optional[EventReadDTO]:
     :param str import_id: The import_id of the event.
     :return Optional[EventReadDTO]: A single family event or nothing.
     """
-    family_event = (
-        db.query(FamilyEvent).filter(FamilyEvent.import_id == import_id).one_or_none()
-    )
-    if family_event:
-        return EventReadDTO(
-            import_id=cast(str, family_event.import_id),
-            event_title=cast(str, family_event.title),
-            date=cast(datetime, family_event.date),
-            family_import_id=cast(str, family_event.family_import_id),
-            family_document_import_id=family_event.family_document_import_id,
-            event_type_value=cast(str, family_event.event_type_name),
-            event_status=cast(EventStatus, family_event.status),
-            created=cast(datetime, family_event.created),
-            last_modified=cast(datetime, family_event.last_modified),
-        )
+    return get(db, import_id)
@@ -9,6 +9,7 @@ directly to DTOs.
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Mapping, Optional, Union, cast
 
 import sqlalchemy
@@ -34,25 +35,106 @@ from sqlalchemy import delete as db_delete
 from sqlalchemy import desc, func, select, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import NoResultFound, OperationalError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 from sqlalchemy_utils import escape_like
 
 from app.errors import RepositoryError
 from app.model.family import FamilyCreateDTO, FamilyReadDTO, FamilyWriteDTO
 from app.repository.helpers import (
+    IMPORT_ID,
+    IMPORT_IDS,
+    ORG_IDS,
+    PREPARED_STATEMENTS,
+    bound,
+    build_dto,
     construct_raw_sql_query_to_retrieve_all_families,
+    family_ids_in_orgs,
+    freeze_fields,
     generate_import_id,
     generate_slug,
+    select_aggregates,
 )
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
+_GEOGRAPHY_FILTER = """
+    EXISTS (
+        SELECT 1
+        FROM family_geography fg
+        JOIN geography g ON g.id = fg.geography_id
+        WHERE fg.family_import_id = f.import_id
+        AND g.display_value = ANY(:geographies)
+    )
+"""
+
+# Matches families linked to the requested geographies or to any of their
+# descendants in the geography tree (regions -> countries -> subdivisions).
+_GEOGRAPHY_HIERARCHY_FILTER = """
+    EXISTS (
+        WITH RECURSIVE geography_tree AS (
+            SELECT g.id
+            FROM geography g
+            WHERE g.display_value = ANY(:geographies)
+            UNION
+            SELECT child.id
+            FROM geography child
+            JOIN geography_tree parent ON child.parent_id = parent.id
+        )
+        SELECT 1
+        FROM family_geography fg
+        JOIN geography_tree gt ON gt.id = fg.geography_id
+        WHERE fg.family_import_id = f.import_id
+    )
+"""
+
+_CORPUS_FILTER = """
+    EXISTS (
+        SELECT 1
+        FROM family_corpus fc_filter
+        WHERE fc_filter.family_import_id = f.import_id
+        AND fc_filter.corpus_import_id = ANY(:import_ids_for_corpus)
+    )
+"""
+
+_HAS_PUBLISHED_DOCUMENT = """
+    EXISTS (
+        SELECT 1 FROM family_document fd
+        WHERE fd.family_import_id = f.import_id
+        AND fd.document_status = 'PUBLISHED'
+    )
+"""
+
+_HAS_CREATED_DOCUMENT = """
+    EXISTS (
+        SELECT 1 FROM family_document fd
+        WHERE fd.family_import_id = f.import_id
+        AND fd.document_status = 'CREATED'
+    )
+"""
+
+# Mirrors the family_status CASE expression in the search query, but as
+# plain (anti-)semi-joins so the planner can use them to prune rows early.
+_STATUS_FILTERS = {
+    "PUBLISHED": _HAS_PUBLISHED_DOCUMENT,
+    "CREATED": f"(NOT {_HAS_PUBLISHED_DOCUMENT} AND {_HAS_CREATED_DOCUMENT})",
+    "DELETED": f"(NOT {_HAS_PUBLISHED_DOCUMENT} AND NOT {_HAS_CREATED_DOCUMENT})",
+}
+
 
-def _get_query() -> sqlalchemy.sql.Select:
+def _wants(fields: Optional[set[str]], *names: str) -> bool:
+    """Whether any of the named FamilyReadDTO fields is in a sparse fieldset."""
+    return fields is None or not fields.isdisjoint(names)
+
+
+def _get_query(fields: Optional[set[str]] = None) -> sqlalchemy.sql.Select:
     """
     Build a projection-only SELECT for families with SQL-side aggregation of
     child collections. This avoids loading ORM graphs and eliminates N+1s.
+
+    :param Optional[set[str]] fields: a sparse fieldset of FamilyReadDTO
+        fields; the aggregates and correlated subqueries behind any other
+        fields are left out of the SQL. None selects everything.
     """
     # Aggregate geographies per family
     geo_subq = (
@@ -208,60 +290,97 @@ def _get_query() -> sqlalchemy.sql.Select:
     empty_arr = func.cast([], ARRAY(String))
 
     # Base projection: only scalar columns + aggregated arrays
-    stmt = (
-        select(
-            Family.import_id.label("import_id"),
-            Family.title.label("family_title"),
-            Family.description.label("description"),
-            Family.family_category.label("family_category"),
-            family_status_expr,
-            published_date_expr,
-            last_updated_date_expr,
-            Family.created.label("created"),
-            Family.last_modified.label("last_modified"),
-            Family.concepts.label("concepts"),
-            FamilyMetadata.value.label("metadata"),
-            Corpus.import_id.label("corpus_import_id"),
-            Corpus.title.label("corpus_title"),
-            Corpus.corpus_type_name.label("corpus_type_name"),
-            Organisation.name.label("organisation"),
-            func.coalesce(geo_subq.c.geography_values, empty_arr).label(
-                "geography_values"
+    columns: list = [
+        Family.import_id.label("import_id"),
+        Family.title.label("family_title"),
+        Family.description.label("description"),
+        Family.family_category.label("family_category"),
+        Family.created.label("created"),
+        Family.last_modified.label("last_modified"),
+        Family.concepts.label("concepts"),
+        FamilyMetadata.value.label("metadata"),
+        Corpus.import_id.label("corpus_import_id"),
+        Corpus.title.label("corpus_title"),
+        Corpus.corpus_type_name.label("corpus_type_name"),
+        Organisation.name.label("organisation"),
+    ]
+    group_by: list = [
+        Family.import_id,
+        Family.title,
+        Family.description,
+        Family.family_category,
+        Family.created,
+        Family.last_modified,
+        Family.concepts,
+        FamilyMetadata.value,
+        Corpus.import_id,
+        Corpus.title,
+        Corpus.corpus_type_name,
+        Organisation.name,
+    ]
+    if _wants(fields, "status"):
+        columns.append(family_status_expr)
+    if _wants(fields, "published_date"):
+        columns.append(published_date_expr)
+    if _wants(fields, "last_updated_date"):
+        columns.append(last_updated_date_expr)
+
+    # (subquery, aggregated column, row key) for each requested aggregate
+    aggregates = [
+        (subq, column, key)
+        for subq, column, key, dto_fields in (
+            (
+                geo_subq,
+                "geography_values",
+                "geography_values",
+                ("geography", "geographies"),
             ),
-            func.coalesce(slugs_subq.c.slugs, empty_arr).label("slugs"),
-            func.coalesce(events_subq.c.event_ids, empty_arr).label("events"),
-            func.coalesce(docs_subq.c.document_ids, empty_arr).label("documents"),
-            func.coalesce(cols_subq.c.collection_ids, empty_arr).label("collections"),
+            (slugs_subq, "slugs", "slugs", ("slug",)),
+            (events_subq, "event_ids", "events", ("events",)),
+            (docs_subq, "document_ids", "documents", ("documents",)),
+            (cols_subq, "collection_ids", "collections", ("collections",)),
         )
+        if _wants(fields, *dto_fields)
+    ]
+    for subq, column, key in aggregates:
+        columns.append(func.coalesce(subq.c[column], empty_arr).label(key))
+        group_by.append(subq.c[column])
+
+    stmt = (
+        select(*columns)
         .join(FamilyMetadata, FamilyMetadata.family_import_id == Family.import_id)
         .join(FamilyCorpus, FamilyCorpus.family_import_id == Family.import_id)
         .join(Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id)
         .join(Organisation, Corpus.organisation_id == Organisation.id)
-        .outerjoin(geo_subq, geo_subq.c.fam_id == Family.import_id)
-        .outerjoin(slugs_subq, slugs_subq.c.fam_id == Family.import_id)
-        .outerjoin(events_subq, events_subq.c.fam_id == Family.import_id)
-        .outerjoin(docs_subq, docs_subq.c.fam_id == Family.import_id)
-        .outerjoin(cols_subq, cols_subq.c.fam_id == Family.import_id)
-        .group_by(
-            Family.import_id,
-            Family.title,
-            Family.description,
-            Family.family_category,
-            Family.created,
-            Family.last_modified,
-            Family.concepts,
-            FamilyMetadata.value,
-            Corpus.import_id,
-            Corpus.title,
-            Corpus.corpus_type_name,
-            Organisation.name,
-            geo_subq.c.geography_values,
-            slugs_subq.c.slugs,
-            events_subq.c.event_ids,
-            docs_subq.c.document_ids,
-            cols_subq.c.collection_ids,
-        )
     )
+    for subq, _, _ in aggregates:
+        stmt = stmt.outerjoin(subq, subq.c.fam_id == Family.import_id)
+    return stmt.group_by(*group_by)
+
+
+@lru_cache(maxsize=PREPARED_STATEMENTS)
+def _prepared(
+    fields: Optional[frozenset[str]], by: str, by_org: bool
+) -> sqlalchemy.sql.Select:
+    """
+    The read statement for one shape of query, built once and then reused.
+
+    :param Optional[frozenset[str]] fields: the sparse fieldset, see
+        `_get_query`.
+    :param str by: "all" for every family newest first, "import_id" for
+        one family or "import_ids" for several.
+    :param bool by_org: whether to restrict to the ORG_IDS parameter.
+    :return Select: the statement, with its values left to be bound.
+    """
+    stmt = _get_query(set(fields) if fields is not None else None)
+    if by == "import_id":
+        stmt = stmt.where(Family.import_id == IMPORT_ID)
+    elif by == "import_ids":
+        stmt = stmt.where(Family.import_id.in_(IMPORT_IDS))
+    else:
+        stmt = stmt.order_by(desc(Family.last_modified))
+    if by_org:
+        stmt = stmt.where(Organisation.id.in_(ORG_IDS))
     return stmt
 
 
@@ -269,25 +388,28 @@ def _row_to_dto(row: Mapping) -> FamilyReadDTO:
     """
     Map a projected row (dict-like) into FamilyReadDTO without touching ORM objects.
     This keeps memory low and avoids holding references to ORM instances.
+
+    Columns left out of a sparse query are given empty placeholder values.
     """
-    geos = [str(v) for v in (row["geography_values"] or [])]
-    slugs = row["slugs"] or []
+    geos = [str(v) for v in (row.get("geography_values") or [])]
+    slugs = row.get("slugs") or []
     concepts = row.get("concepts") or []
-    return FamilyReadDTO(
+    return build_dto(
+        FamilyReadDTO,
         import_id=str(row["import_id"]),
         title=str(row["family_title"]),
         summary=str(row["description"]),
         geography=str(geos[0]) if geos else None,
         geographies=geos,
         category=str(row["family_category"]),
-        status=str(row["family_status"]),
+        status=str(row.get("family_status") or ""),
         metadata=cast(dict, row["metadata"]),
         slug=str(slugs[0]) if slugs else "",
-        events=[str(e) for e in (row["events"] or [])],
-        published_date=row["published_date"],
-        last_updated_date=row["last_updated_date"],
-        documents=[str(d) for d in (row["documents"] or [])],
-        collections=[str(c) for c in (row["collections"] or [])],
+        events=[str(e) for e in (row.get("events") or [])],
+        published_date=row.get("published_date"),
+        last_updated_date=row.get("last_updated_date"),
+        documents=[str(d) for d in (row.get("documents") or [])],
+        collections=[str(c) for c in (row.get("collections") or [])],
         organisation=str(row["organisation"]),
         corpus_import_id=str(row["corpus_import_id"]),
         corpus_title=str(row["corpus_title"]),
@@ -299,42 +421,27 @@ def _row_to_dto(row: Mapping) -> FamilyReadDTO:
 
 
 def _update_intention(
-    db: Session,
-    import_id: str,
-    family: FamilyWriteDTO,
-    geo_ids: list[int],
-    original_family: Family,
-):
-    original_collections = [
-        c.collection_import_id
-        for c in db.query(CollectionFamily).filter(
-            original_family.import_id == CollectionFamily.family_import_id
-        )
-    ]
-    update_collections = set(original_collections) != set(family.collections)
-    update_title = cast(str, original_family.title) != family.title
+    family: FamilyWriteDTO, original: FamilyReadDTO
+) -> tuple[bool, bool, bool, bool, bool]:
+    """
+    Works out which parts of a family an update changes.
 
-    current_family_geographies_ids = [
-        family_geography.geography_id
-        for family_geography in db.query(FamilyGeography).filter(
-            FamilyGeography.family_import_id == import_id
-        )
-    ]
-    update_geographies = set(current_family_geographies_ids) != set(geo_ids)
+    Diffs the write DTO against the prefetched read DTO, so no queries are
+    needed to decide what to write.
 
+    :return tuple[bool, bool, bool, bool, bool]: whether the title, basic
+        fields, metadata, collections and geographies change.
+    """
+    update_title = original.title != family.title
     update_basics = (
         update_title
-        or original_family.description != family.summary
-        or original_family.family_category != family.category
-        or original_family.concepts != family.concepts
+        or original.summary != family.summary
+        or original.category != family.category
+        or (original.concepts or []) != (family.concepts or [])
     )
-
-    existing_metadata = (
-        db.query(FamilyMetadata)
-        .filter(FamilyMetadata.family_import_id == import_id)
-        .one()
-    )
-    update_metadata = existing_metadata.value != family.metadata
+    update_metadata = original.metadata != family.metadata
+    update_collections = set(original.collections) != set(family.collections)
+    update_geographies = set(original.geographies) != set(family.geographies)
     return (
         update_title,
         update_basics,
@@ -344,7 +451,9 @@ def _update_intention(
     )
 
 
-def all(db: Session, org_ids: Optional[list[int]]) -> list[FamilyReadDTO]:
+def all(
+    db: Session, org_ids: Optional[list[int]], fields: Optional[set[str]] = None
+) -> list[FamilyReadDTO]:
     """Return all families.
 
     Returns all the families as DTOs with a projection only query.
@@ -352,35 +461,62 @@ def all(db: Session, org_ids: Optional[list[int]]) -> list[FamilyReadDTO]:
 
     :param db Session: the database connection
     :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
     :return Optional[FamilyResponse]: All of things
     """
-    stmt = _get_query()
-    if org_ids is not None:
-        stmt = stmt.where(Organisation.id.in_(org_ids))
-    rows = db.execute(stmt.order_by(desc(Family.last_modified))).mappings().fetchall()
+    stmt = _prepared(freeze_fields(fields), "all", org_ids is not None)
+    rows = db.execute(stmt, bound(org_ids=org_ids)).mappings().fetchall()
     return [_row_to_dto(r) for r in rows]
 
 
-def get(db: Session, import_id: str) -> Optional[FamilyReadDTO]:
+def get(
+    db: Session, import_id: str, fields: Optional[set[str]] = None
+) -> Optional[FamilyReadDTO]:
     """Get a single family from the repository.
 
     Get a single family as DTO using projection only query.
 
     :param db Session: the database connection
     :param str import_id: The import_id of the family
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
     :return Optional[FamilyResponse]: A single family or nothing
     """
-    stmt = _get_query().where(Family.import_id == import_id)
-    row = db.execute(stmt).mappings().one_or_none()
+    stmt = _prepared(freeze_fields(fields), "import_id", False)
+    row = db.execute(stmt, bound(import_id=import_id)).mappings().one_or_none()
     return _row_to_dto(row) if row else None
 
 
+def get_many(
+    db: Session,
+    import_ids: list[str],
+    org_ids: Optional[list[int]],
+    fields: Optional[set[str]] = None,
+) -> list[FamilyReadDTO]:
+    """Get several families with a single projection query.
+
+    :param db Session: the database connection
+    :param list[str] import_ids: The import_ids of the families
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
+    :return list[FamilyReadDTO]: The families found, in the requested order
+    """
+    stmt = _prepared(freeze_fields(fields), "import_ids", org_ids is not None)
+    params = bound(import_ids=import_ids, org_ids=org_ids)
+    found = {r["import_id"]: r for r in db.execute(stmt, params).mappings()}
+    return [_row_to_dto(found[i]) for i in import_ids if i in found]
+
+
 def search(
     db: Session,
     search_params: dict[str, Union[str, int]],
     org_ids: Optional[list[int]],
     geography: Optional[list[str]],
     corpus: Optional[list[str]] = None,
+    include_sub_geographies: bool = False,
+    fields: Optional[set[str]] = None,
 ) -> list[FamilyReadDTO]:
     """
     Gets a list of families from the repository searching given fields.
@@ -394,6 +530,11 @@ def search(
     :param org_id Optional[int]: the ID of the organisation the user belongs to
     :param geography Optional[list[str]]: geographies to filter on
     :param corpus Optional[list[str]]: corpus import IDs to filter on
+    :param bool include_sub_geographies: whether families linked to any
+        descendant of the given geographies (e.g. the countries of a
+        region) should also match.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
     :raises HTTPException: If a DB error occurs a 503 is returned.
     :raises HTTPException: If the search request times out a 408 is
         returned.
@@ -423,30 +564,24 @@ def search(
             conditions.append("f.description ILIKE :summary")
             params["summary"] = term
 
+    # Geography, corpus and status are expressed as semi-joins so that
+    # Postgres resolves them inside the search statement, rather than us
+    # shipping potentially huge arrays of family import_ids back and forth.
     if geography is not None:
-        family_geographies = _get_family_geographies_by_display_values(db, geography)
-        if family_geographies:
-            conditions.append("f.import_id = ANY(:import_ids_for_geographies)")
-            params["import_ids_for_geographies"] = [
-                str(geography.family_import_id) for geography in family_geographies
-            ]
+        conditions.append(
+            _GEOGRAPHY_HIERARCHY_FILTER
+            if include_sub_geographies
+            else _GEOGRAPHY_FILTER
+        )
+        params["geographies"] = geography
 
     if corpus is not None:
-        conditions.append("c.import_id = ANY(:import_ids_for_corpus)")
+        conditions.append(_CORPUS_FILTER)
         params["import_ids_for_corpus"] = corpus
 
     if "status" in search_params:
         term = cast(str, search_params["status"]).upper()
-        conditions.append(
-            """
-            CASE
-                WHEN EXISTS (SELECT 1 FROM family_document fd WHERE fd.family_import_id = f.import_id AND fd.document_status = 'PUBLISHED') THEN 'PUBLISHED'
-                WHEN EXISTS (SELECT 1 FROM family_document fd WHERE fd.family_import_id = f.import_id AND fd.document_status = 'CREATED') THEN 'CREATED'
-                ELSE 'DELETED'
-            END = :family_status
-        """
-        )
-        params["family_status"] = term
+        conditions.append(_STATUS_FILTERS.get(term, "FALSE"))
 
     # Combine conditions into a WHERE clause
     where_clause = " AND ".join(conditions) if conditions else "1=1"
@@ -455,6 +590,7 @@ def search(
         params,
         org_ids=org_ids,
         filters=where_clause,
+        fields=fields,
     )
 
     try:
@@ -471,21 +607,22 @@ def search(
     for row in query_results:
         # Row keys must match _row_to_dto expectations; raw SQL builder already
         # returns projected columns and arrays. Map by name.
-        dto = FamilyReadDTO(
+        dto = build_dto(
+            FamilyReadDTO,
             import_id=str(row["family_import_id"]),
             title=str(row["family_title"]),
             summary=str(row["description"]),
             geography=str(
-                row["geography_values"][0] if row["geography_values"] else ""
+                row["geography_values"][0] if row.get("geography_values") else ""
             ),
-            geographies=[str(value) for value in (row["geography_values"] or [])],
+            geographies=[str(value) for value in (row.get("geography_values") or [])],
             category=str(row["family_category"]),
-            status=str(row["family_status"]),
+            status=str(row.get("family_status") or ""),
             metadata=cast(dict, row["value"]),
             slug=str(row["slugs"][0]) if row.get("slugs") else "",
             events=[str(e) for e in (row.get("event_ids") or [])],
-            published_date=row["published_date"],
-            last_updated_date=row["last_updated_date"],
+            published_date=row.get("published_date"),
+            last_updated_date=row.get("last_updated_date"),
             documents=[str(d) for d in (row.get("document_ids") or [])],
             collections=[str(c) for c in (row.get("collection_ids") or [])],
             organisation=str(row["name"]),
@@ -501,27 +638,33 @@ def search(
 
 
 def update(
-    db: Session, import_id: str, family: FamilyWriteDTO, geo_ids: list[int]
-) -> bool:
+    db: Session,
+    import_id: str,
+    family: FamilyWriteDTO,
+    geo_ids: list[int],
+    original: Optional[FamilyReadDTO] = None,
+) -> Optional[FamilyReadDTO]:
     """
     Updates a single entry with the new values passed.
 
+    Child rows are diffed as sets and written with one statement each, and
+    the family row is updated with RETURNING so the response is built from
+    the prefetched state without reading the family back.
+
     :param db Session: the database connection
     :param str import_id: The family import id to change.
-    :param FamilyDTO family: The new values
-    :param int geo_id: a validated geography id
+    :param FamilyWriteDTO family: The new values
     :param list[int] geo_ids: a list of validated geography ids
-    :return bool: True if new values were set otherwise false.
+    :param Optional[FamilyReadDTO] original: the family as it is now, if
+        the caller has already read it in this session.
+    :return Optional[FamilyReadDTO]: The updated family or None if it was
+        not found.
     """
-    new_values = family.model_dump()
-
-    original_family = (
-        db.query(Family).filter(Family.import_id == import_id).one_or_none()
-    )
-
-    if original_family is None:
+    if original is None:
+        original = get(db, import_id)
+    if original is None:
         _LOGGER.error(f"Unable to find family for update {family}")
-        return False
+        return None
 
     # Now figure out the intention of the request:
     (
@@ -530,7 +673,7 @@ def update(
         update_metadata,
         update_collections,
         update_geographies,
-    ) = _update_intention(db, import_id, family, geo_ids, original_family)
+    ) = _update_intention(family, original)
 
     # Return if nothing to do
     if not (
@@ -540,26 +683,35 @@ def update(
         or update_collections
         or update_geographies
     ):
-        return True
+        return original
 
+    # Every change moves the family's last_modified on, including those that
+    # only touched child tables, as conditional GETs rely on it.
+    values: dict = dict(last_modified=func.now())
     if update_basics:
-        updates = 0
-        result = db.execute(
-            sqlalchemy.update(Family)
-            .where(Family.import_id == import_id)
-            .values(
-                title=new_values["title"],
-                description=new_values["summary"],
-                family_category=new_values["category"],
-                concepts=new_values["concepts"],
-            )
+        values.update(
+            title=family.title,
+            description=family.summary,
+            family_category=family.category,
+            concepts=family.concepts,
         )
 
-        updates += result.rowcount  # type: ignore
-        if updates == 0:  # type: ignore
-            msg = f"Could not update family fields: {family}"
-            _LOGGER.error(msg)
-            raise RepositoryError(msg)
+    returned = db.execute(
+        sqlalchemy.update(Family)
+        .where(Family.import_id == import_id)
+        .values(**values)
+        .returning(
+            Family.title,
+            Family.description,
+            Family.family_category,
+            Family.concepts,
+            Family.last_modified,
+        )
+    ).one_or_none()
+    if returned is None:
+        msg = f"Could not update family fields: {family}"
+        _LOGGER.error(msg)
+        raise RepositoryError(msg)
 
     # Update if metadata is changed
     if update_metadata:
@@ -577,58 +729,42 @@ def update(
             raise RepositoryError(msg)
 
     # Update slug if title changed
+    slug = original.slug
     if update_title:
-        db.flush()
-        name = generate_slug(db, family.title)
-        new_slug = Slug(
-            family_import_id=import_id,
-            family_document_import_id=None,
-            name=name,
+        slug = generate_slug(db, family.title)
+        db.execute(
+            sqlalchemy.insert(Slug).values(
+                family_import_id=import_id,
+                family_document_import_id=None,
+                name=slug,
+            )
         )
-        db.add(new_slug)
-        _LOGGER.info(f"Added a new slug for {import_id} of {new_slug.name}")
+        _LOGGER.info(f"Added a new slug for {import_id} of {slug}")
 
     # Update collections if collections changed.
     if update_collections:
-        original_collections = set(
-            [
-                c.collection_import_id
-                for c in db.query(CollectionFamily).filter(
-                    original_family.import_id == CollectionFamily.family_import_id
-                )
-            ]
+        perform_family_collections_update(
+            db, import_id, family.collections, original.collections
         )
 
-        # Remove any collections that were originally associated with the family but
-        # now aren't.
-        cols_to_remove = set(original_collections) - set(family.collections)
-        for col in cols_to_remove:
-            result = db.execute(
-                sqlalchemy.delete(CollectionFamily).where(
-                    CollectionFamily.collection_import_id == col
-                )
-            )
-
-            if result.rowcount == 0:  # type: ignore
-                msg = f"Could not remove family {import_id} from collection {col}"
-                _LOGGER.error(msg)
-                raise RepositoryError(msg)
-
-        # Add any collections that weren't originally associated with the family.
-        cols_to_add = set(family.collections) - set(original_collections)
-        for col in cols_to_add:
-            db.flush()
-            new_collection = CollectionFamily(
-                family_import_id=import_id,
-                collection_import_id=col,
-            )
-            db.add(new_collection)
-
     # Update geographies if geographies have changed.
     if update_geographies:
         perform_family_geographies_update(db, import_id, geo_ids)
 
-    return True
+    return original.model_copy(
+        update=dict(
+            title=str(returned.title),
+            summary=str(returned.description),
+            category=str(returned.family_category),
+            concepts=returned.concepts or [],
+            metadata=family.metadata,
+            slug=slug,
+            collections=list(family.collections),
+            geographies=list(family.geographies),
+            geography=family.geographies[0] if family.geographies else None,
+            last_modified=cast(datetime, returned.last_modified),
+        )
+    )
 
 
 def create(
@@ -804,10 +940,14 @@ def count(db: Session, org_ids: Optional[list[int]]) -> Optional[int]:
     :return Optional[int]: The number of families in the repository or none.
     """
     try:
-        stmt = _get_query()
+        # Only the family -> corpus link is needed to scope by org, so count
+        # that rather than building the full read projection.
+        stmt = select(func.count(FamilyCorpus.family_import_id))
         if org_ids is not None:
-            stmt = stmt.where(Organisation.id.in_(org_ids))
-        n_families = db.execute(select(func.count()).select_from(stmt)).scalar()
+            stmt = stmt.join(
+                Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id
+            ).where(Corpus.organisation_id.in_(org_ids))
+        n_families = db.execute(stmt).scalar()
     except NoResultFound as e:
         _LOGGER.debug(e)
         return
@@ -815,103 +955,142 @@ def count(db: Session, org_ids: Optional[list[int]]) -> Optional[int]:
     return n_families if n_families is not None else 0
 
 
-def remove_old_geographies(
-    db: Session, import_id: str, geo_ids: list[int], original_geographies: set[int]
-):
+def version(db: Session, org_ids: Optional[list[int]]) -> tuple:
     """
-    Removes geographies that are no longer in geo_ids.
+    Gets a cheap fingerprint of the families visible to the given orgs.
 
-    This function compares the original set of geographies with the new geo_ids
-    and removes the geographies that are no longer present.
+    A family read also reflects its documents and events, so their row
+    counts and latest modification times are part of the fingerprint.
+    Every family write bumps the family's own last_modified (see update),
+    including those that only touch child tables, so collection and
+    geography changes are covered too.
 
-    :param Session db: the database session
-    :param str import_id: the family import ID for the geographies
-    :param list[int] geo_ids: the list of geography IDs to be kept
-    :param set[int] original_geographies: the set of original geography IDs to be compared
-    :raises RepositoryError: if a geography removal fails
+    :param db Session: the database connection
+    :param org_ids Optional[list[int]]: org IDs to filter by, or None for all
+    :return tuple: a value that changes whenever any of the families do
     """
-    cols_to_remove = set(original_geographies) - set(geo_ids)
-    for col in cols_to_remove:
-        try:
-            db.execute(
-                sqlalchemy.delete(FamilyGeography).where(
-                    FamilyGeography.geography_id == col,
-                    FamilyGeography.family_import_id == import_id,
-                )
-            )
-        except Exception as e:
-            msg = f"Could not remove family {import_id} from geography {col}: {str(e)}"
-            _LOGGER.error(msg)
-            raise RepositoryError(msg)
+    families = select(
+        func.count(Family.import_id).label("n_families"),
+        func.max(Family.last_modified).label("families_modified"),
+    )
+    documents = select(
+        func.count(FamilyDocument.import_id).label("n_documents"),
+        func.max(FamilyDocument.last_modified).label("documents_modified"),
+    )
+    events = select(
+        func.count(FamilyEvent.import_id).label("n_events"),
+        func.max(FamilyEvent.last_modified).label("events_modified"),
+    )
+    if org_ids is not None:
+        in_orgs = family_ids_in_orgs(org_ids)
+        families = families.where(Family.import_id.in_(in_orgs))
+        documents = documents.where(FamilyDocument.family_import_id.in_(in_orgs))
+        events = events.where(FamilyEvent.family_import_id.in_(in_orgs))
 
+    return tuple(db.execute(select_aggregates(families, documents, events)).one())
 
-def add_new_geographies(
-    db: Session, import_id: str, geo_ids: list[int], original_geographies: set[int]
-):
+
+def entity_version(db: Session, import_id: str) -> Optional[tuple]:
     """
-    Adds new geographies that are not already in the original geographies.
+    Gets a cheap fingerprint of a single family.
 
-    This function identifies the geographies that need to be added (i.e., those
-    that are in geo_ids but not in the original set) and adds them to the database.
+    :param db Session: the database connection
+    :param str import_id: The import_id of the family
+    :return Optional[tuple]: a value that changes whenever the family
+        does, or None if the family does not exist
+    """
+    family = select(Family.last_modified.label("family_modified")).where(
+        Family.import_id == import_id
+    )
+    documents = select(
+        func.count(FamilyDocument.import_id).label("n_documents"),
+        func.max(FamilyDocument.last_modified).label("documents_modified"),
+    ).where(FamilyDocument.family_import_id == import_id)
+    events = select(
+        func.count(FamilyEvent.import_id).label("n_events"),
+        func.max(FamilyEvent.last_modified).label("events_modified"),
+    ).where(FamilyEvent.family_import_id == import_id)
 
-    :param Session db: the database session
-    :param str import_id: the family import ID for the geographies
-    :param list[str] geo_ids: the list of geography IDs to be added
-    :param set[str] original_geographies: the set of original geography IDs to be checked against
-    :raises RepositoryError: if fails to add a geography
+    row = db.execute(select_aggregates(family, documents, events)).one_or_none()
+    return tuple(row) if row is not None else None
+
+
+def perform_family_collections_update(
+    db: Session,
+    import_id: str,
+    collections: list[str],
+    original_collections: list[str],
+):
     """
-    cols_to_add = set(geo_ids) - set(original_geographies)
+    Replaces a family's collections with one delete and one insert.
 
-    for col in cols_to_add:
-        try:
-            new_geography = FamilyGeography(
-                family_import_id=import_id,
-                geography_id=col,
+    :param Session db: the database session
+    :param str import_id: the family import ID for the collections
+    :param list[str] collections: the collection import ids to be kept
+    :param list[str] original_collections: the family's current collections
+    :raises RepositoryError: if the collections could not be updated
+    """
+    cols_to_add = set(collections) - set(original_collections)
+    try:
+        db.execute(
+            sqlalchemy.delete(CollectionFamily).where(
+                CollectionFamily.family_import_id == import_id,
+                CollectionFamily.collection_import_id.notin_(collections),
             )
-            db.add(new_geography)
-            db.flush()
-        except Exception as e:
-            msg = f"Failed to add geography {col} to family {import_id}: {str(e)}"
-            _LOGGER.error(msg)
-            raise RepositoryError(msg)
+        )
+        if cols_to_add:
+            db.execute(
+                sqlalchemy.insert(CollectionFamily).values(
+                    [
+                        dict(family_import_id=import_id, collection_import_id=col)
+                        for col in sorted(cols_to_add)
+                    ]
+                )
+            )
+    except Exception as e:
+        msg = f"Could not update collections for family {import_id}: {str(e)}"
+        _LOGGER.error(msg)
+        raise RepositoryError(msg)
 
 
 def perform_family_geographies_update(db: Session, import_id: str, geo_ids: list[int]):
     """
     Updates geographies by removing old ones and adding new ones.
 
-    This function performs a complete update by removing geographies that are no
-    longer in geo_ids and adding new geographies that were not previously present.
+    Removes every geography no longer in geo_ids with one delete, then
+    inserts the ones the family does not have yet with one INSERT ... SELECT,
+    so the current geographies never need to be read.
 
     :param Session db: the database session
     :param str import_id: the family import ID for the geographies
-    :param list[str] geo_ids: the list of geography IDs to be updated
+    :param list[int] geo_ids: the list of geography IDs to be kept
+    :raises RepositoryError: if the geographies could not be updated
     """
-    original_geographies = set(
-        [
-            fg.geography_id
-            for fg in db.query(FamilyGeography).filter(
-                FamilyGeography.family_import_id == import_id
+    try:
+        db.execute(
+            sqlalchemy.delete(FamilyGeography).where(
+                FamilyGeography.family_import_id == import_id,
+                FamilyGeography.geography_id.notin_(geo_ids),
             )
-        ]
-    )
-
-    remove_old_geographies(db, import_id, geo_ids, original_geographies)
-    add_new_geographies(db, import_id, geo_ids, original_geographies)
-
-
-def _get_family_geographies_by_display_values(
-    db: Session, geographies: list[str]
-) -> Query:
-    """
-    Filters import IDs of families based on the provided geography values.
-    :param db Session: the database connection
-    :param list[str] geographies: A list of geography display values to filter by
-    :return Query: A subquery containing the filtered family import IDs
-    """
+        )
+    except Exception as e:
+        msg = f"Could not remove old geographies from family {import_id}: {str(e)}"
+        _LOGGER.error(msg)
+        raise RepositoryError(msg)
 
-    return (
-        db.query(FamilyGeography.family_import_id)
-        .join(Geography, Geography.id == FamilyGeography.geography_id)
-        .filter(Geography.display_value.in_(geographies))
+    current = select(FamilyGeography.geography_id).where(
+        FamilyGeography.family_import_id == import_id
     )
+    try:
+        db.execute(
+            sqlalchemy.insert(FamilyGeography).from_select(
+                ["family_import_id", "geography_id"],
+                select(sqlalchemy.literal(import_id, String), Geography.id).where(
+                    Geography.id.in_(geo_ids), Geography.id.notin_(current)
+                ),
+            )
+        )
+    except Exception as e:
+        msg = f"Failed to add geographies to family {import_id}: {str(e)}"
+        _LOGGER.error(msg)
+        raise RepositoryError(msg)
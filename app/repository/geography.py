@@ -1,31 +1,42 @@
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 from db_client.models.dfce.geography import Geography
+from sqlalchemy import Text, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 
 
-def get_id_from_value(db: Session, geo_string: str) -> Optional[int]:
+def get_all(db: Session) -> Sequence[Mapping]:
     """
-    Fetch the ID of a geography based on its iso value.
+    Fetch every geography as a plain row mapping, ordered by id.
+
+    Parents always have a lower id than their children, so the rows can be
+    assembled into a tree in a single pass.
 
     :param Session db: Database session.
-    :param str geo_string: The geography value to look up.
-    :return Optional[int]: The ID of the geography if found, otherwise None.
+    :return Sequence[Mapping]: All columns of every geography.
     """
-    return db.query(Geography.id).filter_by(value=geo_string).scalar()
+    return (
+        db.execute(select(Geography.__table__).order_by(Geography.id)).mappings().all()
+    )
 
 
-def get_ids_from_values(db: Session, geo_strings: list[str]) -> list[int]:
+def fingerprint(db: Session) -> Optional[str]:
     """
-    Fetch IDs for multiple geographies based on their iso values.
+    Fetch a hash of the geography table's content.
+
+    Every column of every row is hashed, so a value edited in place changes
+    it as well as rows being added or removed. The table holds a few
+    thousand short rows, so this stays a cheap single query.
 
     :param Session db: Database session.
-    :param list[str] geo_strings: A list of geography iso values to look up.
-    :return list[int]: A list of IDs corresponding to the provided geography values.
+    :return Optional[str]: The MD5 of all rows, None if there are none.
     """
-    return [
-        geography.id
-        for geography in db.query(Geography)
-        .filter(Geography.value.in_(geo_strings))
-        .all()
-    ]
+    table = Geography.__table__
+    # The table name as a column is the whole row, e.g. (1,"Asia",...)
+    row = cast(literal_column(table.name), Text)
+    return db.execute(
+        select(
+            func.md5(func.string_agg(row, aggregate_order_by("\n", table.c.id)))
+        ).select_from(table)
+    ).scalar()
@@ -2,19 +2,52 @@
 
 import logging
 from functools import cache
-from typing import Optional, Tuple, Union, cast
+from typing import Any, Optional, Tuple, TypeVar, Union, cast
 from uuid import uuid4
 
-from db_client.models.dfce.family import Slug
+from db_client.models.dfce.family import FamilyCorpus, Slug
+from db_client.models.organisation.corpus import Corpus
 from db_client.models.organisation.counters import CountedEntity, EntityCounter
 from db_client.models.organisation.users import Organisation
+from pydantic import BaseModel
 from slugify import slugify
+from sqlalchemy import bindparam, select, true
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import BindParameter
 
+from app import config
 from app.errors import RepositoryError
 
 _LOGGER = logging.getLogger(__name__)
 
+DTO = TypeVar("DTO", bound=BaseModel)
+
+# Bound parameters for the prepared read statements in each repository. The
+# statements are built once per shape and their values supplied on execution,
+# so SQLAlchemy neither rebuilds nor recompiles them per call.
+IMPORT_ID = bindparam("import_id")
+IMPORT_IDS = bindparam("import_ids", expanding=True)
+ORG_IDS = bindparam("org_ids", expanding=True)
+
+# How many prepared statement shapes (e.g. sparse fieldsets) each kind of
+# read keeps.
+PREPARED_STATEMENTS = 64
+
+
+def freeze_fields(fields: Optional[set[str]]) -> Optional[frozenset[str]]:
+    """Makes a sparse fieldset hashable, so prepared statements can be keyed by it."""
+    return frozenset(fields) if fields is not None else None
+
+
+def bound(**values: Any) -> dict[str, Any]:
+    """
+    The parameters for a prepared statement, leaving out any that are None.
+
+    :return dict[str, Any]: the values keyed by bound parameter name.
+    """
+    return {name: value for name, value in values.items() if value is not None}
+
 
 def generate_unique_slug(
     existing_slugs: set[str], title: str, attempts: int = 100, suffix_length: int = 6
@@ -125,65 +158,67 @@ def generate_import_id(
     return counter.create_import_id(entity_type)
 
 
-def construct_raw_sql_query_to_retrieve_all_families(
-    filter_params: dict[str, Union[str, int, list[str]]],
-    org_ids: Optional[list[int]] = None,
-    filters: Optional[str] = None,
-) -> Tuple[str, dict[str, Union[str, int]]]:
+def build_dto(model: type[DTO], **fields: Any) -> DTO:
     """
-    Constructs a raw SQL query for retrieving family-related data based on provided filters.
+    Builds a read DTO from values mapped out of a projected DB row.
 
-    :param Optional[int] org_id: The ID of the organization to filter by (default is None).
-    :param Optional[str] filters: A string representing additional filtering conditions (default is None).
-    :param Optional[Dict[str, any]] filter_params: A dictionary of filter parameters to be used in the query (default is None).
-    :return: A tuple containing the constructed SQL query string and a dictionary of query parameters.
+    The values come from our own typed columns, so by default the model is
+    built with `model_construct` and skips validation. Callers must pass
+    values of the declared types (e.g. enum members rather than strings).
+    Validation is switched back on by VALIDATE_REPOSITORY_DTOS.
+
+    :param type[DTO] model: The DTO class to build.
+    :param Any fields: The DTO field values.
+    :return DTO: The DTO.
     """
-    main_sql_query = """
-        SELECT
-            f.*,
-            f.title AS family_title,
-            geography_subquery.geography_values,
-            family_documents_subquery.document_ids,
-            family_events_subquery.event_ids,
-            fm.*,
-            c.*,
-            c.import_id AS corpus_import_id,
-            o.*,
-            slug_subquery.slugs,
-            collection_subquery.collection_ids,
-        CASE
-            WHEN EXISTS (
-                SELECT 1
-                FROM family_document fd
-                WHERE fd.family_import_id = f.import_id
-                AND fd.document_status = 'PUBLISHED'
-            ) THEN 'PUBLISHED'
-            WHEN EXISTS (
-                SELECT 1
-                FROM family_document fd
-                WHERE fd.family_import_id = f.import_id
-                AND fd.document_status = 'CREATED'
-            ) THEN 'CREATED'
-            ELSE 'DELETED'
-        END AS family_status,
-        (
-            SELECT MAX(fe.date)
-            FROM family_event fe
-            WHERE fe.family_import_id = f.import_id
-                AND fe.date <= CURRENT_TIMESTAMP
-        ) AS last_updated_date,
-        (
-            SELECT MIN(fe.date)
-            FROM family_event fe
-            WHERE fe.family_import_id = f.import_id
-            AND EXISTS (
-                    SELECT 1
-                    FROM jsonb_array_elements_text(fe.valid_metadata::jsonb->'datetime_event_name') AS datetime_event_name
-                    WHERE datetime_event_name = fe.event_type_name
-                )
-        ) AS published_date
-        FROM
-            family f
+    if config.VALIDATE_REPOSITORY_DTOS:
+        return model(**fields)
+    return model.model_construct(**fields)
+
+
+def family_ids_in_orgs(org_ids: Union[list[int], BindParameter]) -> Select:
+    """
+    Selects the import ids of the families owned by the given orgs.
+
+    Intended for semi-joins (``.in_()``) when scoping entities by org.
+
+    :param Union[list[int], BindParameter] org_ids: org IDs to filter by,
+        or the ORG_IDS parameter for a prepared statement.
+    :return Select: a statement selecting family import ids.
+    """
+    return (
+        select(FamilyCorpus.family_import_id)
+        .join(Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id)
+        .where(Corpus.organisation_id.in_(org_ids))
+    )
+
+
+def select_aggregates(*stmts: Select) -> Select:
+    """
+    Combines single row aggregate SELECTs into one statement.
+
+    Each statement becomes a subquery and their columns are returned side by
+    side, so several counts or maxima cost one round trip.
+
+    :param Select stmts: aggregate SELECTs that each return exactly one row
+        (or none, in which case the combined statement returns no rows).
+    :return Select: a statement returning all of their columns.
+    """
+    subqueries = [stmt.subquery() for stmt in stmts]
+    from_clause = subqueries[0]
+    for subquery in subqueries[1:]:
+        from_clause = from_clause.join(subquery, true())
+    return select(*[c for sq in subqueries for c in sq.c]).select_from(from_clause)
+
+
+# The per-family aggregates of the family search query, in join order. Each
+# is only selected and joined when one of its FamilyReadDTO fields is wanted:
+# (DTO fields, selected column, join clause).
+_FAMILY_SEARCH_AGGREGATES: list[tuple[tuple[str, ...], str, str]] = [
+    (
+        ("geography", "geographies"),
+        "geography_subquery.geography_values",
+        """
         JOIN
             (
                 SELECT
@@ -196,7 +231,12 @@ def construct_raw_sql_query_to_retrieve_all_families(
                 GROUP BY
                     fg.family_import_id
             ) AS geography_subquery
-            ON geography_subquery.family_import_id = f.import_id
+            ON geography_subquery.family_import_id = f.import_id""",
+    ),
+    (
+        ("documents",),
+        "family_documents_subquery.document_ids",
+        """
         LEFT JOIN
             (
                 SELECT
@@ -209,7 +249,12 @@ def construct_raw_sql_query_to_retrieve_all_families(
                 GROUP BY
                     fd.family_import_id
             ) AS family_documents_subquery
-            ON family_documents_subquery.family_import_id = f.import_id
+            ON family_documents_subquery.family_import_id = f.import_id""",
+    ),
+    (
+        ("events",),
+        "family_events_subquery.event_ids",
+        """
         LEFT JOIN
             (
                 SELECT
@@ -225,7 +270,12 @@ def construct_raw_sql_query_to_retrieve_all_families(
                 GROUP BY
                     fe.family_import_id
             ) AS family_events_subquery
-            ON family_events_subquery.family_import_id = f.import_id
+            ON family_events_subquery.family_import_id = f.import_id""",
+    ),
+    (
+        ("slug",),
+        "slug_subquery.slugs",
+        """
         LEFT JOIN
             (
                 SELECT
@@ -236,7 +286,12 @@ def construct_raw_sql_query_to_retrieve_all_families(
                 GROUP BY
                     s.family_import_id
             ) AS slug_subquery
-            ON slug_subquery.family_import_id = f.import_id
+            ON slug_subquery.family_import_id = f.import_id""",
+    ),
+    (
+        ("collections",),
+        "collection_subquery.collection_ids",
+        """
         LEFT JOIN
             (
                 SELECT
@@ -247,7 +302,103 @@ def construct_raw_sql_query_to_retrieve_all_families(
                 GROUP BY
                     cf.family_import_id
             ) AS collection_subquery
-            ON collection_subquery.family_import_id = f.import_id
+            ON collection_subquery.family_import_id = f.import_id""",
+    ),
+]
+
+# The correlated subqueries of the family search query, keyed by the
+# FamilyReadDTO field that needs them.
+_FAMILY_SEARCH_SUBQUERIES = {
+    "status": """
+        CASE
+            WHEN EXISTS (
+                SELECT 1
+                FROM family_document fd
+                WHERE fd.family_import_id = f.import_id
+                AND fd.document_status = 'PUBLISHED'
+            ) THEN 'PUBLISHED'
+            WHEN EXISTS (
+                SELECT 1
+                FROM family_document fd
+                WHERE fd.family_import_id = f.import_id
+                AND fd.document_status = 'CREATED'
+            ) THEN 'CREATED'
+            ELSE 'DELETED'
+        END AS family_status""",
+    "last_updated_date": """
+        (
+            SELECT MAX(fe.date)
+            FROM family_event fe
+            WHERE fe.family_import_id = f.import_id
+                AND fe.date <= CURRENT_TIMESTAMP
+        ) AS last_updated_date""",
+    "published_date": """
+        (
+            SELECT MIN(fe.date)
+            FROM family_event fe
+            WHERE fe.family_import_id = f.import_id
+            AND EXISTS (
+                    SELECT 1
+                    FROM jsonb_array_elements_text(fe.valid_metadata::jsonb->'datetime_event_name') AS datetime_event_name
+                    WHERE datetime_event_name = fe.event_type_name
+                )
+        ) AS published_date""",
+}
+
+# The geography aggregate is an inner join, so search only returns families
+# with a geography. This keeps that behaviour when it is not selected.
+_FAMILY_HAS_GEOGRAPHY = """
+    EXISTS (
+        SELECT 1 FROM family_geography fg
+        WHERE fg.family_import_id = f.import_id
+    )
+"""
+
+
+def construct_raw_sql_query_to_retrieve_all_families(
+    filter_params: dict[str, Union[str, int, list[str]]],
+    org_ids: Optional[list[int]] = None,
+    filters: Optional[str] = None,
+    fields: Optional[set[str]] = None,
+) -> Tuple[str, dict[str, Union[str, int]]]:
+    """
+    Constructs a raw SQL query for retrieving family-related data based on provided filters.
+
+    :param Optional[int] org_id: The ID of the organization to filter by (default is None).
+    :param Optional[str] filters: A string representing additional filtering conditions (default is None).
+    :param Optional[Dict[str, any]] filter_params: A dictionary of filter parameters to be used in the query (default is None).
+    :param Optional[set[str]] fields: A sparse fieldset of FamilyReadDTO fields, the aggregates for any others are not computed (default is None, for all).
+    :return: A tuple containing the constructed SQL query string and a dictionary of query parameters.
+    """
+
+    def wanted(*dto_fields: str) -> bool:
+        return fields is None or not fields.isdisjoint(dto_fields)
+
+    aggregates = [
+        (column, join)
+        for dto_fields, column, join in _FAMILY_SEARCH_AGGREGATES
+        if wanted(*dto_fields)
+    ]
+    columns = [
+        "f.*",
+        "f.title AS family_title",
+        "fm.*",
+        "c.*",
+        "c.import_id AS corpus_import_id",
+        "o.*",
+        *(column for column, _ in aggregates),
+    ]
+    select_list = ",\n            ".join(columns)
+    subqueries = "".join(
+        f",{sql}" for field, sql in _FAMILY_SEARCH_SUBQUERIES.items() if wanted(field)
+    )
+    joins = "".join(join for _, join in aggregates)
+
+    main_sql_query = f"""
+        SELECT
+            {select_list}{subqueries}
+        FROM
+            family f{joins}
         JOIN
             family_metadata fm ON fm.family_import_id = f.import_id
         JOIN
@@ -265,6 +416,9 @@ def construct_raw_sql_query_to_retrieve_all_families(
         where_conditions.append("o.id = ANY(:org_ids)")
         query_params["org_ids"] = org_ids
 
+    if not wanted("geography", "geographies"):
+        where_conditions.append(_FAMILY_HAS_GEOGRAPHY)
+
     if filters:
         where_conditions.append(filters)
 
@@ -277,11 +431,19 @@ def construct_raw_sql_query_to_retrieve_all_families(
         main_sql_query += f" WHERE {where_clause}"
 
     # Append GROUP BY at the end
-    main_sql_query += """
+    group_by = ", ".join(
+        [
+            "f.import_id",
+            "f.title",
+            *(column for column, _ in aggregates),
+            "fm.family_import_id",
+            "c.import_id",
+            "o.id",
+        ]
+    )
+    main_sql_query += f"""
     GROUP BY
-        f.import_id, f.title, geography_subquery.geography_values,
-        family_documents_subquery.document_ids, family_events_subquery.event_ids,
-        fm.family_import_id, c.import_id, o.id, slug_subquery.slugs, collection_subquery.collection_ids
+        {group_by}
     ORDER BY f.last_modified DESC
     LIMIT :max_results
     """
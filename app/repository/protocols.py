@@ -17,15 +17,29 @@ class FamilyRepo(Protocol):
     no_org: bool = False
 
     @staticmethod
-    def all(db: Session, org_ids: Optional[list[int]]) -> list[FamilyReadDTO]:
+    def all(
+        db: Session, org_ids: Optional[list[int]], fields: Optional[set[str]] = None
+    ) -> list[FamilyReadDTO]:
         """Returns all the families"""
         ...
 
     @staticmethod
-    def get(db: Session, import_id: str) -> Optional[FamilyReadDTO]:
+    def get(
+        db: Session, import_id: str, fields: Optional[set[str]] = None
+    ) -> Optional[FamilyReadDTO]:
         """Gets a single family"""
         ...
 
+    @staticmethod
+    def get_many(
+        db: Session,
+        import_ids: list[str],
+        org_ids: Optional[list[int]],
+        fields: Optional[set[str]] = None,
+    ) -> list[FamilyReadDTO]:
+        """Gets several families"""
+        ...
+
     @staticmethod
     def search(
         db: Session,
@@ -33,6 +47,8 @@ class FamilyRepo(Protocol):
         org_ids: Optional[list[int]],
         geography: Optional[list[str]],
         corpus: Optional[list[str]] = None,
+        include_sub_geographies: bool = False,
+        fields: Optional[set[str]] = None,
     ) -> list[FamilyReadDTO]:
         """Searches the families"""
         ...
@@ -42,9 +58,9 @@ class FamilyRepo(Protocol):
         db: Session,
         import_id: str,
         family: FamilyWriteDTO,
-        geography_ids: list[int],
-        geo_id: Optional[int] = None,
-    ) -> bool:
+        geo_ids: list[int],
+        original: Optional[FamilyReadDTO] = None,
+    ) -> Optional[FamilyReadDTO]:
         """Updates a family"""
         ...
 
@@ -3,9 +3,15 @@ Analytics Service
 
 This layer uses the document, family, and collection repos to handle querying
 the count of available entities.
+
+Summaries are cached in-process per set of org IDs for a short time (see
+ANALYTICS_SUMMARY_TTL) and the cache is cleared by the services that create or
+delete entities. Other worker processes only see such writes once their own
+entries expire.
 """
 
 import logging
+from typing import Optional
 
 from pydantic import ConfigDict, validate_call
 from sqlalchemy import exc
@@ -16,12 +22,27 @@ import app.repository.document as document_repo
 import app.repository.event as event_repo
 import app.repository.family as family_repo
 import app.service.app_user as app_user_service
+from app.cache import TTLCache
+from app.config import ANALYTICS_SUMMARY_TTL
 from app.errors import RepositoryError
 from app.model.analytics import SummaryDTO
 from app.model.user import UserContext
 
 _LOGGER = logging.getLogger(__name__)
 
+_SummaryKey = Optional[tuple[int, ...]]
+
+_summary_cache: TTLCache[_SummaryKey, SummaryDTO] = TTLCache(ANALYTICS_SUMMARY_TTL)
+
+
+def invalidate_summary_cache() -> None:
+    """Drops all cached analytics summaries, called after entity writes."""
+    _summary_cache.clear()
+
+
+def _summary_key(org_ids: Optional[list[int]]) -> _SummaryKey:
+    return None if org_ids is None else tuple(sorted(set(org_ids)))
+
 
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def summary(user: UserContext) -> SummaryDTO:
@@ -31,15 +52,22 @@ def summary(user: UserContext) -> SummaryDTO:
     :param user_email str: The email address of the current user.
     :return SummaryDTO: The analytics summary found.
     """
+    org_ids = app_user_service.restrict_entities_to_user_org(user)
+    key = _summary_key(org_ids)
+
+    if (cached := _summary_cache.get(key)) is not None:
+        return cached
+
     try:
+        # From the primary, as the shared cache would otherwise keep a lagging
+        # replica's counts for every user, the writer included.
         with db_session.get_db() as db:
-            org_ids = app_user_service.restrict_entities_to_user_org(user)
             n_collections = collection_repo.count(db, org_ids)
             n_families = family_repo.count(db, org_ids)
             n_documents = document_repo.count(db, org_ids)
             n_events = event_repo.count(db, org_ids)
 
-            return SummaryDTO(
+            result = SummaryDTO(
                 n_documents=n_documents,
                 n_families=n_families,
                 n_collections=n_collections,
@@ -49,3 +77,6 @@ def summary(user: UserContext) -> SummaryDTO:
     except exc.SQLAlchemyError as e:
         _LOGGER.error(e)
         raise RepositoryError(str(e))
+
+    _summary_cache.set(key, result)
+    return result
@@ -0,0 +1,164 @@
+"""
+Audit sink for authenticated requests.
+
+Every authenticated request leaves an AUDIT record of who did what to which
+entity, along with the body of writes. Building and emitting that log line
+on the request path is comparatively slow, so requests only capture the raw
+body and hand a record to a bounded in-memory queue. A single background
+thread drains the queue into the log.
+
+When the queue is full records are dropped and counted rather than making
+the request wait. The count is reported through the meter given to
+`instrument`. The writer is a daemon thread, so `shutdown` must be called
+before the process exits to write out what is still queued.
+"""
+
+import hashlib
+import logging
+import queue
+import threading
+from typing import NamedTuple, Optional
+
+from db_client.models.organisation.authorisation import AuthOperation
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+
+from app.config import AUDIT_MAX_PAYLOAD, AUDIT_QUEUE_SIZE
+from app.model.authorisation import AuthEndpoint
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.INFO)
+
+
+class AuditRecord(NamedTuple):
+    """What a user did, as captured on the request path."""
+
+    path: str
+    user: str
+    operation: AuthOperation
+    entity: AuthEndpoint
+    payload: Optional[str]
+
+
+_queue: "queue.Queue[AuditRecord]" = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+dropped = 0
+
+
+def capture_payload(body: bytes) -> Optional[str]:
+    """
+    Turns a raw request body into what is kept in the audit record.
+
+    The body is not parsed. Bodies over AUDIT_MAX_PAYLOAD bytes are cut
+    short and tagged with their size and sha256 so they can still be
+    matched against what was stored.
+
+    :param bytes body: The raw request body.
+    :return Optional[str]: The payload to audit, or None if there was none.
+    """
+    if not body:
+        return None
+    if len(body) <= AUDIT_MAX_PAYLOAD:
+        return body.decode("utf-8", errors="replace")
+    digest = hashlib.sha256(body).hexdigest()
+    head = body[:AUDIT_MAX_PAYLOAD].decode("utf-8", errors="ignore")
+    return f"{head}... [truncated {len(body)} bytes, sha256={digest}]"
+
+
+def submit(record: AuditRecord) -> None:
+    """
+    Queues a record for the background writer without blocking.
+
+    :param AuditRecord record: The record to write.
+    """
+    global dropped
+    _ensure_writer()
+    try:
+        _queue.put_nowait(record)
+    except queue.Full:
+        dropped += 1
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Waits until every queued record has been written.
+
+    :param Optional[float] timeout: The most seconds to wait, forever if None.
+    :return bool: Whether the queue was drained in time.
+    """
+    done = threading.Event()
+
+    def _join() -> None:
+        _queue.join()
+        done.set()
+
+    threading.Thread(target=_join, daemon=True).start()
+    return done.wait(timeout)
+
+
+def shutdown(timeout: float) -> None:
+    """
+    Writes out queued records before the process exits.
+
+    Logs any records lost: those still queued after the timeout and those
+    dropped while the queue was full.
+
+    :param float timeout: The most seconds to wait for the queue to drain.
+    """
+    if not flush(timeout):
+        _LOGGER.error(
+            f"{_queue.qsize()} audit records were still queued at shutdown "
+            "and have been lost"
+        )
+    if dropped:
+        _LOGGER.warning(f"{dropped} audit records were dropped as the queue was full")
+
+
+def instrument(meter: Meter) -> None:
+    """
+    Reports the number of dropped records through the given meter.
+
+    :param Meter meter: The meter to report through.
+    """
+
+    def _dropped(_: CallbackOptions) -> list[Observation]:
+        return [Observation(dropped)]
+
+    meter.create_observable_counter(
+        "audit.dropped",
+        callbacks=[_dropped],
+        unit="{record}",
+        description="Audit records dropped because the queue was full",
+    )
+
+
+def _ensure_writer() -> None:
+    # Started on first use, so no thread exists before uvicorn forks workers.
+    global _writer
+    if _writer is not None and _writer.is_alive():
+        return
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_write, name="audit", daemon=True)
+            _writer.start()
+
+
+def _write() -> None:
+    while True:
+        record = _queue.get()
+        try:
+            _LOGGER.info(
+                f"AUDIT: {record.user} is performing {record.operation} "
+                f"on {record.entity}",
+                extra={
+                    "props": {
+                        "request": record.path,
+                        "user": record.user,
+                        "op": record.operation,
+                        "entity": record.entity,
+                        "payload": record.payload or "null",
+                    }
+                },
+            )
+        finally:
+            _queue.task_done()
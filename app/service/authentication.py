@@ -1,16 +1,24 @@
+import asyncio
 import logging
-from typing import cast
+from concurrent.futures import ThreadPoolExecutor
 
 from passlib.context import CryptContext
-from sqlalchemy.exc import NoResultFound
 
 import app.clients.db.session as db_session
 import app.service.token as token_service
+from app.config import LOGIN_CONCURRENCY
 from app.errors import AuthenticationError, RepositoryError
+from app.model.user import UserLogin
 from app.repository import app_user_repo
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Password checks run here, capped at LOGIN_CONCURRENCY, so a burst of logins
+# queues for a slot instead of tying up the DB threads or the event loop.
+_password_executor = ThreadPoolExecutor(
+    max_workers=LOGIN_CONCURRENCY, thread_name_prefix="bcrypt"
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -35,51 +43,94 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def authenticate_user(email: str, password: str) -> str:
+def load_user_login(email: str) -> UserLogin:
     """
-    Authenticates a user and returns a JWT token.
+    Loads a user who may log in.
 
     :param str email: The user's email.
-    :param str password: The user's password.
     :raises RepositoryError: Raised when the user is not found.
-    :raises AuthenticationError: Raised when password does not match.
-    :return str: The JWT token.
+    :raises AuthenticationError: Raised when the user is not active.
+    :return UserLogin: The user's login details.
     """
-
     with db_session.get_db() as db:
-        try:
-            user = app_user_repo.get_user_by_email(db, email)
-        except NoResultFound:
-            user = None
+        login = app_user_repo.get_user_login(db, email)
+
+    if login is None:
+        _LOGGER.error(f"Failed login attempt, user not found for {email}")
+        raise RepositoryError(f"User not found for {email}")
+    if not login.is_active:
+        _LOGGER.error(f"Failed login attempt as inactive for {email}")
+        raise AuthenticationError(f"User {email} is marked as not active.")
+    return login
 
-        if user is None:
-            _LOGGER.error(f"Failed login attempt, user not found for {email}")
-            raise RepositoryError(f"User not found for {email}")
-        if not app_user_repo.is_active(db, email):
-            _LOGGER.error(f"Failed login attempt as inactive for {email}")
-            raise AuthenticationError(f"User {email} is marked as not active.")
 
-        hash = str(user.hashed_password)
-        if len(hash) == 0 or not verify_password(password, hash):
-            _LOGGER.error(f"Failed login attempt for password mismatch for {email}")
-            raise AuthenticationError(f"Could not verify password for {email}")
+def check_password(login: UserLogin, password: str) -> None:
+    """
+    Checks the password against the user's stored hash.
 
-        app_user_links = app_user_repo.get_app_user_authorisation(db, user)
+    :param UserLogin login: The user's login details.
+    :param str password: The password given.
+    :raises AuthenticationError: Raised when password does not match.
+    """
+    hash = login.hashed_password
+    if len(hash) == 0 or not verify_password(password, hash):
+        _LOGGER.error(f"Failed login attempt for password mismatch for {login.email}")
+        raise AuthenticationError(f"Could not verify password for {login.email}")
 
-    if not app_user_links:
-        _LOGGER.error(f"Failed login attempt, no orgs found for {email}")
-        raise RepositoryError(f"Organisation not found for {email}")
+
+def issue_token(login: UserLogin) -> str:
+    """
+    Encodes a JWT token for a user who has logged in.
+
+    :param UserLogin login: The user's login details.
+    :raises RepositoryError: Raised when the user has no organisations.
+    :return str: The JWT token.
+    """
+    if not login.organisations:
+        _LOGGER.error(f"Failed login attempt, no orgs found for {login.email}")
+        raise RepositoryError(f"Organisation not found for {login.email}")
 
     authorisation = {
-        cast(str, org.name): {
-            "is_admin": cast(bool, org_user.is_admin),
-            "org_id": cast(int, org.id),
-        }
-        for org_user, org in app_user_links
+        org.name: {"is_admin": org.is_admin, "org_id": org.id}
+        for org in login.organisations
     }
-
-    org_ids = [cast(int, org.id) for _, org in app_user_links]
+    org_ids = [org.id for org in login.organisations]
 
     return token_service.encode(
-        email, cast(bool, user.is_superuser), authorisation, org_ids=org_ids
+        login.email, login.is_superuser, authorisation, org_ids=org_ids
+    )
+
+
+def authenticate_user(email: str, password: str) -> str:
+    """
+    Authenticates a user and returns a JWT token.
+
+    :param str email: The user's email.
+    :param str password: The user's password.
+    :raises RepositoryError: Raised when the user is not found.
+    :raises AuthenticationError: Raised when password does not match.
+    :return str: The JWT token.
+    """
+    login = load_user_login(email)
+    _password_executor.submit(check_password, login, password).result()
+    return issue_token(login)
+
+
+async def authenticate_user_async(email: str, password: str) -> str:
+    """
+    Authenticates a user without blocking the event loop.
+
+    The user is loaded on the DB thread pool and the password is checked
+    on the password pool, so neither holds the other up.
+
+    :param str email: The user's email.
+    :param str password: The user's password.
+    :raises RepositoryError: Raised when the user is not found.
+    :raises AuthenticationError: Raised when password does not match.
+    :return str: The JWT token.
+    """
+    login = await db_session.run_blocking(load_user_login, email)
+    await asyncio.get_running_loop().run_in_executor(
+        _password_executor, check_password, login, password
     )
+    return issue_token(login)
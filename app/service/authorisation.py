@@ -1,10 +1,13 @@
 import logging
+from typing import Iterable, NamedTuple, Optional
 
 from db_client.models.organisation.authorisation import (
     HTTP_MAP_TO_OPERATION,
     AuthAccess,
     AuthOperation,
 )
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
 
 from app.errors import AuthorisationError
 from app.model.authorisation import AUTH_TABLE, AuthEndpoint
@@ -13,6 +16,18 @@ from app.model.user import UserContext
 _LOGGER = logging.getLogger(__name__)
 
 
+class RouteAccess(NamedTuple):
+    """What a route does and the access it needs."""
+
+    entity: AuthEndpoint
+    operation: AuthOperation
+    required_access: AuthAccess
+
+
+# (route template, HTTP method) -> access, see `compile_route_access`
+_ROUTE_ACCESS: dict[tuple[str, str], RouteAccess] = {}
+
+
 def http_method_to_operation(method: str) -> AuthOperation:
     """
     Converts from a HTTP method to an AuthOperation
@@ -40,6 +55,49 @@ def path_to_endpoint(path: str) -> AuthEndpoint:
     raise AuthorisationError(f"Cannot get entity from path {path}")
 
 
+def compile_route_access(routes: Iterable[BaseRoute]) -> None:
+    """
+    Builds the authorisation table for the app's routes.
+
+    Called once at startup, after every router is included, so that
+    per-request authorisation is a lookup on the matched route rather than
+    parsing the path each time. Routes whose path names no entity (e.g. the
+    login and health routes) are left out.
+
+    :param Iterable[BaseRoute] routes: The app's routes.
+    """
+    _ROUTE_ACCESS.clear()
+    for route in routes:
+        if not isinstance(route, APIRoute):
+            continue
+        try:
+            entity = path_to_endpoint(route.path)
+        except AuthorisationError:
+            continue
+        for method in route.methods:
+            if method in HTTP_MAP_TO_OPERATION:
+                operation = HTTP_MAP_TO_OPERATION[method]
+                _ROUTE_ACCESS[(route.path, method)] = RouteAccess(
+                    entity, operation, AUTH_TABLE[entity][operation]
+                )
+
+
+def get_route_access(route_path: Optional[str], method: str) -> RouteAccess:
+    """
+    Gets the entity, operation and required access for a request.
+
+    :param Optional[str] route_path: The template of the matched route,
+        e.g. "/api/v1/families/{import_id}".
+    :param str method: The HTTP method.
+    :raises AuthorisationError: Raised if the route is not in the table.
+    :return RouteAccess: What the route does and the access it needs.
+    """
+    access = _ROUTE_ACCESS.get((route_path or "", method))
+    if access is None:
+        raise AuthorisationError(f"No authorisation for {method} {route_path}")
+    return access
+
+
 def _has_access(required_access: AuthAccess, user_access: AuthAccess) -> bool:
     if user_access == AuthAccess.SUPER:
         return True
@@ -64,8 +122,14 @@ def _get_user_access(user: UserContext) -> AuthAccess:
     return AuthAccess.USER
 
 
-def is_authorised(user: UserContext, entity: AuthEndpoint, op: AuthOperation) -> None:
-    required_access = AUTH_TABLE[entity][op]
+def is_authorised(
+    user: UserContext,
+    entity: AuthEndpoint,
+    op: AuthOperation,
+    required_access: Optional[AuthAccess] = None,
+) -> None:
+    if required_access is None:
+        required_access = AUTH_TABLE[entity][op]
 
     if _has_access(required_access, _get_user_access(user)):
         return
@@ -23,6 +23,8 @@ import app.repository.collection as collection_repository
 import app.repository.document as document_repository
 import app.repository.event as event_repository
 import app.repository.family as family_repository
+import app.service.analytics as analytics
+import app.service.collection as collection
 import app.service.corpus as corpus
 import app.service.geography as geography
 import app.service.notification as notification_service
@@ -244,6 +246,15 @@ def save_families(
     org_id = corpus.get_corpus_org_id(corpus_import_id)
     total_families_saved = 0
 
+    # Check every linked collection exists and belongs to the corpus'
+    # organisation up front, in one query for the whole batch.
+    linked_collections = {c for fam in family_data for c in fam.get("collections", [])}
+    collection_orgs = collection.get_orgs(db, linked_collections)
+    if any(coll_org_id != org_id for coll_org_id in collection_orgs.values()):
+        raise ValidationError(
+            "Organisation mismatch between some collections and the corpus"
+        )
+
     for fam in family_data:
         import_id = fam["import_id"]
         existing_family = family_repository.get(db, import_id)
@@ -496,6 +507,7 @@ def import_data(
                 )
 
             db.commit()
+            analytics.invalidate_summary_cache()
 
             if any([collection_data, family_data, document_data, event_data]):
                 import_uuid = uuid4()
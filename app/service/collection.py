@@ -21,7 +21,7 @@ from app.model.collection import (
 )
 from app.model.user import UserContext
 from app.repository import collection_repo
-from app.service import app_user, id
+from app.service import analytics, app_user, id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,6 +46,29 @@ def get(import_id: str) -> Optional[CollectionReadDTO]:
         raise RepositoryError(msg)
 
 
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def get_many(import_ids: list[str], user: UserContext) -> list[CollectionReadDTO]:
+    """
+    Gets several collections given their import_ids, in one query.
+
+    :param list[str] import_ids: The import_ids of the collections to get.
+    :param UserContext user: The current user context.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should any import_id be invalid or
+        too many be requested.
+    :return list[CollectionReadDTO]: The collections found, in the requested order.
+    """
+    import_ids = id.validate_batch(import_ids)
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return collection_repo.get_many(db, import_ids, org_ids)
+    except exc.SQLAlchemyError as e:
+        msg = f"Error when getting collections {import_ids}: {e}"
+        _LOGGER.exception(msg)
+        raise RepositoryError(msg)
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def all(user: UserContext) -> list[CollectionReadDTO]:
     """
@@ -55,7 +78,7 @@ def all(user: UserContext) -> list[CollectionReadDTO]:
     :return list[CollectionDTO]: The list of collections.
     """
     try:
-        with db_session.get_db() as db:
+        with db_session.get_read_db() as db:
             org_ids = app_user.restrict_entities_to_user_org(user)
             return collection_repo.all(db, org_ids)
     except exc.SQLAlchemyError as e:
@@ -64,6 +87,44 @@ def all(user: UserContext) -> list[CollectionReadDTO]:
         raise RepositoryError(msg)
 
 
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def version(user: UserContext) -> tuple:
+    """
+    Gets a cheap fingerprint of the collections visible to the user.
+
+    :param UserContext user: The current user context.
+    :raises RepositoryError: raised on a database error.
+    :return tuple: A value that changes whenever any of the collections do.
+    """
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return collection_repo.version(db, org_ids)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def entity_version(import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single collection.
+
+    :param str import_id: The import_id of the collection.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should the import_id be invalid.
+    :return Optional[tuple]: A value that changes whenever the collection
+        does, or None if it does not exist.
+    """
+    validate_import_id(import_id)
+    try:
+        with db_session.get_db() as db:
+            return collection_repo.entity_version(db, import_id)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def search(
     search_params: dict[str, Union[str, int]], user: UserContext
@@ -81,7 +142,7 @@ def search(
     :return list[CollectionReadDTO]: The list of collections matching
         the given search terms.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
         return collection_repo.search(db, search_params, org_ids)
 
@@ -124,6 +185,22 @@ def validate(import_ids: set[str], db: Optional[Session]) -> None:
         raise ValidationError("One or more of the collections to update does not exist")
 
 
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def get_orgs(db: Session, import_ids: set[str]) -> dict[str, int]:
+    """
+    Gets the owning organisation of each collection, in a single query.
+
+    :param Session db: The database session.
+    :param set[str] import_ids: A set of import ids to look up.
+    :raises ValidationError: raised if any of the import_ids don't exist.
+    :return dict[str, int]: The organisation id of each collection.
+    """
+    orgs = collection_repo.collection_orgs(db, import_ids)
+    if len(orgs) != len(import_ids):
+        raise ValidationError("One or more of the collections to update does not exist")
+    return orgs
+
+
 @db_session.with_database()
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def update(
@@ -196,6 +273,7 @@ def create(
         raise e
     finally:
         db.commit()
+        analytics.invalidate_summary_cache()
 
 
 @db_session.with_database()
@@ -221,6 +299,7 @@ def delete(import_id: str, db: Optional[Session] = None) -> bool:
         db.begin_nested()
         if result := collection_repo.delete(db, import_id):
             db.commit()
+            analytics.invalidate_summary_cache()
         else:
             db.rollback()
         return result
@@ -1,17 +1,86 @@
+"""
+Config Service
+
+The config payload changes rarely (corpora, corpus types, organisations and
+reference tables), so it is built once per org set and kept in-process as
+serialised JSON. Services that write any of those clear it via
+`invalidate_cache`.
+"""
+
+import hashlib
 import logging
+from typing import NamedTuple, Optional
 
 from pydantic import ConfigDict, validate_call
 from sqlalchemy import exc
 
 import app.clients.db.session as db_session
 import app.repository.config as config_repo
+import app.service.geography as geography_service
+from app.cache import TTLCache
+from app.config import CONFIG_CACHE_TTL
 from app.errors import RepositoryError
-from app.model.config import ConfigReadDTO
+from app.model.config import (
+    CompactConfigReadDTO,
+    CompactCorpusData,
+    ConfigReadDTO,
+    CorpusTypeConfig,
+)
 from app.model.user import UserContext
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class SerialisedConfig(NamedTuple):
+    """A config payload ready to send, with a digest of its content."""
+
+    payload: bytes
+    digest: str
+
+
+_ConfigKey = tuple[Optional[tuple[int, ...]], bool]
+
+_config_cache: TTLCache[_ConfigKey, SerialisedConfig] = TTLCache(CONFIG_CACHE_TTL)
+
+
+def invalidate_cache() -> None:
+    """Drops every cached config payload, called after config data changes."""
+    _config_cache.clear()
+
+
+def _config_key(user: UserContext, compact: bool) -> _ConfigKey:
+    org_ids = None if user.is_superuser else tuple(sorted(set(user.org_ids)))
+    return org_ids, compact
+
+
+def _to_compact(config: ConfigReadDTO) -> CompactConfigReadDTO:
+    corpus_types: dict[str, CorpusTypeConfig] = {}
+    for corpus in config.corpora:
+        if corpus.corpus_type not in corpus_types:
+            corpus_types[corpus.corpus_type] = CorpusTypeConfig(
+                name=corpus.corpus_type,
+                description=corpus.corpus_type_description,
+                taxonomy=corpus.taxonomy,
+            )
+
+    return CompactConfigReadDTO(
+        geographies=config.geographies,
+        corpora=[
+            CompactCorpusData(
+                corpus_import_id=corpus.corpus_import_id,
+                title=corpus.title,
+                description=corpus.description,
+                corpus_type=corpus.corpus_type,
+                organisation=corpus.organisation,
+            )
+            for corpus in config.corpora
+        ],
+        corpus_types=list(corpus_types.values()),
+        languages=config.languages,
+        document=config.document,
+    )
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def get(user: UserContext) -> ConfigReadDTO:
     """
@@ -21,10 +90,39 @@ def get(user: UserContext) -> ConfigReadDTO:
     :return ConfigReadDTO: The config for the application
     """
     try:
+        # Read from the primary: the result fills a cache shared by every user
+        # of the org set, so a lagging replica would hide a write from all of
+        # them, the writer included, until the cache expires.
         with db_session.get_db() as db:
-            return config_repo.get(db, user)
+            geographies = geography_service.get_tree(db).region_dicts()
+            return config_repo.get(db, user, geographies)
 
     except exc.SQLAlchemyError as e:
         msg = f"Error while getting config: {e}"
         _LOGGER.exception(msg)
         raise RepositoryError(msg)
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def get_serialised(user: UserContext, compact: bool = False) -> SerialisedConfig:
+    """
+    Gets the config as JSON, from memory when possible.
+
+    :param UserContext user: The current user context.
+    :param bool compact: Return the CompactConfigReadDTO shape, where each
+        corpus type's taxonomy appears once rather than in every corpus.
+    :raises RepositoryError: If there is an issue getting the config
+    :return SerialisedConfig: The JSON payload and its digest.
+    """
+    key = _config_key(user, compact)
+    if (cached := _config_cache.get(key)) is not None:
+        return cached
+
+    config = get(user)
+    payload = (_to_compact(config) if compact else config).model_dump_json().encode()
+    serialised = SerialisedConfig(
+        payload=payload,
+        digest=hashlib.sha1(payload, usedforsecurity=False).hexdigest(),
+    )
+    _config_cache.set(key, serialised)
+    return serialised
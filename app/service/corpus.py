@@ -8,7 +8,8 @@ from sqlalchemy.orm import Session
 
 import app.clients.db.session as db_session
 import app.repository.corpus as corpus_repo
-import app.repository.organisation as org_repo
+import app.service.config as config_service
+import app.service.registry as registry
 from app.clients.aws.client import get_s3_client
 from app.clients.aws.s3bucket import get_upload_details
 from app.errors import ConflictError, RepositoryError, ValidationError
@@ -37,7 +38,7 @@ def get_corpus_org_id(corpus_import_id: str, db: Optional[Session] = None) -> in
         with db_session.get_db() as session:
             return get_corpus_org_id(corpus_import_id, session)
 
-    org_id = corpus_repo.get_corpus_org_id(db, corpus_import_id)
+    org_id = registry.corpus_org_id(db, corpus_import_id)
     if org_id is None:
         msg = f"No organisation associated with corpus {corpus_import_id}"
         _LOGGER.error(msg)
@@ -55,7 +56,7 @@ def validate(db: Session, corpus_import_id: str) -> bool:
     :return bool: Return whether or not the corpus exists in the DB.
     """
     try:
-        if corpus_repo.verify_corpus_exists(db, corpus_import_id):
+        if registry.corpus_exists(db, corpus_import_id):
             return True
 
     except Exception as e:
@@ -79,11 +80,7 @@ def validate_list(db: Session, corpus_import_ids: list[str]) -> bool:
     :return bool: Return whether or not all the corpus exists in the DB.
     """
     try:
-        missing_ids = [
-            import_id
-            for import_id in corpus_import_ids
-            if not corpus_repo.verify_corpus_exists(db, import_id)
-        ]
+        missing_ids = registry.missing_corpora(db, corpus_import_ids)
         if missing_ids:
             _LOGGER.debug(f"Missing corpus IDs: {missing_ids}")
             return False
@@ -109,10 +106,7 @@ def validate_import_id(import_id: str, db: Optional[Session] = None) -> None:
 
     # Validate the first part contains either the org name or type.
     id_parts = import_id.split(".")
-    if (
-        id_parts[0] not in org_repo.get_distinct_org_options(db)
-        or id_parts[1] != "corpus"
-    ):
+    if id_parts[1] != "corpus" or not registry.is_org_option(db, id_parts[0]):
         raise ValidationError(f"The import id {import_id} is invalid!")
 
 
@@ -207,6 +201,8 @@ def update(
     try:
         if corpus_repo.update(db, import_id, corpus):
             db.commit()
+            config_service.invalidate_cache()
+            registry.invalidate()
         else:
             db.rollback()
     except Exception as e:
@@ -241,7 +237,7 @@ def create(
         raise ValidationError("Invalid corpus type name")
 
     # Check that the organisation ID exists in the database.
-    if org_repo.get_name_from_id(db, corpus.organisation_id) is None:
+    if registry.org_name_from_id(db, corpus.organisation_id) is None:
         raise ValidationError("Invalid organisation")
 
     if corpus.import_id is not None:
@@ -261,6 +257,8 @@ def create(
         raise e
     finally:
         db.commit()
+        config_service.invalidate_cache()
+        registry.invalidate()
 
 
 @db_session.with_database()
@@ -4,6 +4,7 @@ from pydantic import ConfigDict, validate_call
 from sqlalchemy.orm import Session
 
 import app.clients.db.session as db_session
+import app.service.config as config_service
 from app.errors import ValidationError
 from app.model.corpus_type import CorpusTypeCreateDTO, CorpusTypeReadDTO
 from app.model.user import UserContext
@@ -81,3 +82,4 @@ def create(corpus_type: CorpusTypeCreateDTO, db: Optional[Session] = None) -> st
         raise e
     finally:
         db.commit()
+        config_service.invalidate_cache()
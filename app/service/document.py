@@ -17,7 +17,7 @@ from app.clients.aws.client import get_s3_client
 from app.errors import RepositoryError, ValidationError
 from app.model.document import DocumentCreateDTO, DocumentReadDTO, DocumentWriteDTO
 from app.model.user import UserContext
-from app.service import app_user, id
+from app.service import analytics, app_user, id
 from app.telemetry import observe
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,11 +43,13 @@ def get_upload_details(
 
 @observe(name="get_document")
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-def get(import_id: str) -> Optional[DocumentReadDTO]:
+def get(import_id: str, fields: Optional[set[str]] = None) -> Optional[DocumentReadDTO]:
     """
     Gets a document given the import_id.
 
     :param str import_id: The import_id to use to get the document.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
     :raises RepositoryError: raised on a database error.
     :raises ValidationError: raised should the import_id be invalid.
     :return Optional[documentDTO]: The document found or None.
@@ -55,7 +57,34 @@ def get(import_id: str) -> Optional[DocumentReadDTO]:
     validate_import_id(import_id)
     try:
         with db_session.get_db() as db:
-            return document_repo.get(db, import_id)
+            return document_repo.get(db, import_id, fields)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
+@observe(name="get_many_documents")
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def get_many(
+    import_ids: list[str], user: UserContext, fields: Optional[set[str]] = None
+) -> list[DocumentReadDTO]:
+    """
+    Gets several documents given their import_ids, in one query.
+
+    :param list[str] import_ids: The import_ids of the documents to get.
+    :param UserContext user: The current user context.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should any import_id be invalid or
+        too many be requested.
+    :return list[DocumentReadDTO]: The documents found, in the requested order.
+    """
+    import_ids = id.validate_batch(import_ids)
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return document_repo.get_many(db, import_ids, org_ids, fields)
     except exc.SQLAlchemyError as e:
         _LOGGER.error(e)
         raise RepositoryError(str(e))
@@ -63,22 +92,64 @@ def get(import_id: str) -> Optional[DocumentReadDTO]:
 
 @observe(name="get_all_documents")
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-def all(user: UserContext) -> list[DocumentReadDTO]:
+def all(user: UserContext, fields: Optional[set[str]] = None) -> list[DocumentReadDTO]:
     """
     Gets the entire list of documents from the repository.
 
     :param UserContext user: The current user context.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
     :return list[documentDTO]: The list of documents.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
-        return document_repo.all(db, org_ids)
+        return document_repo.all(db, org_ids, fields)
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def version(user: UserContext) -> tuple:
+    """
+    Gets a cheap fingerprint of the documents visible to the user.
+
+    :param UserContext user: The current user context.
+    :raises RepositoryError: raised on a database error.
+    :return tuple: A value that changes whenever any of the documents do.
+    """
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return document_repo.version(db, org_ids)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def entity_version(import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single document.
+
+    :param str import_id: The import_id of the document.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should the import_id be invalid.
+    :return Optional[tuple]: A value that changes whenever the document
+        does, or None if it does not exist.
+    """
+    validate_import_id(import_id)
+    try:
+        with db_session.get_db() as db:
+            return document_repo.entity_version(db, import_id)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
 
 
 @observe(name="search_documents")
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def search(
-    search_params: dict[str, Union[str, int]], user: UserContext
+    search_params: dict[str, Union[str, int]],
+    user: UserContext,
+    fields: Optional[set[str]] = None,
 ) -> list[DocumentReadDTO]:
     """
     Searches for the search term against documents on specified fields.
@@ -89,12 +160,14 @@ def search(
     :param dict search_params: Search patterns to match against specified
         fields, given as key value pairs in a dictionary.
     :param UserContext user: The current user context.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        DocumentReadDTO fields are populated. None populates all of them.
     :return list[DocumentReadDTO]: The list of documents matching the
         given search terms.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
-        return document_repo.search(db, search_params, org_ids)
+        return document_repo.search(db, search_params, org_ids, fields)
 
 
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
@@ -221,6 +294,7 @@ def create(
             db.rollback()
         else:
             db.commit()
+            analytics.invalidate_summary_cache()
         return import_id
     except Exception as e:
         db.rollback()
@@ -260,6 +334,7 @@ def delete(
     try:
         if result := document_repo.delete(db, import_id):
             db.commit()
+            analytics.invalidate_summary_cache()
         else:
             db.rollback()
 
@@ -13,7 +13,7 @@ import app.service.family as family_service
 from app.errors import RepositoryError, ValidationError
 from app.model.event import EventCreateDTO, EventReadDTO, EventWriteDTO
 from app.model.user import UserContext
-from app.service import app_user, id
+from app.service import analytics, app_user, id
 from app.service import metadata as metadata_service
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,6 +38,28 @@ def get(import_id: str) -> Optional[EventReadDTO]:
         raise RepositoryError(str(e))
 
 
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def get_many(import_ids: list[str], user: UserContext) -> list[EventReadDTO]:
+    """
+    Gets several family events given their import_ids, in one query.
+
+    :param list[str] import_ids: The import_ids of the family events to get.
+    :param UserContext user: The current user context.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should any import_id be invalid or
+        too many be requested.
+    :return list[EventReadDTO]: The family events found, in the requested order.
+    """
+    import_ids = id.validate_batch(import_ids)
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return event_repo.get_many(db, import_ids, org_ids)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def all(user: UserContext) -> list[EventReadDTO]:
     """
@@ -46,11 +68,49 @@ def all(user: UserContext) -> list[EventReadDTO]:
     :param UserContext user: The current user context.
     :return list[EventReadDTO]: The list of family events.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
         return event_repo.all(db, org_ids)
 
 
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def version(user: UserContext) -> tuple:
+    """
+    Gets a cheap fingerprint of the events visible to the user.
+
+    :param UserContext user: The current user context.
+    :raises RepositoryError: raised on a database error.
+    :return tuple: A value that changes whenever any of the events do.
+    """
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return event_repo.version(db, org_ids)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def entity_version(import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single event.
+
+    :param str import_id: The import_id of the event.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should the import_id be invalid.
+    :return Optional[tuple]: A value that changes whenever the event
+        does, or None if it does not exist.
+    """
+    validate_import_id(import_id)
+    try:
+        with db_session.get_db() as db:
+            return event_repo.entity_version(db, import_id)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def search(
     search_params: dict[str, Union[str, int]], user: UserContext
@@ -68,7 +128,7 @@ def search(
     :return list[EventReadDTO]: The list of events matching the given
         search terms.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
         return event_repo.search(db, search_params, org_ids)
 
@@ -143,6 +203,7 @@ def create(
         raise e
     finally:
         db.commit()
+        analytics.invalidate_summary_cache()
 
 
 @db_session.with_database()
@@ -240,6 +301,7 @@ def delete(import_id: str, user: UserContext, db: Optional[Session] = None) -> b
         db.begin_nested()
         if result := event_repo.delete(db, import_id):
             db.commit()
+            analytics.invalidate_summary_cache()
         else:
             db.rollback()
         return result
@@ -252,7 +314,7 @@ def delete(import_id: str, user: UserContext, db: Optional[Session] = None) -> b
 
 def get_org_from_id(db: Session, import_id: str, is_create: bool = False) -> int:
     if not is_create:
-        org = event_repo.get_org_from_import_id(db, import_id)
+        org = event_repo.org_id_for_event(db, import_id)
     else:
         org = family_repo.get_organisation(db, import_id)
 
@@ -17,6 +17,7 @@ from app.model.family import FamilyCreateDTO, FamilyReadDTO, FamilyWriteDTO
 from app.model.user import UserContext
 from app.repository import family_repo
 from app.service import (
+    analytics,
     app_user,
     category,
     collection,
@@ -33,11 +34,13 @@ _LOGGER = logging.getLogger(__name__)
 
 @observe(name="get_family")
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-def get(import_id: str) -> Optional[FamilyReadDTO]:
+def get(import_id: str, fields: Optional[set[str]] = None) -> Optional[FamilyReadDTO]:
     """
     Gets a family given the import_id.
 
     :param str import_id: The import_id to use to get the family.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
     :raises RepositoryError: raised on a database error.
     :raises ValidationError: raised should the import_id be invalid.
     :return Optional[FamilyDTO]: The family found or None.
@@ -45,7 +48,34 @@ def get(import_id: str) -> Optional[FamilyReadDTO]:
     validate_import_id(import_id)
     try:
         with db_session.get_db() as db:
-            return family_repo.get(db, import_id)
+            return family_repo.get(db, import_id, fields)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
+@observe(name="get_many_families")
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def get_many(
+    import_ids: list[str], user: UserContext, fields: Optional[set[str]] = None
+) -> list[FamilyReadDTO]:
+    """
+    Gets several families given their import_ids, in one query.
+
+    :param list[str] import_ids: The import_ids of the families to get.
+    :param UserContext user: The current user context.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should any import_id be invalid or
+        too many be requested.
+    :return list[FamilyReadDTO]: The families found, in the requested order.
+    """
+    import_ids = id.validate_batch(import_ids)
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return family_repo.get_many(db, import_ids, org_ids, fields)
     except exc.SQLAlchemyError as e:
         _LOGGER.error(e)
         raise RepositoryError(str(e))
@@ -53,16 +83,56 @@ def get(import_id: str) -> Optional[FamilyReadDTO]:
 
 @observe(name="get_all_families")
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-def all(user: UserContext) -> list[FamilyReadDTO]:
+def all(user: UserContext, fields: Optional[set[str]] = None) -> list[FamilyReadDTO]:
     """
     Gets the entire list of families from the repository.
 
     :param UserContext user: The current user context.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
     :return list[FamilyDTO]: The list of families.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
-        return family_repo.all(db, org_ids)
+        return family_repo.all(db, org_ids, fields)
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def version(user: UserContext) -> tuple:
+    """
+    Gets a cheap fingerprint of the families visible to the user.
+
+    :param UserContext user: The current user context.
+    :raises RepositoryError: raised on a database error.
+    :return tuple: A value that changes whenever any of the families do.
+    """
+    try:
+        with db_session.get_read_db() as db:
+            org_ids = app_user.restrict_entities_to_user_org(user)
+            return family_repo.version(db, org_ids)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def entity_version(import_id: str) -> Optional[tuple]:
+    """
+    Gets a cheap fingerprint of a single family.
+
+    :param str import_id: The import_id of the family.
+    :raises RepositoryError: raised on a database error.
+    :raises ValidationError: raised should the import_id be invalid.
+    :return Optional[tuple]: A value that changes whenever the family
+        does, or None if it does not exist.
+    """
+    validate_import_id(import_id)
+    try:
+        with db_session.get_db() as db:
+            return family_repo.entity_version(db, import_id)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
 
 
 @observe(name="search_families")
@@ -72,6 +142,8 @@ def search(
     user: UserContext,
     geography: Optional[list[str]] = None,
     corpus: Optional[list[str]] = None,
+    include_sub_geographies: bool = False,
+    fields: Optional[set[str]] = None,
 ) -> list[FamilyReadDTO]:
     """
     Searches for the search term against families on specified fields.
@@ -85,12 +157,24 @@ def search(
     :param UserContext user: The current user context.
     :param Optional[list[str]] geography: geographies to filter on.
     :param Optional[list[str]] corpus: corpus import IDs to filter on.
+    :param bool include_sub_geographies: whether to also match families
+        in descendants of the given geographies.
+    :param Optional[set[str]] fields: a sparse fieldset, only these
+        FamilyReadDTO fields are populated. None populates all of them.
     :return list[FamilyDTO]: The list of families matching the given
         search terms.
     """
-    with db_session.get_db() as db:
+    with db_session.get_read_db() as db:
         org_ids = app_user.restrict_entities_to_user_org(user)
-        return family_repo.search(db, search_params, org_ids, geography, corpus)
+        return family_repo.search(
+            db,
+            search_params,
+            org_ids,
+            geography,
+            corpus,
+            include_sub_geographies,
+            fields,
+        )
 
 
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
@@ -133,8 +217,13 @@ def update(
     # Validate import_id
     validate_import_id(import_id)
 
-    # Get family we're going to update
-    family = get(import_id)
+    # Get family we're going to update, in this session so the repo can diff
+    # against it rather than reading it again.
+    try:
+        family = family_repo.get(db, import_id)
+    except exc.SQLAlchemyError as e:
+        _LOGGER.error(e)
+        raise RepositoryError(str(e))
     if family is None:
         return None
 
@@ -157,30 +246,24 @@ def update(
     # the current user and are in a valid format.
     all_cols_to_modify = set(family.collections).union(set(family_dto.collections))
     collection.validate_multiple_ids(all_cols_to_modify)
-    collection.validate(all_cols_to_modify, db)
-
-    collections_not_in_user_org = [
-        collection.get_org_from_id(db, c) != entity_org_id for c in all_cols_to_modify
-    ]
-    if len(collections_not_in_user_org) > 0 and any(collections_not_in_user_org):
+    collection_orgs = collection.get_orgs(db, all_cols_to_modify)
+    if any(org_id != entity_org_id for org_id in collection_orgs.values()):
         msg = "Organisation mismatch between some collections and the current user"
         _LOGGER.error(msg)
         raise ValidationError(msg)
 
     try:
-        if family_repo.update(
-            db,
-            import_id,
-            family_dto,
-            geography_ids,
-        ):
+        updated = family_repo.update(
+            db, import_id, family_dto, geography_ids, original=family
+        )
+        if updated is not None:
             db.commit()
         else:
             db.rollback()
     except Exception as e:
         db.rollback()
         raise e
-    return get(import_id)
+    return updated
 
 
 @observe(name="create_family")
@@ -220,14 +303,11 @@ def create(
     # Validate collection ids.
     collections = set(family.collections)
     collection.validate_multiple_ids(collections)
-    collection.validate(collections, db)
+    collection_orgs = collection.get_orgs(db, collections)
 
     # Validate that the collections we want to update are from the same organisation as
     # the current user.
-    collections_not_in_user_org = [
-        collection.get_org_from_id(db, c) != entity_org_id for c in collections
-    ]
-    if len(collections_not_in_user_org) > 0 and any(collections_not_in_user_org):
+    if any(org_id != entity_org_id for org_id in collection_orgs.values()):
         msg = "Organisation mismatch between some collections and the current user"
         _LOGGER.error(msg)
         raise AuthorisationError(msg)
@@ -251,6 +331,7 @@ def create(
         raise e
     finally:
         db.commit()
+        analytics.invalidate_summary_cache()
 
 
 @observe(name="delete_family")
@@ -288,6 +369,7 @@ def delete(
     try:
         if result := family_repo.delete(db, import_id):
             db.commit()
+            analytics.invalidate_summary_cache()
         else:
             db.rollback()
         return result
@@ -1,8 +1,143 @@
+"""
+Geography Service
+
+The geography table is reference data that only changes with migrations, so
+it is compiled once per process into a `GeographyTree`. That serves both the
+hierarchy in /config and the value -> id lookups used to validate family
+writes. The tree is rebuilt when a hash of the table's content changes.
+"""
+
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional, Sequence
+
 from sqlalchemy.orm import Session
 
 from app.errors import ValidationError
 from app.repository import geography_repo
 
+_LOGGER = logging.getLogger(__name__)
+
+SUBDIVISION_TYPE = "ISO-3166-2"
+
+
+class GeographyTree(NamedTuple):
+    """
+    The compiled geography hierarchy, shared by the whole process.
+
+    Every part is immutable, so no caller can change it for the others.
+
+    :param Optional[str] fingerprint: geography_repo.fingerprint when
+        compiled.
+    :param Sequence[Mapping] regions: The hierarchy without ISO-3166-2
+        subdivisions, as {"node": {...}, "children": (...)} entries.
+    :param Mapping ids_by_value: The id of every geography by its value,
+        subdivisions included.
+    """
+
+    fingerprint: Optional[str]
+    regions: Sequence[Mapping[str, Any]]
+    ids_by_value: Mapping[str, int]
+
+    def region_dicts(self) -> list[dict]:
+        """
+        A mutable copy of `regions`, e.g. to hand to a DTO.
+
+        :return list[dict]: The hierarchy as plain dicts and lists.
+        """
+        return [_thaw(entry) for entry in self.regions]
+
+
+_tree: Optional[GeographyTree] = None
+_tree_lock = threading.Lock()
+
+
+def _freeze(entry: dict[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {
+            "node": MappingProxyType(entry["node"]),
+            "children": tuple(_freeze(child) for child in entry["children"]),
+        }
+    )
+
+
+def _thaw(entry: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "node": dict(entry["node"]),
+        "children": [_thaw(child) for child in entry["children"]],
+    }
+
+
+def _compile(rows: Sequence[Mapping], fingerprint: Optional[str]) -> GeographyTree:
+    children_by_id: dict[int, list[dict[str, Any]]] = {}
+    regions: list[dict] = []
+
+    for row in rows:
+        if row["type"] == SUBDIVISION_TYPE:
+            continue
+
+        children: list[dict[str, Any]] = []
+        entry = {"node": dict(row), "children": children}
+        parent_id = row["parent_id"]
+
+        children_by_id[row["id"]] = children
+        if parent_id is None:
+            regions.append(entry)
+        elif (siblings := children_by_id.get(parent_id)) is not None:
+            siblings.append(entry)
+        else:
+            raise RuntimeError(f"Could not locate parent node with id {parent_id}")
+
+    return GeographyTree(
+        fingerprint=fingerprint,
+        regions=tuple(_freeze(entry) for entry in regions),
+        ids_by_value=MappingProxyType({row["value"]: row["id"] for row in rows}),
+    )
+
+
+def get_tree(db: Session) -> GeographyTree:
+    """
+    Gets the compiled geography tree, rebuilding it if the table changed.
+
+    This costs one small query to compare fingerprints; use it where
+    freshness matters more than a round trip (e.g. building the config).
+
+    :param Session db: Database session.
+    :return GeographyTree: The current tree.
+    """
+    global _tree
+    fingerprint = geography_repo.fingerprint(db)
+    with _tree_lock:
+        if _tree is None or _tree.fingerprint != fingerprint:
+            _LOGGER.info("Compiling geography tree")
+            _tree = _compile(geography_repo.get_all(db), fingerprint)
+        return _tree
+
+
+def _cached_tree(db: Session) -> GeographyTree:
+    tree = _tree
+    return tree if tree is not None else get_tree(db)
+
+
+def invalidate_tree() -> None:
+    """Drops the compiled tree so the next use rebuilds it."""
+    global _tree
+    with _tree_lock:
+        _tree = None
+
+
+def _lookup_ids(db: Session, geo_strings: list[str]) -> list[int]:
+    # Unique values only: a repeated value should fail validation, as it
+    # did when the ids were looked up in the database.
+    values = list(dict.fromkeys(geo_strings))
+    ids_by_value = _cached_tree(db).ids_by_value
+    if any(value not in ids_by_value for value in values):
+        # A geography could have been added or renamed since the tree was
+        # compiled.
+        ids_by_value = get_tree(db).ids_by_value
+    return [ids_by_value[value] for value in values if value in ids_by_value]
+
 
 def get_id(db: Session, geo_string: str) -> int:
     """
@@ -13,10 +148,10 @@ def get_id(db: Session, geo_string: str) -> int:
     :raises ValidationError: If the geography value is invalid.
     :return int: The ID of the geography.
     """
-    id = geography_repo.get_id_from_value(db, geo_string)
-    if id is None:
+    ids = _lookup_ids(db, [geo_string])
+    if not ids:
         raise ValidationError(f"The geography value {geo_string} is invalid!")
-    return id
+    return ids[0]
 
 
 def get_ids(db: Session, geo_strings: list[str]) -> list[int]:
@@ -29,7 +164,7 @@ def get_ids(db: Session, geo_strings: list[str]) -> list[int]:
     :return list[int]: A list of IDs corresponding to the provided geography values.
     """
 
-    geo_ids = geography_repo.get_ids_from_values(db, geo_strings)
+    geo_ids = _lookup_ids(db, geo_strings)
 
     if len(geo_ids) != len(geo_strings):
         raise ValidationError(
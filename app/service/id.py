@@ -25,3 +25,24 @@ def validate_multiple_ids(import_ids: set[str]) -> None:
     if len(invalid_ids) > 0:
         invalid_ids.sort()
         raise ValidationError(f"The import ids are invalid: {invalid_ids}")
+
+
+# The most import ids a single multi-get request may ask for.
+MAX_BATCH_SIZE = 500
+
+
+def validate_batch(import_ids: list[str]) -> list[str]:
+    """
+    Validates the import ids of a multi-get request.
+
+    :param list[str] import_ids: The requested import ids.
+    :raises ValidationError: raised if there are too many or any is invalid.
+    :return list[str]: The import ids, de-duplicated in request order.
+    """
+    unique_ids = list(dict.fromkeys(import_ids))
+    if len(unique_ids) > MAX_BATCH_SIZE:
+        raise ValidationError(
+            f"Too many import ids requested: {len(unique_ids)} (max {MAX_BATCH_SIZE})"
+        )
+    validate_multiple_ids(set(unique_ids))
+    return unique_ids
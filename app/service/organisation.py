@@ -4,6 +4,8 @@ from pydantic import ConfigDict, validate_call
 from sqlalchemy.orm import Session
 
 import app.clients.db.session as db_session
+import app.service.config as config_service
+import app.service.registry as registry
 from app.errors import ValidationError
 from app.model.organisation import (
     OrganisationCreateDTO,
@@ -14,7 +16,7 @@ from app.repository import organisation as organisation_repo
 
 
 def get_id_from_name(db: Session, org_name: str) -> int:
-    id = organisation_repo.get_id_from_name(db, org_name)
+    id = registry.org_id_from_name(db, org_name)
     if id is None:
         raise ValidationError(f"The organisation name {org_name} is invalid!")
     return id
@@ -73,6 +75,8 @@ def create(organisation: OrganisationCreateDTO) -> int:
             raise e
         finally:
             db.commit()
+            config_service.invalidate_cache()
+            registry.invalidate()
 
 
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
@@ -103,6 +107,8 @@ def update(
                     db, organisation.internal_name
                 )
                 db.commit()
+                config_service.invalidate_cache()
+                registry.invalidate()
         except Exception as e:
             db.rollback()
             raise e
@@ -0,0 +1,138 @@
+"""
+Corpus and organisation registry
+
+Corpora and organisations only change through the corpus and organisation
+services, yet their ids are checked on almost every write and corpus read.
+This keeps what has been looked up in-process so those checks stop costing
+a round trip each. Entries are loaded lazily, on first use, and the corpus
+and organisation services clear them after a write via `invalidate`. The
+TTL bounds how stale they get when the write happens in another worker.
+
+Only positive results are cached, so a corpus or organisation created
+elsewhere is found as soon as it exists.
+"""
+
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+import app.repository.corpus as corpus_repo
+import app.repository.organisation as org_repo
+from app.cache import TTLCache
+from app.config import REGISTRY_TTL
+
+_corpus_orgs: TTLCache[str, int] = TTLCache(REGISTRY_TTL)
+_known_corpora: TTLCache[str, bool] = TTLCache(REGISTRY_TTL)
+_org_ids: TTLCache[str, int] = TTLCache(REGISTRY_TTL)
+_org_names: TTLCache[int, str] = TTLCache(REGISTRY_TTL)
+_org_options: TTLCache[None, frozenset[str]] = TTLCache(REGISTRY_TTL)
+
+
+def invalidate() -> None:
+    """Drops every entry, called after a corpus or organisation write."""
+    for cache in (_corpus_orgs, _known_corpora, _org_ids, _org_names, _org_options):
+        cache.clear()
+
+
+def corpus_org_id(db: Session, corpus_import_id: str) -> Optional[int]:
+    """
+    Gets the id of the organisation a corpus belongs to.
+
+    :param Session db: The DB session, used on a cache miss.
+    :param str corpus_import_id: The corpus import id.
+    :return Optional[int]: The organisation id, or None if the corpus has
+        no organisation.
+    """
+    if (org_id := _corpus_orgs.get(corpus_import_id)) is not None:
+        return org_id
+    org_id = corpus_repo.get_corpus_org_id(db, corpus_import_id)
+    if org_id is not None:
+        _corpus_orgs.set(corpus_import_id, org_id)
+    return org_id
+
+
+def corpus_exists(db: Session, corpus_import_id: str) -> bool:
+    """
+    Checks whether a corpus exists.
+
+    :param Session db: The DB session, used on a cache miss.
+    :param str corpus_import_id: The corpus import id.
+    :return bool: Whether the corpus exists.
+    """
+    if _known_corpora.get(corpus_import_id):
+        return True
+    exists = corpus_repo.verify_corpus_exists(db, corpus_import_id)
+    if exists:
+        _known_corpora.set(corpus_import_id, True)
+    return exists
+
+
+def missing_corpora(db: Session, corpus_import_ids: list[str]) -> list[str]:
+    """
+    Finds which of the given corpora do not exist, in at most one query.
+
+    :param Session db: The DB session, used on a cache miss.
+    :param list[str] corpus_import_ids: The corpus import ids to check.
+    :return list[str]: The ids that do not exist, in the order given.
+    """
+    unknown = [i for i in corpus_import_ids if not _known_corpora.get(i)]
+    if not unknown:
+        return []
+
+    found = corpus_repo.get_corpus_org_ids(db, unknown)
+    for corpus_import_id, org_id in found.items():
+        _known_corpora.set(corpus_import_id, True)
+        _corpus_orgs.set(corpus_import_id, org_id)
+    return [i for i in unknown if i not in found]
+
+
+def org_id_from_name(db: Session, org_name: str) -> Optional[int]:
+    """
+    Gets the id of an organisation from its name.
+
+    :param Session db: The DB session, used on a cache miss.
+    :param str org_name: The organisation name.
+    :return Optional[int]: The organisation id, or None if not found.
+    """
+    if (org_id := _org_ids.get(org_name)) is not None:
+        return org_id
+    org_id = org_repo.get_id_from_name(db, org_name)
+    if org_id is not None:
+        _org_ids.set(org_name, org_id)
+        _org_names.set(org_id, org_name)
+    return org_id
+
+
+def org_name_from_id(db: Session, org_id: int) -> Optional[str]:
+    """
+    Gets the name of an organisation from its id.
+
+    :param Session db: The DB session, used on a cache miss.
+    :param int org_id: The organisation id.
+    :return Optional[str]: The organisation name, or None if not found.
+    """
+    if (org_name := _org_names.get(org_id)) is not None:
+        return org_name
+    org_name = org_repo.get_name_from_id(db, org_id)
+    if org_name is not None:
+        _org_names.set(org_id, org_name)
+        _org_ids.set(org_name, org_id)
+    return org_name
+
+
+def is_org_option(db: Session, value: str) -> bool:
+    """
+    Checks whether a value is an organisation name or organisation type.
+
+    The whole set of options is loaded once, and reloaded if the value is
+    not in it in case an organisation was added since.
+
+    :param Session db: The DB session, used on a cache miss.
+    :param str value: The value to check, e.g. the prefix of an import id.
+    :return bool: Whether the value is a known name or type.
+    """
+    options = _org_options.get(None)
+    if options is None or value not in options:
+        options = frozenset(org_repo.get_distinct_org_options(db))
+        _org_options.set(None, options)
+    return value in options
@@ -1,10 +1,15 @@
+import hashlib
 import logging
 import os
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import jwt
+from opentelemetry import trace
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
 
+from app.cache import LRUCache
+from app.config import TOKEN_CACHE_SIZE
 from app.errors import TokenError
 from app.model.user import UserContext
 
@@ -14,6 +19,10 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 8 * 60  # 8 hours for access token
 
 _LOGGER = logging.getLogger(__name__)
 
+# Verified users keyed by the sha256 of their token, each kept until the
+# token expires.
+_verified: LRUCache[bytes, UserContext] = LRUCache(TOKEN_CACHE_SIZE)
+
 
 def encode(
     email: str,
@@ -71,13 +80,77 @@ def decode(token: str) -> UserContext:
     information to create a JWTUser.
     :return JWTUser: The decoded user.
     """
+    return _to_user(_verify(token))
+
+
+def decode_cached(token: str) -> UserContext:
+    """
+    Decodes the JWT token, reusing the user if it was verified before.
+
+    Tokens are only cached once verified, and only until they expire, so
+    this accepts and rejects exactly the tokens `decode` does. Whether the
+    cache was hit is recorded on the current span, and the totals are
+    reported through the meter given to `instrument`.
+
+    :param str token: The token to decode.
+    :raises TokenError: If the token cannot be decoded, see `decode`.
+    :return UserContext: The decoded user.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    user = _verified.get(key)
+    trace.get_current_span().set_attribute("auth.token_cache_hit", user is not None)
+    if user is not None:
+        return user
+
+    payload = _verify(token)
+    user = _to_user(payload)
+    if "exp" in payload:
+        _verified.set(key, user, float(payload["exp"]))
+    return user
+
+
+def clear_cache() -> None:
+    """Drops every verified token, e.g. between tests."""
+    _verified.clear()
+
+
+def instrument(meter: Meter) -> None:
+    """
+    Reports the verified token cache's hits and misses through the meter.
+
+    :param Meter meter: The meter to report through.
+    """
+
+    def _hits(_: CallbackOptions) -> list[Observation]:
+        return [Observation(_verified.hits)]
+
+    def _misses(_: CallbackOptions) -> list[Observation]:
+        return [Observation(_verified.misses)]
+
+    meter.create_observable_counter(
+        "auth.token_cache.hits",
+        callbacks=[_hits],
+        unit="{lookup}",
+        description="Requests whose token was already verified",
+    )
+    meter.create_observable_counter(
+        "auth.token_cache.misses",
+        callbacks=[_misses],
+        unit="{lookup}",
+        description="Requests whose token had to be verified",
+    )
+
+
+def _verify(token: str) -> dict[str, Any]:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.PyJWTError as e:
         msg = f"Error when decoding token: {e}"
         _LOGGER.exception(msg)
         raise TokenError(msg)
 
+
+def _to_user(payload: dict[str, Any]) -> UserContext:
     email: Optional[str] = payload.get("email")
     if email is None:
         raise TokenError("Token did not contain an email")
@@ -8,19 +8,23 @@ from typing import Callable
 from fastapi import FastAPI
 
 ## Tracing imports - stable
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry._logs import set_logger_provider
 from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
 # These are beta still, so may change and break compatibility
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import NonRecordingSpan
 
+from .clients.db import query_stats
 from .telemetry_config import TelemetryConfig
 from .telemetry_exceptions import install_exception_hooks
 
@@ -70,6 +74,7 @@ class Telemetry:
 
         self.tracer = trace.get_tracer(self.config.service_instance_id)
 
+        self._configure_metrics()
         self._configure_logging()
         self.get_logger().info("Telemetry initialized")
 
@@ -85,6 +90,21 @@ class Telemetry:
         """Returns the otel tracer"""
         return self.tracer
 
+    def get_meter(self):
+        """Returns the otel meter"""
+        return self.meter
+
+    def _configure_metrics(self):
+        """Configure metrics export"""
+        reader = PeriodicExportingMetricReader(
+            OTLPMetricExporter(endpoint=f"{self.config.otlp_endpoint}/v1/metrics")
+        )
+        self.meter_provider = MeterProvider(
+            resource=self.resource, metric_readers=[reader]
+        )
+        metrics.set_meter_provider(self.meter_provider)
+        self.meter = metrics.get_meter(self.config.service_instance_id)
+
     def _configure_logging(self):
         """Configure logging integration"""
         logger_provider = LoggerProvider(resource=self.resource)
@@ -128,7 +148,12 @@ class Telemetry:
 
 
 def observe(name: str) -> Callable:
-    """Decorator to wrap a function in an OTel span."""
+    """
+    Decorator to wrap a function in an OTel span.
+
+    When the request's SQL is being recorded, the span also gets the
+    statements, DB time and rows the function accounted for.
+    """
 
     def decorator(func: Callable):
         @functools.wraps(func)
@@ -138,8 +163,15 @@ def observe(name: str) -> Callable:
             else:
                 span = trace.get_tracer(func.__module__).start_as_current_span(name)
 
-            with span:
-                return func(*args, **kwargs)
+            with span as current:
+                stats = query_stats.current()
+                if current is None or stats is None:
+                    return func(*args, **kwargs)
+                before = stats.snapshot()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    current.set_attributes(stats.since(before))
 
         return wraps
 
@@ -0,0 +1,78 @@
+"""
+Concurrency benchmark for a running admin backend.
+
+Fires a steady stream of slow searches alongside cheap single-entity reads
+and reports latency percentiles for each. With service calls on the event
+loop the cheap reads queue behind every search; with them on the DB thread
+pool their p99 should stay close to their p50.
+
+Usage:
+    poetry run python scripts/benchmark_concurrency.py URL TOKEN FAMILY_ID \
+        [seconds] [concurrency]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+SLOW = "/api/v1/families/?q=climate"
+FAST = "/api/v1/families/{import_id}"
+
+
+async def _worker(
+    client: httpx.AsyncClient, path: str, deadline: float, timings: list[float]
+) -> None:
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        response = await client.get(path)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+
+
+def _percentile(timings: list[float], pct: int) -> float:
+    return statistics.quantiles(timings, n=100)[pct - 1]
+
+
+async def main(
+    url: str, token: str, family_id: str, seconds: float, concurrency: int
+) -> None:
+    headers = {"Authorization": f"Bearer {token}"}
+    limits = httpx.Limits(max_connections=concurrency * 2)
+    deadline = time.monotonic() + seconds
+    slow: list[float] = []
+    fast: list[float] = []
+
+    async with httpx.AsyncClient(
+        base_url=url, headers=headers, limits=limits, timeout=60
+    ) as client:
+        await asyncio.gather(
+            *(_worker(client, SLOW, deadline, slow) for _ in range(concurrency)),
+            *(
+                _worker(client, FAST.format(import_id=family_id), deadline, fast)
+                for _ in range(concurrency)
+            ),
+        )
+
+    print(f"{'endpoint':<10}{'requests':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, timings in (("search", slow), ("get", fast)):
+        print(
+            f"{name:<10}{len(timings):>10}"
+            f"{_percentile(timings, 50):>10.1f}"
+            f"{_percentile(timings, 95):>10.1f}"
+            f"{_percentile(timings, 99):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            sys.argv[1],
+            sys.argv[2],
+            sys.argv[3],
+            float(sys.argv[4]) if len(sys.argv) > 4 else 30,
+            int(sys.argv[5]) if len(sys.argv) > 5 else 8,
+        )
+    )
@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for mapping projected DB rows into read DTOs.
+
+Times each repository's `_row_to_dto` on synthetic rows with pydantic
+validation off (the default) and on (VALIDATE_REPOSITORY_DTOS=true), and
+prints the per-row cost of each.
+
+Usage:
+    poetry run python scripts/benchmark_dto_construction.py [rows]
+"""
+
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, Mapping
+
+from db_client.models.dfce import DocumentStatus
+from db_client.models.dfce.family import EventStatus
+
+from app import config
+from app.repository import document, event, family
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _family_row(i: int) -> Mapping:
+    return {
+        "import_id": f"CCLW.family.{i}.0",
+        "family_title": f"Family {i}",
+        "description": "A summary " * 20,
+        "geography_values": ["GBR", "FRA"],
+        "family_category": "Executive",
+        "family_status": "Published",
+        "metadata": {"topic": ["Mitigation"], "hazard": ["Flood", "Drought"]},
+        "slugs": [f"family-{i}"],
+        "events": [f"CCLW.event.{i}.{n}" for n in range(3)],
+        "published_date": NOW,
+        "last_updated_date": NOW,
+        "documents": [f"CCLW.document.{i}.{n}" for n in range(3)],
+        "collections": [f"CCLW.collection.{i}.0"],
+        "organisation": "CCLW",
+        "corpus_import_id": "CCLW.corpus.i00000001.n0000",
+        "corpus_title": "CCLW national policies",
+        "corpus_type_name": "Laws and Policies",
+        "created": NOW,
+        "last_modified": NOW,
+    }
+
+
+def _document_row(i: int) -> Mapping:
+    return {
+        "import_id": f"CCLW.document.{i}.0",
+        "family_import_id": f"CCLW.family.{i}.0",
+        "corpus_type": "Laws and Policies",
+        "variant_name": "Original Language",
+        "status": DocumentStatus.CREATED,
+        "created": NOW,
+        "last_modified": NOW,
+        "slugs": [f"document-{i}"],
+        "metadata": {"role": ["MAIN"], "type": ["Law"]},
+        "physical_id": i,
+        "title": f"Document {i}",
+        "md5_sum": "d41d8cd98f00b204e9800998ecf8427e",
+        "cdn_object": f"navigator/document-{i}.pdf",
+        "source_url": f"https://example.com/document-{i}.pdf",
+        "content_type": "application/pdf",
+        "user_language_names": ["English"],
+        "calc_language_names": [],
+    }
+
+
+def _event_row(i: int) -> Mapping:
+    return {
+        "import_id": f"CCLW.event.{i}.0",
+        "event_title": f"Event {i}",
+        "date": NOW,
+        "family_import_id": f"CCLW.family.{i}.0",
+        "family_document_import_id": None,
+        "event_type_value": "Passed/Approved",
+        "event_status": EventStatus.OK,
+        "created": NOW,
+        "last_modified": NOW,
+    }
+
+
+CASES: dict[str, tuple[Callable[[Mapping], object], Callable[[int], Mapping]]] = {
+    "family": (family._row_to_dto, _family_row),
+    "document": (document._row_to_dto, _document_row),
+    "event": (event._row_to_dto, _event_row),
+}
+
+
+def _per_row_us(to_dto: Callable[[Mapping], object], rows: list[Mapping]) -> float:
+    seconds = min(timeit.repeat(lambda: [to_dto(r) for r in rows], number=1, repeat=5))
+    return seconds / len(rows) * 1e6
+
+
+def main(n_rows: int) -> None:
+    print(f"{'entity':<10}{'construct µs/row':>18}{'validate µs/row':>18}")
+    for name, (to_dto, make_row) in CASES.items():
+        rows = [make_row(i) for i in range(n_rows)]
+
+        config.VALIDATE_REPOSITORY_DTOS = False
+        constructed = _per_row_us(to_dto, rows)
+        config.VALIDATE_REPOSITORY_DTOS = True
+        validated = _per_row_us(to_dto, rows)
+
+        print(f"{name:<10}{constructed:>18.2f}{validated:>18.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for building the repositories' read statements.
+
+For each entity, times what a `get` costs in Python before it reaches the
+database: building the projection and generating the key SQLAlchemy looks
+its compiled SQL up by. "rebuilt" builds the statement on every call as the
+repositories used to. "prepared" uses the statement each repository now
+builds once with bound parameters. "compile" is the one-off cost of
+compiling to PostgreSQL SQL, which the compiled cache saves on every later
+call.
+
+Usage:
+    poetry run python scripts/benchmark_statement_build.py [calls]
+"""
+
+import sys
+import timeit
+from typing import Callable
+
+import sqlalchemy
+from db_client.models.dfce import Collection, FamilyDocument, FamilyEvent
+from db_client.models.dfce.family import Family
+from sqlalchemy.dialects import postgresql
+
+from app.repository import collection, document, event, family
+
+IMPORT_ID = "CCLW.entity.1.0"
+
+CASES: dict[
+    str, tuple[Callable[[], sqlalchemy.sql.Select], Callable[[], sqlalchemy.sql.Select]]
+] = {
+    "family": (
+        lambda: family._get_query().where(Family.import_id == IMPORT_ID),
+        lambda: family._prepared(None, "import_id", False),
+    ),
+    "document": (
+        lambda: document._get_query().where(FamilyDocument.import_id == IMPORT_ID),
+        lambda: document._prepared(None, "import_id", False),
+    ),
+    "event": (
+        lambda: event._get_query().where(FamilyEvent.import_id == IMPORT_ID),
+        lambda: event._prepared("import_id", False),
+    ),
+    "collection": (
+        lambda: collection._get_query().where(Collection.import_id == IMPORT_ID),
+        lambda: collection._prepared("import_id", False),
+    ),
+}
+
+
+def _per_call_us(build: Callable[[], sqlalchemy.sql.Select], calls: int) -> float:
+    def run():
+        build()._generate_cache_key()
+
+    seconds = min(timeit.repeat(run, number=calls, repeat=5))
+    return seconds / calls * 1e6
+
+
+def main(calls: int) -> None:
+    dialect = postgresql.dialect()
+    print(f"{'entity':<12}{'rebuilt µs':>12}{'prepared µs':>13}{'compile µs':>12}")
+    for name, (rebuilt, prepared) in CASES.items():
+        compile_us = (
+            min(timeit.repeat(lambda: rebuilt().compile(dialect=dialect), number=10))
+            / 10
+            * 1e6
+        )
+        print(
+            f"{name:<12}"
+            f"{_per_call_us(rebuilt, calls):>12.1f}"
+            f"{_per_call_us(prepared, calls):>13.1f}"
+            f"{compile_us:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
@@ -0,0 +1,20 @@
+import re
+
+from httpx import Response
+
+_DB_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) statements, (\d+) rows"')
+
+
+def db_statements(response: Response) -> int:
+    """Number of SQL statements the request ran, from its Server-Timing header."""
+    match = _DB_TIMING.search(response.headers.get("Server-Timing", ""))
+    assert match is not None, "Response has no db Server-Timing entry"
+    return int(match.group(1))
+
+
+def assert_query_budget(response: Response, max_statements: int) -> None:
+    """Fails if the request ran more than max_statements SQL statements."""
+    statements = db_statements(response)
+    assert (
+        statements <= max_statements
+    ), f"Request ran {statements} statements, budget is {max_statements}"
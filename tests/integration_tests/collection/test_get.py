@@ -2,6 +2,7 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from tests.helpers.query_budget import assert_query_budget
 from tests.helpers.utils import remove_trigger_cols_from_result
 from tests.integration_tests.setup_db import EXPECTED_COLLECTIONS, setup_db
 
@@ -13,6 +14,7 @@ def test_get_collection(client: TestClient, data_db: Session, user_header_token)
         headers=user_header_token,
     )
     assert response.status_code == status.HTTP_200_OK
+    assert_query_budget(response, 3)
     data = response.json()
     assert data["import_id"] == "C.0.0.1"
 
@@ -1,7 +1,9 @@
+from db_client.models.dfce.geography import Geography
 from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+import app.service.config as config_service
 from tests.integration_tests.setup_db import setup_db
 
 EXPECTED_CONFIG_KEYS = {
@@ -305,3 +307,52 @@ def test_get_config_geographies_only_one_level_deep(
                 any_geography_has_children = True
 
     assert any_geography_has_children is not True
+
+
+def test_get_config_sees_geographies_edited_in_place(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    client.get("/api/v1/config", headers=user_header_token)
+
+    region = data_db.query(Geography).filter(Geography.slug == "south-asia").one()
+    region.display_value = "Renamed Region"
+    data_db.flush()
+    config_service.invalidate_cache()
+
+    response = client.get("/api/v1/config", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["geographies"][0]["node"]["display_value"] == (
+        "Renamed Region"
+    )
+
+
+def test_get_compact_config_lists_each_taxonomy_once(
+    client: TestClient, data_db: Session, superuser_header_token
+):
+    setup_db(data_db)
+
+    full = client.get("/api/v1/config", headers=superuser_header_token).json()
+    response = client.get(
+        "/api/v1/config?compact=true",
+        headers=superuser_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert set(data.keys()) ^ EXPECTED_CONFIG_KEYS == set()
+    assert data["geographies"] == full["geographies"]
+    assert data["languages"] == full["languages"]
+
+    assert len(data["corpora"]) == len(full["corpora"])
+    for corpus in data["corpora"]:
+        assert "taxonomy" not in corpus
+        assert "corpus_type_description" not in corpus
+
+    type_names = [ct["name"] for ct in data["corpus_types"]]
+    assert len(type_names) == len(set(type_names))
+    assert {c["corpus_type"] for c in data["corpora"]} == set(type_names)
+
+    taxonomies = {c["corpus_type"]: c["taxonomy"] for c in full["corpora"]}
+    for corpus_type in data["corpus_types"]:
+        assert corpus_type["taxonomy"] == taxonomies[corpus_type["name"]]
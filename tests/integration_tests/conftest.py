@@ -14,6 +14,10 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
 import app.clients.db.session as db_session
+import app.service.analytics as analytics_service
+import app.service.config as config_service
+import app.service.geography as geography_service
+import app.service.registry as registry_service
 import app.service.token as token_service
 from app.config import SQLALCHEMY_DATABASE_URI
 from app.main import app
@@ -110,6 +114,12 @@ def data_db(monkeypatch):
             yield test_session
 
         monkeypatch.setattr(db_session, "get_db", get_test_db)
+        monkeypatch.setattr(db_session, "get_read_db", get_test_db)
+        analytics_service.invalidate_summary_cache()
+        config_service.invalidate_cache()
+        geography_service.invalidate_tree()
+        registry_service.invalidate()
+        token_service.clear_cache()
         # Run the tests
         yield test_session
     finally:
@@ -292,3 +292,24 @@ def test_create_corpus_raises_on_conflict(
     assert response.status_code == status.HTTP_409_CONFLICT
     data = response.json()
     assert data["detail"] == f"Corpus '{new_corpus.import_id}' already exists"
+
+
+def test_create_corpus_refreshes_cached_config(
+    client: TestClient, data_db: Session, superuser_header_token
+):
+    setup_db(data_db)
+    response = client.get("/api/v1/config", headers=superuser_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    n_corpora = len(response.json()["corpora"])
+
+    new_corpus = create_corpus_create_dto("Laws and Policies")
+    response = client.post(
+        "/api/v1/corpora",
+        json=new_corpus.model_dump(),
+        headers=superuser_header_token,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = client.get("/api/v1/config", headers=superuser_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["corpora"]) == n_corpora + 1
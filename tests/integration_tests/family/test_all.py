@@ -2,6 +2,7 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from tests.helpers.query_budget import assert_query_budget
 from tests.helpers.utils import remove_trigger_cols_from_result
 from tests.integration_tests.setup_db import EXPECTED_FAMILIES, setup_db
 
@@ -15,6 +16,8 @@ def test_get_all_families_super(
         headers=superuser_header_token,
     )
     assert response.status_code == status.HTTP_200_OK
+    # One query for the list, however many families it holds.
+    assert_query_budget(response, 4)
     data = response.json()
     assert isinstance(data, list)
     assert len(data) == 3
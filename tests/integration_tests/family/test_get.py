@@ -6,6 +6,7 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from tests.helpers.query_budget import assert_query_budget
 from tests.helpers.utils import remove_trigger_cols_from_result
 from tests.integration_tests.setup_db import EXPECTED_FAMILIES, add_data, setup_db
 
@@ -17,6 +18,7 @@ def test_get_family(client: TestClient, data_db: Session, user_header_token):
         headers=user_header_token,
     )
     assert response.status_code == status.HTTP_200_OK
+    assert_query_budget(response, 3)
     data = response.json()
     assert data["import_id"] == "A.0.0.1"
 
@@ -150,3 +152,86 @@ def test_get_family_excludes_deleted_documents_and_their_events(
     data = response.json()
     assert "D.0.0.1" not in data["documents"]
     assert "E.0.0.99" not in data["events"]
+
+
+def test_get_family_when_not_modified(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    response = client.get("/api/v1/families/A.0.0.1", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        "/api/v1/families/A.0.0.1",
+        headers={**user_header_token, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+def test_get_family_etag_changes_when_event_added(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    etag = client.get("/api/v1/families/A.0.0.1", headers=user_header_token).headers[
+        "ETag"
+    ]
+
+    data_db.add(
+        FamilyEvent(
+            import_id="E.0.0.98",
+            title="New event",
+            date=datetime(2019, 1, 1, tzinfo=timezone.utc),
+            event_type_name="Passed/Approved",
+            family_import_id="A.0.0.1",
+            status=EventStatus.OK,
+            valid_metadata={
+                "event_type": ["Passed/Approved"],
+                "datetime_event_name": ["Passed/Approved"],
+            },
+        )
+    )
+    data_db.commit()
+
+    response = client.get(
+        "/api/v1/families/A.0.0.1",
+        headers={**user_header_token, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert "E.0.0.98" in response.json()["events"]
+
+
+def test_get_many_families_by_ids(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    response = client.get(
+        "/api/v1/families?ids=A.0.0.2&ids=A.0.0.1&ids=A.0.0.3&ids=A.0.0.8",
+        headers=user_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    # A.0.0.3 belongs to another org and A.0.0.8 does not exist.
+    assert [f["import_id"] for f in data] == ["A.0.0.2", "A.0.0.1"]
+    assert remove_trigger_cols_from_result(data[1]) == EXPECTED_FAMILIES[0]
+
+
+def test_search_families_with_sparse_fields(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    response = client.get(
+        "/api/v1/families/?q=&fields=title,status,documents",
+        headers=user_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert len(data) > 0
+    expected = {f["import_id"]: f for f in EXPECTED_FAMILIES}
+    for family in data:
+        assert family.keys() == {"import_id", "title", "status", "documents"}
+        assert family["title"] == expected[family["import_id"]]["title"]
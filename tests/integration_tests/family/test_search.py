@@ -5,6 +5,7 @@ from typing import cast
 import pytest
 from db_client.models.dfce import EventStatus, FamilyDocument, FamilyEvent
 from db_client.models.dfce.family import DocumentStatus
+from db_client.models.dfce.geography import Geography
 from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -189,6 +190,44 @@ def test_search_retrieves_families_with_multiple_geographies(
         assert test_geography["iso_code"] in item["geographies"]
 
 
+def test_search_geographies_when_no_family_matches(
+    client: TestClient, data_db: Session, superuser_header_token
+):
+    setup_db(data_db)
+    response = client.get(
+        "/api/v1/families/?geography=Albania",
+        headers=superuser_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+def test_search_geographies_including_sub_geographies(
+    client: TestClient, data_db: Session, superuser_header_token
+):
+    setup_db(data_db)
+    afghanistan = data_db.query(Geography).filter(Geography.value == "AFG").one()
+    parent = (
+        data_db.query(Geography).filter(Geography.id == afghanistan.parent_id).one()
+    )
+
+    response = client.get(
+        f"/api/v1/families/?geography={parent.display_value}",
+        headers=superuser_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+    response = client.get(
+        f"/api/v1/families/?geography={parent.display_value}"
+        "&include_sub_geographies=true",
+        headers=superuser_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    ids = [result["import_id"] for result in response.json()]
+    assert set(ids) == {"A.0.0.1", "A.0.0.3"}
+
+
 def test_search_excludes_future_events_when_returning_last_updated_date(
     client: TestClient, data_db: Session, superuser_header_token
 ):
@@ -55,6 +55,67 @@ def test_update_family(client: TestClient, data_db: Session, user_header_token):
     assert db_collection[0].family_import_id == "A.0.0.1"
 
 
+def test_update_family_response_matches_a_fresh_read(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    new_family = create_family_write_dto(
+        title="updated title",
+        summary="just a test",
+        geographies=["USA"],
+        category=FamilyCategory.UNFCCC,
+        collections=["C.0.0.2", "C.0.0.3"],
+    )
+    response = client.put(
+        "/api/v1/families/A.0.0.1",
+        json=new_family.model_dump(),
+        headers=user_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    updated = response.json()
+
+    response = client.get("/api/v1/families/A.0.0.1", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    fresh = response.json()
+
+    # The update response is built from RETURNING rather than a re-read.
+    for data in (updated, fresh):
+        data["collections"] = sorted(data["collections"])
+        data["geographies"] = sorted(data["geographies"])
+    assert updated == fresh
+
+
+def test_update_family_title_changes_etag(
+    client: TestClient, data_db: Session, user_header_token
+):
+    setup_db(data_db)
+    response = client.get("/api/v1/families/A.0.0.1", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    new_family = create_family_write_dto(
+        title="a new title",
+        summary="",
+        geographies=["AFG"],
+        category=FamilyCategory.UNFCCC,
+        collections=["C.0.0.2"],
+    )
+    response = client.put(
+        "/api/v1/families/A.0.0.1",
+        json=new_family.model_dump(),
+        headers=user_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.get(
+        "/api/v1/families/A.0.0.1",
+        headers={**user_header_token, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["title"] == "a new title"
+
+
 def test_update_family_geographies(
     client: TestClient, data_db: Session, user_header_token
 ):
@@ -10,6 +10,9 @@ def create_mock_family_repo(family_repo, monkeypatch: MonkeyPatch, mocker):
     monkeypatch.setattr(family_repo, "get", mock_repo.get)
     mocker.spy(family_repo, "get")
 
+    monkeypatch.setattr(family_repo, "get_many", mock_repo.get_many)
+    mocker.spy(family_repo, "get_many")
+
     monkeypatch.setattr(family_repo, "all", mock_repo.all)
     mocker.spy(family_repo, "all")
 
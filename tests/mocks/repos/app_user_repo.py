@@ -1,11 +1,9 @@
-from typing import Tuple
-from unittest.mock import MagicMock
+from typing import Optional
 
-from db_client.models.organisation.users import AppUser, Organisation, OrganisationUser
 from pytest import MonkeyPatch
 
 import app.service.authentication as auth_service
-from app.repository.app_user import MaybeAppUser
+from app.model.user import OrgAuthorisation, UserLogin
 
 PLAIN_PASSWORD = "test-password"
 HASH_PASSWORD = auth_service.get_password_hash(PLAIN_PASSWORD)
@@ -21,44 +19,25 @@ def mock_app_user_repo(app_user_repo, monkeypatch: MonkeyPatch, mocker):
     app_user_repo.alternative_org = False
     app_user_repo.superuser = False
 
-    def mock_get_app_user_authorisation(
-        _, __
-    ) -> list[Tuple[OrganisationUser, Organisation]]:
+    def mock_get_user_login(_, __) -> Optional[UserLogin]:
+        if app_user_repo.error:
+            return None
         org_id = (
             ALTERNATIVE_ORG_ID if app_user_repo.alternative_org else STANDARD_ORG_ID
         )
-        org = MagicMock()
-        org.id = org_id
-        org.name = f"org-{org_id}"
-        org_user = MagicMock()
-        org_user.is_admin = False
-        return [(org_user, org)]
-
-    def mock_get_user_by_email(_, __) -> MaybeAppUser:
-        if not app_user_repo.error:
-            return AppUser(
-                email=VALID_USERNAME,
-                name="Bob",
-                hashed_password=HASH_PASSWORD,
-                is_superuser=True,
-            )
-
-    def mock_is_active(_, email: str) -> bool:
-        return bool(app_user_repo.user_active is True)
+        return UserLogin(
+            email=VALID_USERNAME,
+            hashed_password=HASH_PASSWORD,
+            is_superuser=True,
+            is_active=app_user_repo.user_active is True,
+            organisations=[OrgAuthorisation(id=org_id, name=f"org-{org_id}")],
+        )
 
     def mock_is_superuser(_, email: str) -> bool:
         return bool(app_user_repo.superuser is True)
 
-    monkeypatch.setattr(app_user_repo, "get_user_by_email", mock_get_user_by_email)
-    mocker.spy(app_user_repo, "get_user_by_email")
-
-    monkeypatch.setattr(app_user_repo, "is_active", mock_is_active)
-    mocker.spy(app_user_repo, "is_active")
-
-    monkeypatch.setattr(
-        app_user_repo, "get_app_user_authorisation", mock_get_app_user_authorisation
-    )
-    mocker.spy(app_user_repo, "get_app_user_authorisation")
+    monkeypatch.setattr(app_user_repo, "get_user_login", mock_get_user_login)
+    mocker.spy(app_user_repo, "get_user_login")
 
     monkeypatch.setattr(app_user_repo, "is_superuser", mock_is_superuser)
     mocker.spy(app_user_repo, "is_superuser")
@@ -10,10 +10,14 @@ def mock_bad_document_repo(repo, monkeypatch: MonkeyPatch, mocker):
     def mock_get_all(_):
         raise RepositoryError("Bad Repo")
 
-    def mock_get(_, import_id: str) -> Optional[DocumentReadDTO]:
+    def mock_get(
+        _, import_id: str, fields: Optional[set[str]] = None
+    ) -> Optional[DocumentReadDTO]:
         raise RepositoryError("Bad Repo")
 
-    def mock_search(_, q: str, org_id: Optional[int]) -> list[DocumentReadDTO]:
+    def mock_search(
+        _, q: str, org_id: Optional[int], fields: Optional[set[str]] = None
+    ) -> list[DocumentReadDTO]:
         raise RepositoryError("Bad Repo")
 
     def mock_update(_, import_id, data: DocumentReadDTO) -> Optional[DocumentReadDTO]:
@@ -10,7 +10,9 @@ def mock_bad_family_repo(repo, monkeypatch: MonkeyPatch, mocker):
     def mock_get_all(_):
         raise RepositoryError("Bad Repo")
 
-    def mock_get(_, import_id: str) -> Optional[FamilyReadDTO]:
+    def mock_get(
+        _, import_id: str, fields: Optional[set[str]] = None
+    ) -> Optional[FamilyReadDTO]:
         raise RepositoryError("Bad Repo")
 
     def mock_search(
@@ -85,6 +85,15 @@ def mock_collection_repo(collection_repo, monkeypatch: MonkeyPatch, mocker):
             return ALTERNATIVE_ORG_ID
         return STANDARD_ORG_ID
 
+    def mock_collection_orgs(_, import_ids: set[str]) -> dict[str, int]:
+        maybe_throw()
+        if collection_repo.missing is True:
+            return {}
+        org_id = (
+            ALTERNATIVE_ORG_ID if collection_repo.alternative_org else STANDARD_ORG_ID
+        )
+        return {import_id: org_id for import_id in import_ids}
+
     monkeypatch.setattr(collection_repo, "get", mock_get)
     mocker.spy(collection_repo, "get")
 
@@ -113,3 +122,6 @@ def mock_collection_repo(collection_repo, monkeypatch: MonkeyPatch, mocker):
         collection_repo, "get_org_from_collection_id", mock_get_org_from_collection_id
     )
     mocker.spy(collection_repo, "get_org_from_collection_id")
+
+    monkeypatch.setattr(collection_repo, "collection_orgs", mock_collection_orgs)
+    mocker.spy(collection_repo, "collection_orgs")
@@ -14,7 +14,7 @@ def mock_config_repo(config_repo, monkeypatch: MonkeyPatch, mocker):
         if config_repo.throw_repository_error:
             raise exc.SQLAlchemyError("")
 
-    def mock_get(_) -> Optional[ConfigReadDTO]:
+    def mock_get(db, user, geographies) -> Optional[ConfigReadDTO]:
         maybe_throw()
         return ConfigReadDTO(
             geographies=[],
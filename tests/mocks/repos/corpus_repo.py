@@ -19,8 +19,16 @@ def mock_corpus_repo(corpus_repo, monkeypatch: MonkeyPatch, mocker):
     def mock_verify_corpus_exists(_, __) -> bool:
         return corpus_repo.valid
 
+    def mock_get_corpus_org_ids(_, corpus_ids: list[str]) -> dict[str, int]:
+        if not corpus_repo.valid:
+            return {}
+        return {corpus_id: 1 for corpus_id in corpus_ids}
+
     monkeypatch.setattr(corpus_repo, "get_corpus_org_id", mock_get_corpus_org_id)
     mocker.spy(corpus_repo, "get_corpus_org_id")
 
     monkeypatch.setattr(corpus_repo, "verify_corpus_exists", mock_verify_corpus_exists)
     mocker.spy(corpus_repo, "verify_corpus_exists")
+
+    monkeypatch.setattr(corpus_repo, "get_corpus_org_ids", mock_get_corpus_org_ids)
+    mocker.spy(corpus_repo, "get_corpus_org_ids")
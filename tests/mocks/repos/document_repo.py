@@ -27,7 +27,9 @@ def mock_document_repo(document_repo, monkeypatch: MonkeyPatch, mocker):
         if document_repo.throw_timeout_error:
             raise TimeoutError
 
-    def mock_get_all(_, org_id: Optional[int]) -> list[DocumentReadDTO]:
+    def mock_get_all(
+        _, org_id: Optional[int], fields: Optional[set[str]] = None
+    ) -> list[DocumentReadDTO]:
         maybe_throw()
         if document_repo.return_empty:
             return []
@@ -37,12 +39,16 @@ def mock_document_repo(document_repo, monkeypatch: MonkeyPatch, mocker):
             values.append(dto)
         return values
 
-    def mock_get(_, import_id: str) -> Optional[DocumentReadDTO]:
+    def mock_get(
+        _, import_id: str, fields: Optional[set[str]] = None
+    ) -> Optional[DocumentReadDTO]:
         if not document_repo.return_empty:
             dto = create_document_read_dto(import_id)
             return dto
 
-    def mock_search(_, q: str, org_id: Optional[int]) -> list[DocumentReadDTO]:
+    def mock_search(
+        _, q: str, org_id: Optional[int], fields: Optional[set[str]] = None
+    ) -> list[DocumentReadDTO]:
         maybe_throw()
         maybe_timeout()
         if not document_repo.return_empty:
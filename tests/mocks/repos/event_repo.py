@@ -81,7 +81,7 @@ def mock_event_repo(event_repo, monkeypatch: MonkeyPatch, mocker):
             return NON_SUPERUSER_COUNT
         return
 
-    def mock_get_org_from_import_id(_, import_id: str) -> Optional[int]:
+    def mock_org_id_for_event(_, import_id: str) -> Optional[int]:
         if event_repo.no_org is True:
             return None
 
@@ -116,7 +116,5 @@ def mock_event_repo(event_repo, monkeypatch: MonkeyPatch, mocker):
     monkeypatch.setattr(event_repo, "count", mock_get_count)
     mocker.spy(event_repo, "count")
 
-    monkeypatch.setattr(
-        event_repo, "get_org_from_import_id", mock_get_org_from_import_id
-    )
-    mocker.spy(event_repo, "get_org_from_import_id")
+    monkeypatch.setattr(event_repo, "org_id_for_event", mock_org_id_for_event)
+    mocker.spy(event_repo, "org_id_for_event")
@@ -22,25 +22,44 @@ def _maybe_timeout():
         raise TimeoutError
 
 
-def all(db: Session, org_id: Optional[int]):
+def all(db: Session, org_id: Optional[int], fields: Optional[set[str]] = None):
     _maybe_throw()
     if family_repo.return_empty:
         return []
     return [create_family_read_dto("test", collections=["x.y.z.1", "x.y.z.2"])]
 
 
-def get(db: Session, import_id: str) -> Optional[FamilyReadDTO]:
+def get(
+    db: Session, import_id: str, fields: Optional[set[str]] = None
+) -> Optional[FamilyReadDTO]:
     _maybe_throw()
     if family_repo.return_empty is False:
         return create_family_read_dto(import_id, collections=["x.y.z.1", "x.y.z.2"])
 
 
+def get_many(
+    db: Session,
+    import_ids: list[str],
+    org_ids: Optional[list[int]],
+    fields: Optional[set[str]] = None,
+) -> list[FamilyReadDTO]:
+    _maybe_throw()
+    if family_repo.return_empty:
+        return []
+    return [
+        create_family_read_dto(import_id, collections=["x.y.z.1", "x.y.z.2"])
+        for import_id in import_ids
+    ]
+
+
 def search(
     db: Session,
     search_params: dict[str, Union[str, int]],
     org_id: Optional[int],
     geography: Optional[list[str]],
     corpus: Optional[list[str]] = None,
+    include_sub_geographies: bool = False,
+    fields: Optional[set[str]] = None,
 ) -> list[FamilyReadDTO]:
     _maybe_throw()
     _maybe_timeout()
@@ -59,10 +78,13 @@ def update(
     import_id: str,
     family: FamilyWriteDTO,
     geo_ids: list[int],
-    geo_id: Optional[int] = None,
-) -> bool:
+    original: Optional[FamilyReadDTO] = None,
+) -> Optional[FamilyReadDTO]:
     _maybe_throw()
-    return family_repo.return_empty is False
+    if family_repo.return_empty is False:
+        return create_family_read_dto(
+            import_id, title=family.title, collections=family.collections
+        )
 
 
 def create(db: Session, family: FamilyCreateDTO, geo_id: int, org_id: int) -> str:
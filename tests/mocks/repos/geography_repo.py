@@ -1,9 +1,11 @@
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 from pytest import MonkeyPatch
 
 from app.errors import RepositoryError
 
+GEOGRAPHY_VALUES = ["CHN", "USA", "AGO", "BRB", "BHS", "XAA"]
+
 
 def mock_geography_repo(geography_repo, monkeypatch: MonkeyPatch, mocker):
     geography_repo.return_empty = False
@@ -16,20 +18,27 @@ def mock_geography_repo(geography_repo, monkeypatch: MonkeyPatch, mocker):
         if geography_repo.failed_to_add_geography:
             raise RepositoryError("Failed to add geography to family")
 
-    def mock_get_id_from_value(_, __) -> Optional[int]:
-        maybe_throw()
-        if not geography_repo.error:
-            return 1
-        return None
-
-    def mock_get_ids_from_values(_, values) -> list[int]:
+    def mock_get_all(_) -> Sequence[Mapping]:
         maybe_throw()
-        if not geography_repo.error:
-            return list(range(1, len(values) + 1))
-        return []
+        if geography_repo.error:
+            return []
+        return [
+            {
+                "id": id,
+                "display_value": value,
+                "value": value,
+                "type": "ISO-3166",
+                "parent_id": None,
+                "slug": value.lower(),
+            }
+            for id, value in enumerate(GEOGRAPHY_VALUES, start=1)
+        ]
+
+    def mock_fingerprint(_) -> Optional[str]:
+        return None if geography_repo.error else ",".join(GEOGRAPHY_VALUES)
 
     geography_repo.error = False
-    monkeypatch.setattr(geography_repo, "get_ids_from_values", mock_get_ids_from_values)
-    monkeypatch.setattr(geography_repo, "get_id_from_value", mock_get_id_from_value)
-    mocker.spy(geography_repo, "get_id_from_value")
-    mocker.spy(geography_repo, "get_ids_from_values")
+    monkeypatch.setattr(geography_repo, "get_all", mock_get_all)
+    monkeypatch.setattr(geography_repo, "fingerprint", mock_fingerprint)
+    mocker.spy(geography_repo, "get_all")
+    mocker.spy(geography_repo, "fingerprint")
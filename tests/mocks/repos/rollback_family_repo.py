@@ -12,9 +12,13 @@ def mock_rollback_family_repo(family_repo, monkeypatch: MonkeyPatch, mocker):
     actual_delete = family_repo.delete
 
     def mock_update_family(
-        db, import_id: str, data: FamilyReadDTO, geo_ids: list[int]
+        db,
+        import_id: str,
+        data: FamilyReadDTO,
+        geo_ids: list[int],
+        original: Optional[FamilyReadDTO] = None,
     ) -> Optional[FamilyReadDTO]:
-        actual_update(db, import_id, data, geo_ids)
+        actual_update(db, import_id, data, geo_ids, original)
         raise NoResultFound()
 
     def mock_create_family(
@@ -34,6 +34,14 @@ def mock_collection_service(collection_service, monkeypatch: MonkeyPatch, mocker
         if not collection_service.missing:
             return create_collection_read_dto(import_id)
 
+    def mock_get_many_collections(
+        import_ids: list[str], user_email: str
+    ) -> list[CollectionReadDTO]:
+        maybe_throw()
+        if collection_service.missing:
+            return []
+        return [create_collection_read_dto(import_id) for import_id in import_ids]
+
     def mock_search_collections(
         q_params: dict, user_email: str
     ) -> list[CollectionReadDTO]:
@@ -76,12 +84,22 @@ def mock_collection_service(collection_service, monkeypatch: MonkeyPatch, mocker
             return ALTERNATIVE_ORG_ID
         return STANDARD_ORG_ID
 
+    def mock_version(user_email: str) -> tuple:
+        return (1,)
+
+    def mock_entity_version(import_id: str) -> Optional[tuple]:
+        if not collection_service.missing:
+            return (import_id,)
+
     monkeypatch.setattr(collection_service, "get", mock_get_collection)
     mocker.spy(collection_service, "get")
 
     monkeypatch.setattr(collection_service, "all", mock_get_all_collections)
     mocker.spy(collection_service, "all")
 
+    monkeypatch.setattr(collection_service, "get_many", mock_get_many_collections)
+    mocker.spy(collection_service, "get_many")
+
     monkeypatch.setattr(collection_service, "search", mock_search_collections)
     mocker.spy(collection_service, "search")
 
@@ -99,3 +117,9 @@ def mock_collection_service(collection_service, monkeypatch: MonkeyPatch, mocker
 
     monkeypatch.setattr(collection_service, "get_org_from_id", mock_get_org_from_id)
     mocker.spy(collection_service, "get_org_from_id")
+
+    monkeypatch.setattr(collection_service, "version", mock_version)
+    mocker.spy(collection_service, "version")
+
+    monkeypatch.setattr(collection_service, "entity_version", mock_entity_version)
+    mocker.spy(collection_service, "entity_version")
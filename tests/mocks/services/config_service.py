@@ -2,6 +2,7 @@ from pytest import MonkeyPatch
 
 from app.errors import RepositoryError
 from app.model.config import ConfigReadDTO, DocumentConfig
+from app.service.config import SerialisedConfig
 
 
 def mock_config_service(config_service, monkeypatch: MonkeyPatch, mocker):
@@ -21,5 +22,12 @@ def mock_config_service(config_service, monkeypatch: MonkeyPatch, mocker):
             document=DocumentConfig(variants=[]),
         )
 
+    def mock_get_serialised_config(user, compact: bool = False) -> SerialisedConfig:
+        payload = mock_get_config(user).model_dump_json().encode()
+        return SerialisedConfig(payload=payload, digest="digest")
+
     monkeypatch.setattr(config_service, "get", mock_get_config)
     mocker.spy(config_service, "get")
+
+    monkeypatch.setattr(config_service, "get_serialised", mock_get_serialised_config)
+    mocker.spy(config_service, "get_serialised")
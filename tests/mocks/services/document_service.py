@@ -23,16 +23,30 @@ def mock_document_service(document_service, monkeypatch: MonkeyPatch, mocker):
         if document_service.throw_timeout_error:
             raise TimeoutError
 
-    def mock_get_all_documents(user_email: str) -> list[DocumentReadDTO]:
+    def mock_get_all_documents(
+        user_email: str, fields: Optional[set[str]] = None
+    ) -> list[DocumentReadDTO]:
         maybe_throw()
         return [create_document_read_dto("test")]
 
-    def mock_get_document(import_id: str) -> Optional[DocumentReadDTO]:
+    def mock_get_document(
+        import_id: str, fields: Optional[set[str]] = None
+    ) -> Optional[DocumentReadDTO]:
         maybe_throw()
         if not document_service.missing:
             return create_document_read_dto(import_id)
 
-    def mock_search_documents(q_params: dict, user_email: str) -> list[DocumentReadDTO]:
+    def mock_get_many_documents(
+        import_ids: list[str], user_email: str, fields: Optional[set[str]] = None
+    ) -> list[DocumentReadDTO]:
+        maybe_throw()
+        if document_service.missing:
+            return []
+        return [create_document_read_dto(import_id) for import_id in import_ids]
+
+    def mock_search_documents(
+        q_params: dict, user_email: str, fields: Optional[set[str]] = None
+    ) -> list[DocumentReadDTO]:
         if document_service.missing:
             return []
 
@@ -75,12 +89,22 @@ def mock_document_service(document_service, monkeypatch: MonkeyPatch, mocker):
             raise ValidationError("No org")
         return not document_service.missing
 
+    def mock_version(user_email: str) -> tuple:
+        return (1,)
+
+    def mock_entity_version(import_id: str) -> Optional[tuple]:
+        if not document_service.missing:
+            return (import_id,)
+
     monkeypatch.setattr(document_service, "get", mock_get_document)
     mocker.spy(document_service, "get")
 
     monkeypatch.setattr(document_service, "all", mock_get_all_documents)
     mocker.spy(document_service, "all")
 
+    monkeypatch.setattr(document_service, "get_many", mock_get_many_documents)
+    mocker.spy(document_service, "get_many")
+
     monkeypatch.setattr(document_service, "search", mock_search_documents)
     mocker.spy(document_service, "search")
 
@@ -92,3 +116,9 @@ def mock_document_service(document_service, monkeypatch: MonkeyPatch, mocker):
 
     monkeypatch.setattr(document_service, "delete", mock_delete_document)
     mocker.spy(document_service, "delete")
+
+    monkeypatch.setattr(document_service, "version", mock_version)
+    mocker.spy(document_service, "version")
+
+    monkeypatch.setattr(document_service, "entity_version", mock_entity_version)
+    mocker.spy(document_service, "entity_version")
@@ -35,6 +35,14 @@ def mock_event_service(event_service, monkeypatch: MonkeyPatch, mocker):
         if not event_service.missing:
             return create_event_read_dto(import_id)
 
+    def mock_get_many_events(
+        import_ids: list[str], user_email: str
+    ) -> list[EventReadDTO]:
+        maybe_throw()
+        if event_service.missing:
+            return []
+        return [create_event_read_dto(import_id) for import_id in import_ids]
+
     def mock_search_events(q: dict, user_email: str) -> list[EventReadDTO]:
         maybe_throw()
         maybe_timeout()
@@ -76,12 +84,22 @@ def mock_event_service(event_service, monkeypatch: MonkeyPatch, mocker):
             raise ValidationError("No org")
         return not event_service.missing
 
+    def mock_version(user_email: str) -> tuple:
+        return (1,)
+
+    def mock_entity_version(import_id: str) -> Optional[tuple]:
+        if not event_service.missing:
+            return (import_id,)
+
     monkeypatch.setattr(event_service, "get", mock_get_event)
     mocker.spy(event_service, "get")
 
     monkeypatch.setattr(event_service, "all", mock_get_all_events)
     mocker.spy(event_service, "all")
 
+    monkeypatch.setattr(event_service, "get_many", mock_get_many_events)
+    mocker.spy(event_service, "get_many")
+
     monkeypatch.setattr(event_service, "search", mock_search_events)
     mocker.spy(event_service, "search")
 
@@ -93,3 +111,9 @@ def mock_event_service(event_service, monkeypatch: MonkeyPatch, mocker):
 
     monkeypatch.setattr(event_service, "delete", mock_delete_event)
     mocker.spy(event_service, "delete")
+
+    monkeypatch.setattr(event_service, "version", mock_version)
+    mocker.spy(event_service, "version")
+
+    monkeypatch.setattr(event_service, "entity_version", mock_entity_version)
+    mocker.spy(event_service, "entity_version")
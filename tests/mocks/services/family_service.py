@@ -27,18 +27,33 @@ def mock_family_service(family_service, monkeypatch: MonkeyPatch, mocker):
         if family_service.throw_timeout_error:
             raise TimeoutError
 
-    def mock_get_all_families(user_email: str):
+    def mock_get_all_families(user_email: str, fields: Optional[set[str]] = None):
         return [create_family_read_dto("test", collections=["x.y.z.1", "x.y.z.2"])]
 
-    def mock_get_family(import_id: str) -> Optional[FamilyReadDTO]:
+    def mock_get_family(
+        import_id: str, fields: Optional[set[str]] = None
+    ) -> Optional[FamilyReadDTO]:
         if not family_service.missing:
             return create_family_read_dto(import_id, collections=["x.y.z.1", "x.y.z.2"])
 
+    def mock_get_many_families(
+        import_ids: list[str], user_email: str, fields: Optional[set[str]] = None
+    ) -> list[FamilyReadDTO]:
+        maybe_throw()
+        if family_service.missing:
+            return []
+        return [
+            create_family_read_dto(import_id, collections=["x.y.z.1", "x.y.z.2"])
+            for import_id in import_ids
+        ]
+
     def mock_search_families(
         q_params: dict,
         user_email: str,
         geography: Optional[list[str]],
         corpus: Optional[list[str]] = None,
+        include_sub_geographies: bool = False,
+        fields: Optional[set[str]] = None,
     ) -> list[FamilyReadDTO]:
         if q_params["q"] == "empty":
             return []
@@ -84,12 +99,22 @@ def mock_family_service(family_service, monkeypatch: MonkeyPatch, mocker):
             raise AuthorisationError("Org mismatch")
         return not family_service.missing
 
+    def mock_version(user_email: str) -> tuple:
+        return (1,)
+
+    def mock_entity_version(import_id: str) -> Optional[tuple]:
+        if not family_service.missing:
+            return (import_id,)
+
     monkeypatch.setattr(family_service, "get", mock_get_family)
     mocker.spy(family_service, "get")
 
     monkeypatch.setattr(family_service, "all", mock_get_all_families)
     mocker.spy(family_service, "all")
 
+    monkeypatch.setattr(family_service, "get_many", mock_get_many_families)
+    mocker.spy(family_service, "get_many")
+
     monkeypatch.setattr(family_service, "search", mock_search_families)
     mocker.spy(family_service, "search")
 
@@ -101,3 +126,9 @@ def mock_family_service(family_service, monkeypatch: MonkeyPatch, mocker):
 
     monkeypatch.setattr(family_service, "delete", mock_delete_family)
     mocker.spy(family_service, "delete")
+
+    monkeypatch.setattr(family_service, "version", mock_version)
+    mocker.spy(family_service, "version")
+
+    monkeypatch.setattr(family_service, "entity_version", mock_entity_version)
+    mocker.spy(family_service, "entity_version")
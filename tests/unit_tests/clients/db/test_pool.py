@@ -0,0 +1,81 @@
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from sqlalchemy import create_engine, exc
+
+import app.clients.db.pool as pool_module
+
+
+def _metrics(reader: InMemoryMetricReader) -> dict[str, list]:
+    data = reader.get_metrics_data()
+    assert data is not None
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+
+
+@pytest.fixture
+def instrumented(monkeypatch):
+    monkeypatch.setattr(pool_module, "_instruments", None)
+    monkeypatch.setattr(pool_module, "_engines", {})
+    engine = create_engine(
+        "sqlite://",
+        poolclass=pool_module.InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+    pool_module.instrument_pool(engine, meter)
+    yield engine, reader, meter
+    engine.dispose()
+
+
+def test_pool_reports_checkouts(instrumented):
+    engine, reader, _ = instrumented
+
+    with engine.connect():
+        metrics = _metrics(reader)
+
+    assert metrics["db.pool.checked_out"][0].value == 1
+    assert metrics["db.pool.overflow"][0].value == 0
+    assert metrics["db.pool.checkout_wait"][0].count == 1
+    assert metrics["db.pool.connection_age"][0].count == 1
+
+
+def test_pool_counts_timeouts(instrumented):
+    engine, reader, _ = instrumented
+
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    timeouts = _metrics(reader)["db.pool.timeouts"][0]
+    assert timeouts.value == 1
+    assert timeouts.attributes == {"pool": "primary"}
+
+
+def test_pools_are_reported_apart(instrumented):
+    engine, reader, meter = instrumented
+    replica = create_engine(
+        "sqlite://",
+        poolclass=pool_module.InstrumentedQueuePool,
+        pool_logging_name="replica",
+    )
+    pool_module.instrument_pool(replica, meter)
+
+    with replica.connect():
+        metrics = _metrics(reader)
+    replica.dispose()
+
+    checked_out = {
+        point.attributes["pool"]: point.value
+        for point in metrics["db.pool.checked_out"]
+    }
+    assert checked_out == {"primary": 0, "replica": 1}
+    waits = {point.attributes["pool"] for point in metrics["db.pool.checkout_wait"]}
+    assert waits == {"replica"}
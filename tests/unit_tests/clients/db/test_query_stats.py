@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+import app.clients.db.query_stats as query_stats
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+    yield engine
+    engine.dispose()
+
+
+def test_statements_outside_a_recording_are_ignored(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT id FROM t")).all()
+    assert query_stats.current() is None
+
+
+def test_recording_counts_statements_and_rows(engine):
+    with query_stats.recording() as stats:
+        with engine.begin() as conn:
+            conn.execute(text("SELECT id FROM t")).all()
+            conn.execute(text("UPDATE t SET id = id + 1 WHERE id > 1"))
+
+    assert stats.statements == 2
+    assert stats.rows == 2
+    assert stats.duration_ms > 0
+    assert query_stats.current() is None
+    assert 'desc="2 statements, 2 rows"' in stats.server_timing()
+
+
+def test_since_reports_only_later_statements(engine):
+    with query_stats.recording() as stats, engine.connect() as conn:
+        conn.execute(text("SELECT id FROM t")).all()
+        before = stats.snapshot()
+        conn.execute(text("SELECT id FROM t WHERE id = 1")).all()
+
+    attributes = stats.since(before)
+    assert attributes["db.statements"] == 1
+    assert attributes["db.rows"] == 0
+    assert stats.attributes()["db.statements"] == 2
+
+
+def test_repeated_statements_are_reported(engine):
+    with query_stats.recording() as stats, engine.connect() as conn:
+        for i in range(4):
+            conn.execute(text("SELECT id FROM t WHERE id = :id"), {"id": i}).all()
+        conn.execute(text("SELECT id FROM t")).all()
+
+    assert stats.repeated(3) == [("SELECT id FROM t WHERE id = ?", 4)]
+    assert stats.repeated(4) == []
+
+
+def test_normalise_collapses_whitespace_and_parameter_lists():
+    one = "SELECT id\n  FROM t WHERE id IN (%(id_1_1)s)"
+    three = "SELECT id FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"
+    assert query_stats.normalise(one) == query_stats.normalise(three)
+    assert query_stats.normalise(one) == "SELECT id FROM t WHERE id IN (...)"
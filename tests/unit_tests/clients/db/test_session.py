@@ -0,0 +1,60 @@
+import pytest
+
+import app.clients.db.session as db_session
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """Points reads at a separate session factory standing in for a replica."""
+    opened = []
+
+    class FakeSession:
+        def __init__(self, name):
+            self.name = name
+            opened.append(name)
+
+        def expunge_all(self):
+            pass
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(db_session, "SessionLocal", lambda: FakeSession("primary"))
+    monkeypatch.setattr(db_session, "ReadSessionLocal", lambda: FakeSession("replica"))
+    monkeypatch.setattr(db_session, "_recent_writers", db_session.TTLCache(60))
+    return opened
+
+
+def test_reads_go_to_the_replica(replica):
+    token = db_session.current_user.set("a@cpr.org")
+    try:
+        with db_session.get_read_db():
+            pass
+    finally:
+        db_session.current_user.reset(token)
+
+    assert replica == ["replica"]
+
+
+def test_reads_go_to_the_primary_after_the_users_own_write(replica):
+    token = db_session.current_user.set("a@cpr.org")
+    try:
+        db_session._remember_writer(None)  # type: ignore
+        with db_session.get_read_db():
+            pass
+
+        db_session.current_user.set("b@cpr.org")
+        with db_session.get_read_db():
+            pass
+    finally:
+        db_session.current_user.reset(token)
+
+    assert replica == ["primary", "replica"]
+
+
+def test_writes_without_a_user_are_not_remembered(replica):
+    db_session._remember_writer(None)  # type: ignore
+    with db_session.get_read_db():
+        pass
+
+    assert replica == ["replica"]
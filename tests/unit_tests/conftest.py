@@ -29,7 +29,9 @@ import app.service.corpus_type as corpus_type_service
 import app.service.document as document_service
 import app.service.event as event_service
 import app.service.family as family_service
+import app.service.geography as geography_service
 import app.service.organisation as organisation_service
+import app.service.registry as registry_service
 import app.service.taxonomy as taxonomy_service
 import app.service.token as token_service
 import app.service.validation as validation_service
@@ -88,6 +90,22 @@ def db_session_mock():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """Stops process-level caches leaking between tests."""
+    analytics_service.invalidate_summary_cache()
+    config_service.invalidate_cache()
+    geography_service.invalidate_tree()
+    registry_service.invalidate()
+    token_service.clear_cache()
+    yield
+    analytics_service.invalidate_summary_cache()
+    config_service.invalidate_cache()
+    geography_service.invalidate_tree()
+    registry_service.invalidate()
+    token_service.clear_cache()
+
+
 # ----- Mock repos
 
 
@@ -2,8 +2,23 @@ import uuid
 from unittest.mock import patch
 
 import pytest
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
 
-from app.repository.helpers import generate_unique_slug
+from app import config
+from app.repository import event as event_repo
+from app.repository.helpers import (
+    bound,
+    build_dto,
+    construct_raw_sql_query_to_retrieve_all_families,
+    freeze_fields,
+    generate_unique_slug,
+)
+
+
+class _ExampleDTO(BaseModel):
+    name: str
+    tags: list[str] = []
 
 
 def test_successfully_generates_a_slug_with_a_four_digit_suffix():
@@ -46,3 +61,71 @@ def test_raises_error_if_a_unique_slug_cannot_be_created_in_a_specified_number_o
         pytest.raises(RuntimeError),
     ):
         generate_unique_slug({existing_slug}, title, 2)
+
+
+def test_build_dto_skips_validation_by_default():
+    dto = build_dto(_ExampleDTO, name=1)
+
+    assert isinstance(dto, _ExampleDTO)
+    assert dto.name == 1
+    assert dto.tags == []
+
+
+def test_build_dto_validates_when_enabled(monkeypatch):
+    monkeypatch.setattr(config, "VALIDATE_REPOSITORY_DTOS", True)
+
+    assert build_dto(_ExampleDTO, name="a").name == "a"
+    with pytest.raises(PydanticValidationError):
+        build_dto(_ExampleDTO, name=1)
+
+
+def test_family_search_query_selects_every_aggregate_by_default():
+    sql, _ = construct_raw_sql_query_to_retrieve_all_families({"max_results": 10})
+
+    for subquery in (
+        "geography_subquery",
+        "family_documents_subquery",
+        "family_events_subquery",
+        "slug_subquery",
+        "collection_subquery",
+    ):
+        assert f"AS {subquery}" in sql
+    for column in ("family_status", "last_updated_date", "published_date"):
+        assert f"AS {column}" in sql
+
+
+def test_family_search_query_drops_unrequested_aggregates():
+    sql, _ = construct_raw_sql_query_to_retrieve_all_families(
+        {"max_results": 10}, fields={"import_id", "title", "status", "documents"}
+    )
+
+    assert "AS family_documents_subquery" in sql
+    assert "AS family_status" in sql
+    for unrequested in (
+        "geography_subquery",
+        "family_events_subquery",
+        "slug_subquery",
+        "collection_subquery",
+        "last_updated_date",
+        "published_date",
+    ):
+        assert unrequested not in sql
+    # Families without a geography are still excluded, as with the join.
+    assert "FROM family_geography fg" in sql
+
+
+def test_bound_leaves_out_missing_values():
+    assert bound(import_ids=["a"], org_ids=None) == {"import_ids": ["a"]}
+
+
+def test_freeze_fields_keeps_none_for_every_field():
+    assert freeze_fields(None) is None
+    assert freeze_fields({"title", "slug"}) == frozenset({"title", "slug"})
+
+
+def test_prepared_statements_are_built_once_per_shape():
+    first = event_repo._prepared("import_ids", True)
+
+    assert event_repo._prepared("import_ids", True) is first
+    assert event_repo._prepared("import_ids", False) is not first
+    assert {"import_ids", "org_ids"} <= set(first.compile().params)
@@ -37,3 +37,27 @@ def test_get_when_not_found(
     data = response.json()
     assert data["detail"] == "Collection not found: col1"
     assert collection_service_mock.get.call_count == 1
+
+
+def test_get_all_when_not_modified(
+    client: TestClient, collection_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/collections", headers=user_header_token).headers["ETag"]
+
+    response = client.get(
+        "/api/v1/collections", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert collection_service_mock.all.call_count == 1
+
+
+def test_get_many_by_ids(
+    client: TestClient, collection_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/collections?ids=x.y.z.2&ids=x.y.z.1", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [d["import_id"] for d in response.json()] == ["x.y.z.2", "x.y.z.1"]
+    assert collection_service_mock.get_many.call_count == 1
+    assert collection_service_mock.all.call_count == 0
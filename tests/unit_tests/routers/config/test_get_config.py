@@ -12,10 +12,29 @@ def test_get_when_ok(client: TestClient, user_header_token, config_service_mock)
     assert "corpus_types" in keys
     assert "languages" in keys
     assert "document" in keys
-    assert config_service_mock.get.call_count == 1
+    assert config_service_mock.get_serialised.call_count == 1
 
 
 def test_get_when_db_error(client: TestClient, user_header_token, config_service_mock):
     config_service_mock.throw_repository_error = True
     response = client.get("/api/v1/config", headers=user_header_token)
     assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def test_get_when_not_modified(
+    client: TestClient, user_header_token, config_service_mock
+):
+    etag = client.get("/api/v1/config", headers=user_header_token).headers["ETag"]
+
+    response = client.get(
+        "/api/v1/config", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+def test_get_compact(client: TestClient, user_header_token, config_service_mock):
+    response = client.get("/api/v1/config?compact=true", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    assert config_service_mock.get_serialised.call_count == 1
+    assert config_service_mock.get_serialised.call_args.args[1] is True
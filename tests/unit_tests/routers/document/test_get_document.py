@@ -29,3 +29,38 @@ def test_get_when_not_found(
     data = response.json()
     assert data["detail"] == "Document not found: doc1"
     assert document_service_mock.get.call_count == 1
+
+
+def test_get_all_when_not_modified(
+    client: TestClient, document_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/documents", headers=user_header_token).headers["ETag"]
+
+    response = client.get(
+        "/api/v1/documents", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert document_service_mock.all.call_count == 1
+
+
+def test_get_many_by_ids(client: TestClient, document_service_mock, user_header_token):
+    response = client.get(
+        "/api/v1/documents?ids=x.y.z.2&ids=x.y.z.1", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [d["import_id"] for d in response.json()] == ["x.y.z.2", "x.y.z.1"]
+    assert document_service_mock.get_many.call_count == 1
+    assert document_service_mock.all.call_count == 0
+
+
+def test_get_all_with_sparse_fields(
+    client: TestClient, document_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/documents?fields=title,status", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    [document] = response.json()
+    assert document.keys() == {"import_id", "title", "status"}
+    _, fields = document_service_mock.all.call_args.args
+    assert fields == {"import_id", "title", "status"}
@@ -27,3 +27,36 @@ def test_get_when_not_found(client: TestClient, event_service_mock, user_header_
     data = response.json()
     assert data["detail"] == "Event not found: event1"
     assert event_service_mock.get.call_count == 1
+
+
+def test_get_all_when_not_modified(
+    client: TestClient, event_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/events", headers=user_header_token).headers["ETag"]
+
+    response = client.get(
+        "/api/v1/events", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert event_service_mock.all.call_count == 1
+
+
+def test_get_many_by_ids(client: TestClient, event_service_mock, user_header_token):
+    response = client.get(
+        "/api/v1/events?ids=x.y.z.2&ids=x.y.z.1", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [d["import_id"] for d in response.json()] == ["x.y.z.2", "x.y.z.1"]
+    assert event_service_mock.get_many.call_count == 1
+    assert event_service_mock.all.call_count == 0
+
+
+def test_get_all_with_sparse_fields(
+    client: TestClient, event_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/events?fields=event_title,date", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    [event] = response.json()
+    assert event.keys() == {"import_id", "event_title", "date"}
@@ -7,6 +7,8 @@ This uses a service mock and ensures each endpoint calls into the service.
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from tests.helpers.family import create_family_read_dto
+
 
 def test_get_all_when_ok(client: TestClient, family_service_mock, user_header_token):
     response = client.get("/api/v1/families", headers=user_header_token)
@@ -27,6 +29,21 @@ def test_get_when_ok(client: TestClient, family_service_mock, user_header_token)
     assert family_service_mock.get.call_count == 1
 
 
+def test_get_all_serialises_dtos_directly(
+    client: TestClient, family_service_mock, user_header_token
+):
+    response = client.get("/api/v1/families", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+
+    timestamps = {"created", "last_modified"}
+    expected = create_family_read_dto("test", collections=["x.y.z.1", "x.y.z.2"])
+    [family] = response.json()
+    assert {k: v for k, v in family.items() if k not in timestamps} == (
+        expected.model_dump(mode="json", exclude=timestamps)
+    )
+
+
 def test_get_when_not_found(client: TestClient, family_service_mock, user_header_token):
     family_service_mock.missing = True
     response = client.get("/api/v1/families/fam1", headers=user_header_token)
@@ -50,3 +67,108 @@ def test_get_endpoint_returns_families_with_multiple_geographies(
         assert "geography" in keys
         assert "geographies" in keys
         assert item["geographies"] == ["CHN", "BRB", "BHS"]
+
+
+def test_get_all_returns_etag(
+    client: TestClient, family_service_mock, user_header_token
+):
+    response = client.get("/api/v1/families", headers=user_header_token)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"].startswith('W/"')
+    assert family_service_mock.version.call_count == 1
+
+
+def test_get_all_when_not_modified(
+    client: TestClient, family_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/families", headers=user_header_token).headers["ETag"]
+
+    response = client.get(
+        "/api/v1/families", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert family_service_mock.all.call_count == 1
+
+
+def test_get_when_not_modified(
+    client: TestClient, family_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/families/fam1", headers=user_header_token).headers[
+        "ETag"
+    ]
+
+    response = client.get(
+        "/api/v1/families/fam1", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert family_service_mock.get.call_count == 1
+
+
+def test_get_etag_differs_per_family(
+    client: TestClient, family_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/families/fam1", headers=user_header_token).headers[
+        "ETag"
+    ]
+
+    response = client.get(
+        "/api/v1/families/fam2", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+def test_get_many_by_ids(client: TestClient, family_service_mock, user_header_token):
+    response = client.get(
+        "/api/v1/families?ids=fam.a.b.2&ids=fam.a.b.1", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [f["import_id"] for f in response.json()] == ["fam.a.b.2", "fam.a.b.1"]
+    assert family_service_mock.get_many.call_count == 1
+    assert family_service_mock.all.call_count == 0
+
+
+def test_get_many_by_ids_when_invalid(
+    client: TestClient, family_service_mock, user_header_token
+):
+    family_service_mock.throw_validation_error = True
+    response = client.get("/api/v1/families?ids=bad", headers=user_header_token)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "invalid"
+
+
+def test_get_all_with_sparse_fields(
+    client: TestClient, family_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/families?fields=title,status", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    [family] = response.json()
+    assert family.keys() == {"import_id", "title", "status"}
+
+    _, fields = family_service_mock.all.call_args.args
+    assert fields == {"import_id", "title", "status"}
+
+
+def test_get_with_sparse_fields(
+    client: TestClient, family_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/families/fam1?fields=documents", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json().keys() == {"import_id", "documents"}
+
+
+def test_get_all_with_unknown_fields(
+    client: TestClient, family_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/families?fields=title,nope", headers=user_header_token
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Fields are invalid: ['nope']"
+    assert family_service_mock.all.call_count == 0
@@ -88,3 +88,37 @@ def test_search_with_corpus_filter(
     assert call_args[0][1] is not None  # user context
     assert call_args[0][2] is None  # geography (not provided)
     assert call_args[0][3] == ["corpus1", "corpus2"]  # corpus list
+
+
+def test_search_with_sub_geographies(
+    client: TestClient, family_service_mock, user_header_token
+):
+    response = client.get(
+        "/api/v1/families/?geography=Europe&include_sub_geographies=true",
+        headers=user_header_token,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert family_service_mock.search.call_count == 1
+
+    call_args = family_service_mock.search.call_args
+    assert call_args[0][2] == ["Europe"]  # geography
+    assert call_args[0][4] is True  # include_sub_geographies
+
+
+def test_search_etag_depends_on_query(
+    client: TestClient, family_service_mock, user_header_token
+):
+    etag = client.get("/api/v1/families/?q=one", headers=user_header_token).headers[
+        "ETag"
+    ]
+
+    response = client.get(
+        "/api/v1/families/?q=one", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.get(
+        "/api/v1/families/?q=two", headers={**user_header_token, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert family_service_mock.search.call_count == 2
@@ -0,0 +1,34 @@
+import pytest
+from fastapi.routing import APIRoute
+
+import app.service.authorisation as auth_service
+from app.api.api_v1.routers.auth import check_user_auth
+from app.errors import AuthorisationError
+from app.main import app
+from app.model.authorisation import AUTH_TABLE
+
+
+def _protected_routes() -> list[APIRoute]:
+    return [
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and any(d.call is check_user_auth for d in route.dependant.dependencies)
+    ]
+
+
+def test_every_protected_route_has_access_compiled():
+    routes = _protected_routes()
+    assert routes
+
+    for route in routes:
+        for method in route.methods:
+            access = auth_service.get_route_access(route.path, method)
+            assert access.required_access == (
+                AUTH_TABLE[access.entity][access.operation]
+            ), f"{method} {route.path}"
+
+
+def test_uncompiled_routes_are_not_authorised():
+    with pytest.raises(AuthorisationError):
+        auth_service.get_route_access("/api/tokens", "POST")
@@ -115,3 +115,108 @@ def test_summary_raises_if_db_error(
     assert document_repo_mock.count.call_count == 0
     assert family_repo_mock.count.call_count == 0
     assert event_repo_mock.count.call_count == 0
+
+
+def test_summary_is_cached_per_org_set(
+    collection_repo_mock,
+    document_repo_mock,
+    family_repo_mock,
+    event_repo_mock,
+    admin_user_context,
+):
+    first = analytics_service.summary(admin_user_context)
+    second = analytics_service.summary(admin_user_context)
+    assert first == second
+
+    assert collection_repo_mock.count.call_count == 1
+    assert document_repo_mock.count.call_count == 1
+    assert family_repo_mock.count.call_count == 1
+    assert event_repo_mock.count.call_count == 1
+
+
+def test_summary_cache_is_not_shared_between_org_sets(
+    collection_repo_mock,
+    document_repo_mock,
+    family_repo_mock,
+    event_repo_mock,
+    admin_user_context,
+    another_admin_user_context,
+):
+    analytics_service.summary(admin_user_context)
+    analytics_service.summary(another_admin_user_context)
+
+    assert collection_repo_mock.count.call_count == 2
+    assert family_repo_mock.count.call_count == 2
+
+
+def test_summary_cache_is_invalidated(
+    collection_repo_mock,
+    document_repo_mock,
+    family_repo_mock,
+    event_repo_mock,
+    admin_user_context,
+):
+    analytics_service.summary(admin_user_context)
+    analytics_service.invalidate_summary_cache()
+    analytics_service.summary(admin_user_context)
+
+    assert collection_repo_mock.count.call_count == 2
+    assert document_repo_mock.count.call_count == 2
+    assert family_repo_mock.count.call_count == 2
+    assert event_repo_mock.count.call_count == 2
+
+
+def test_summary_cache_expires(
+    monkeypatch,
+    collection_repo_mock,
+    document_repo_mock,
+    family_repo_mock,
+    event_repo_mock,
+    admin_user_context,
+):
+    monkeypatch.setattr(analytics_service._summary_cache, "ttl", 0)
+    analytics_service.summary(admin_user_context)
+    analytics_service.summary(admin_user_context)
+
+    assert collection_repo_mock.count.call_count == 2
+    assert family_repo_mock.count.call_count == 2
+
+
+def test_summary_does_not_cache_errors(
+    collection_repo_mock,
+    document_repo_mock,
+    family_repo_mock,
+    event_repo_mock,
+    admin_user_context,
+):
+    collection_repo_mock.throw_repository_error = True
+    with pytest.raises(RepositoryError):
+        analytics_service.summary(admin_user_context)
+
+    collection_repo_mock.throw_repository_error = False
+    result = analytics_service.summary(admin_user_context)
+    assert result is not None
+    assert collection_repo_mock.count.call_count == 2
+
+
+def test_summary_cache_is_refilled_from_the_primary_after_a_write(
+    monkeypatch,
+    collection_repo_mock,
+    document_repo_mock,
+    family_repo_mock,
+    event_repo_mock,
+    admin_user_context,
+):
+    def replica_read():
+        raise AssertionError("Shared summaries must not be read from the replica")
+
+    monkeypatch.setattr(analytics_service.db_session, "get_read_db", replica_read)
+    token = analytics_service.db_session.current_user.set("not-the-writer@cpr.org")
+    try:
+        analytics_service.summary(admin_user_context)
+        analytics_service.invalidate_summary_cache()
+        analytics_service.summary(admin_user_context)
+    finally:
+        analytics_service.db_session.current_user.reset(token)
+
+    assert collection_repo_mock.count.call_count == 2
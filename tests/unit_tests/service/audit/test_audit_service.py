@@ -0,0 +1,92 @@
+import logging
+import queue
+
+from db_client.models.organisation.authorisation import AuthOperation
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+import app.service.audit as audit_service
+from app.config import AUDIT_MAX_PAYLOAD
+from app.model.authorisation import AuthEndpoint
+
+
+def _record(payload=None) -> audit_service.AuditRecord:
+    return audit_service.AuditRecord(
+        path="/api/v1/families",
+        user="test@cpr.org",
+        operation=AuthOperation.CREATE,
+        entity=AuthEndpoint.FAMILY,
+        payload=payload,
+    )
+
+
+def test_capture_payload_keeps_small_bodies():
+    assert audit_service.capture_payload(b'{"title": "x"}') == '{"title": "x"}'
+
+
+def test_capture_payload_without_body():
+    assert audit_service.capture_payload(b"") is None
+
+
+def test_capture_payload_truncates_and_hashes_large_bodies():
+    body = b"a" * (AUDIT_MAX_PAYLOAD + 100)
+
+    payload = audit_service.capture_payload(body)
+
+    assert payload is not None
+    assert payload.startswith("a" * AUDIT_MAX_PAYLOAD + "...")
+    assert f"truncated {len(body)} bytes, sha256=" in payload
+
+
+def test_submitted_records_are_written_in_the_background(caplog):
+    with caplog.at_level(logging.INFO):
+        audit_service.submit(_record('{"title": "x"}'))
+        assert audit_service.flush(timeout=5)
+
+    assert "AUDIT: test@cpr.org is performing" in caplog.text
+
+
+def test_submit_drops_records_when_the_queue_is_full(monkeypatch):
+    full: queue.Queue = queue.Queue(maxsize=1)
+    full.put_nowait(_record())
+    monkeypatch.setattr(audit_service, "_queue", full)
+    monkeypatch.setattr(audit_service, "_ensure_writer", lambda: None)
+    monkeypatch.setattr(audit_service, "dropped", 0)
+
+    audit_service.submit(_record())
+
+    assert audit_service.dropped == 1
+
+
+def test_dropped_records_are_reported(monkeypatch):
+    monkeypatch.setattr(audit_service, "dropped", 3)
+    reader = InMemoryMetricReader()
+    audit_service.instrument(MeterProvider(metric_readers=[reader]).get_meter("test"))
+
+    data = reader.get_metrics_data()
+    assert data is not None
+    [metric] = data.resource_metrics[0].scope_metrics[0].metrics
+    assert metric.name == "audit.dropped"
+    assert metric.data.data_points[0].value == 3
+
+
+def test_shutdown_writes_queued_records(caplog):
+    with caplog.at_level(logging.INFO):
+        audit_service.submit(_record())
+        audit_service.shutdown(timeout=5)
+
+    assert "AUDIT: test@cpr.org is performing" in caplog.text
+    assert "lost" not in caplog.text
+
+
+def test_shutdown_logs_lost_and_dropped_records(monkeypatch, caplog):
+    stuck: queue.Queue = queue.Queue()
+    stuck.put_nowait(_record())
+    monkeypatch.setattr(audit_service, "_queue", stuck)
+    monkeypatch.setattr(audit_service, "dropped", 2)
+
+    with caplog.at_level(logging.WARNING):
+        audit_service.shutdown(timeout=0.01)
+
+    assert "1 audit records were still queued at shutdown" in caplog.text
+    assert "2 audit records were dropped" in caplog.text
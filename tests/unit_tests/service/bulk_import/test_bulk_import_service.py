@@ -253,7 +253,11 @@ def test_save_collections_skips_update_when_no_changes(
 
 
 def test_save_families_skips_update_when_no_changes(
-    family_repo_mock, corpus_repo_mock, geography_repo_mock, validation_service_mock
+    family_repo_mock,
+    corpus_repo_mock,
+    geography_repo_mock,
+    collection_repo_mock,
+    validation_service_mock,
 ):
     test_data = [
         {
@@ -280,6 +284,32 @@ def test_save_families_skips_update_when_no_changes(
     assert result == []
 
 
+def test_save_families_checks_collection_orgs_in_one_query(
+    family_repo_mock,
+    corpus_repo_mock,
+    geography_repo_mock,
+    collection_repo_mock,
+    validation_service_mock,
+):
+    collection_repo_mock.alternative_org = True
+    test_data = [
+        {**default_family, "import_id": f"test.new.family.{i}", "collections": [c]}
+        for i, c in enumerate(["x.y.z.1", "x.y.z.2", "x.y.z.1"])
+    ]
+
+    with pytest.raises(ValidationError) as e:
+        bulk_import_service.save_families(test_data, "CCLW.corpus.i00000001.n0000")
+    assert (
+        e.value.message
+        == "Organisation mismatch between some collections and the corpus"
+    )
+
+    assert collection_repo_mock.collection_orgs.call_count == 1
+    collection_repo_mock.collection_orgs.assert_called_with(ANY, {"x.y.z.1", "x.y.z.2"})
+    assert family_repo_mock.create.call_count == 0
+    assert family_repo_mock.update.call_count == 0
+
+
 @patch("app.service.bulk_import.family_repository.update")
 @patch("app.service.bulk_import.family_repository.get")
 def test_save_families_skips_update_when_no_changes_to_metadata_regardless_of_ordering(
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+import app.service.config as config_service
+from app.errors import RepositoryError
+
+
+def test_get_serialised_returns_json(
+    config_repo_mock, geography_repo_mock, admin_user_context
+):
+    result = config_service.get_serialised(admin_user_context)
+
+    data = json.loads(result.payload)
+    assert set(data.keys()) == {
+        "geographies",
+        "corpora",
+        "corpus_types",
+        "languages",
+        "document",
+    }
+    assert result.digest
+    assert config_repo_mock.get.call_count == 1
+
+
+def test_get_serialised_is_cached_per_org_set(
+    config_repo_mock,
+    geography_repo_mock,
+    admin_user_context,
+    another_admin_user_context,
+):
+    first = config_service.get_serialised(admin_user_context)
+    second = config_service.get_serialised(admin_user_context)
+    assert first is second
+    assert config_repo_mock.get.call_count == 1
+
+    config_service.get_serialised(another_admin_user_context)
+    assert config_repo_mock.get.call_count == 2
+
+
+def test_get_serialised_after_invalidation(
+    config_repo_mock, geography_repo_mock, admin_user_context
+):
+    config_service.get_serialised(admin_user_context)
+    config_service.invalidate_cache()
+    config_service.get_serialised(admin_user_context)
+
+    assert config_repo_mock.get.call_count == 2
+
+
+def test_get_serialised_does_not_cache_errors(
+    config_repo_mock, geography_repo_mock, admin_user_context
+):
+    config_repo_mock.throw_repository_error = True
+    with pytest.raises(RepositoryError):
+        config_service.get_serialised(admin_user_context)
+
+    config_repo_mock.throw_repository_error = False
+    config_service.get_serialised(admin_user_context)
+    assert config_repo_mock.get.call_count == 2
+
+
+def test_get_serialised_is_refilled_from_the_primary_after_a_write(
+    monkeypatch, config_repo_mock, geography_repo_mock, admin_user_context
+):
+    def replica_read():
+        raise AssertionError("Shared config must not be read from the replica")
+
+    monkeypatch.setattr(config_service.db_session, "get_read_db", replica_read)
+    token = config_service.db_session.current_user.set("not-the-writer@cpr.org")
+    try:
+        config_service.get_serialised(admin_user_context)
+        config_service.invalidate_cache()
+        config_service.get_serialised(admin_user_context)
+    finally:
+        config_service.db_session.current_user.reset(token)
+
+    assert config_repo_mock.get.call_count == 2
@@ -8,7 +8,7 @@ def test_delete(event_repo_mock, admin_user_context):
     ok = event_service.delete("a.b.c.d", admin_user_context)
     assert ok
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.delete.call_count == 1
 
 
@@ -17,7 +17,7 @@ def test_delete_returns_false_when_missing(event_repo_mock, admin_user_context):
     ok = event_service.delete("a.b.c.d", admin_user_context)
     assert not ok
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 0
+    assert event_repo_mock.org_id_for_event.call_count == 0
     assert event_repo_mock.delete.call_count == 0
 
 
@@ -28,7 +28,7 @@ def test_delete_raises_when_invalid_id(event_repo_mock, admin_user_context):
     expected_msg = f"The import id {import_id} is invalid!"
     assert e.value.message == expected_msg
     assert event_repo_mock.get.call_count == 0
-    assert event_repo_mock.get_org_from_import_id.call_count == 0
+    assert event_repo_mock.org_id_for_event.call_count == 0
     assert event_repo_mock.delete.call_count == 0
 
 
@@ -42,7 +42,7 @@ def test_delete_when_no_org_associated_with_entity(event_repo_mock, admin_user_c
     assert e.value.message == expected_msg
 
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.delete.call_count == 0
 
 
@@ -58,7 +58,7 @@ def test_delete_raises_when_org_mismatch(event_repo_mock, admin_user_context):
     assert e.value.message == expected_msg
 
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.delete.call_count == 0
 
 
@@ -67,5 +67,5 @@ def test_delete_success_when_org_mismatch_super(event_repo_mock, super_user_cont
     ok = event_service.delete("a.b.c.d", super_user_context)
     assert ok
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.delete.call_count == 1
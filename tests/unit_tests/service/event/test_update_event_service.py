@@ -19,7 +19,7 @@ def test_update(
     )
     assert result is not None
     assert event_repo_mock.get.call_count == 2
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.update.call_count == 1
     assert family_repo_mock.get.call_count == 1
     assert mock_validate_metadata.call_count == 1
@@ -38,7 +38,7 @@ def test_update_when_db_error(
         event_service.update("a.b.c.d", create_event_write_dto(), admin_user_context)
     assert e.value.message == "bad event repo"
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.update.call_count == 1
     assert family_repo_mock.get.call_count == 1
     assert mock_validate_metadata.call_count == 1
@@ -50,7 +50,7 @@ def test_update_when_event_missing(event_repo_mock, admin_user_context):
     ok = event_service.update("a.b.c.d", create_event_write_dto(), admin_user_context)
     assert not ok
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 0
+    assert event_repo_mock.org_id_for_event.call_count == 0
     assert event_repo_mock.update.call_count == 0
 
 
@@ -60,7 +60,7 @@ def test_update_raises_when_invalid_id(event_repo_mock, admin_user_context):
     expected_msg = "The import id invalid is invalid!"
     assert e.value.message == expected_msg
     assert event_repo_mock.get.call_count == 0
-    assert event_repo_mock.get_org_from_import_id.call_count == 0
+    assert event_repo_mock.org_id_for_event.call_count == 0
     assert event_repo_mock.update.call_count == 0
 
 
@@ -77,7 +77,7 @@ def test_update_when_no_org_associated_with_entity(
     expected_msg = "No organisation associated with import id a.b.c.d"
     assert e.value.message == expected_msg
 
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.update.call_count == 0
     assert event_repo_mock.get.call_count == 1
     assert family_repo_mock.get.call_count == 1
@@ -97,7 +97,7 @@ def test_update_raises_when_org_mismatch(
     expected_msg = "User 'another-admin@here.com' is not authorised to perform operation on 'a.b.c.d'"
     assert e.value.message == expected_msg
 
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert event_repo_mock.update.call_count == 0
     assert event_repo_mock.get.call_count == 1
     assert family_repo_mock.get.call_count == 1
@@ -115,7 +115,7 @@ def test_update_success_when_org_mismatch_superuser(
     )
     assert result is not None
     assert event_repo_mock.get.call_count == 2
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert family_repo_mock.get.call_count == 1
     assert event_repo_mock.update.call_count == 1
     assert mock_validate_metadata.call_count == 1
@@ -140,7 +140,7 @@ def test_update_raises_when_invalid_metadata(
     assert e.value.message == expected_msg
 
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert family_repo_mock.get.call_count == 1
     assert event_repo_mock.update.call_count == 0
     assert mock_validate_metadata.call_count == 1
@@ -174,7 +174,7 @@ def test_update_raises_type_error(
         event_service.update("a.b.c.d", new_event, admin_user_context)
 
     assert event_repo_mock.get.call_count == 1
-    assert event_repo_mock.get_org_from_import_id.call_count == 1
+    assert event_repo_mock.org_id_for_event.call_count == 1
     assert family_repo_mock.get.call_count == 1
     assert event_repo_mock.update.call_count == 0
     assert mock_validate_metadata.call_count == 1
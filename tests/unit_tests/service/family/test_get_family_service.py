@@ -29,3 +29,21 @@ def test_get_raises_when_invalid_id(family_repo_mock):
     expected_msg = "The import id a.b.c is invalid!"
     assert e.value.message == expected_msg
     assert family_repo_mock.get.call_count == 0
+
+
+def test_get_many_returns_families_in_one_repo_call(
+    family_repo_mock, admin_user_context
+):
+    result = family_service.get_many(
+        ["a.b.c.2", "a.b.c.1", "a.b.c.2"], admin_user_context
+    )
+    assert [f.import_id for f in result] == ["a.b.c.2", "a.b.c.1"]
+    assert family_repo_mock.get_many.call_count == 1
+    assert family_repo_mock.get.call_count == 0
+
+
+def test_get_many_raises_when_invalid_id(family_repo_mock, admin_user_context):
+    with pytest.raises(ValidationError) as e:
+        family_service.get_many(["a.b.c.d", "a.b.c"], admin_user_context)
+    assert e.value.message == "The import ids are invalid: ['a.b.c']"
+    assert family_repo_mock.get_many.call_count == 0
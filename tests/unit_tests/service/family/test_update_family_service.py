@@ -31,14 +31,19 @@ def test_update(
     )
     result = family_service.update("a.b.c.d", admin_user_context, updated_family)
     assert result is not None
+    assert result.title == "UPDATED TITLE"
 
     assert family_repo_mock.update.call_count == 1
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 3
-    assert family_repo_mock.get.call_count == 2
+    assert collection_repo_mock.collection_orgs.call_count == 1
+    # The family is read once and handed to the repo to diff against.
+    assert family_repo_mock.get.call_count == 1
+    original = family_repo_mock.update.call_args.kwargs["original"]
+    assert original is not None
+    assert original.import_id == "a.b.c.d"
 
 
 def test_update_when_family_missing(
@@ -62,13 +67,13 @@ def test_update_when_family_missing(
     assert result is None
 
     assert family_repo_mock.update.call_count == 0
-    assert geography_repo_mock.get_ids_from_values.call_count == 0
+    assert geography_repo_mock.get_all.call_count == 0
     assert family_repo_mock.get.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 0
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 0
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_raises_when_family_id_invalid(
@@ -94,12 +99,12 @@ def test_update_raises_when_family_id_invalid(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 0
-    assert geography_repo_mock.get_ids_from_values.call_count == 0
+    assert geography_repo_mock.get_all.call_count == 0
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 0
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 0
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_raises_when_category_invalid(
@@ -125,12 +130,12 @@ def test_update_raises_when_category_invalid(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 1
-    assert geography_repo_mock.get_ids_from_values.call_count == 0
+    assert geography_repo_mock.get_all.call_count == 0
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 0
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 0
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_raises_when_organisation_invalid(
@@ -157,12 +162,12 @@ def test_update_raises_when_organisation_invalid(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 1
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 0
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_family_raises_when_geography_invalid(
@@ -189,12 +194,12 @@ def test_update_family_raises_when_geography_invalid(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 1
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 0
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 0
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_family_raises_when_metadata_invalid(
@@ -223,12 +228,12 @@ def test_update_family_raises_when_metadata_invalid(
     )
 
     assert family_repo_mock.get.call_count == 2
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_family_raises_when_missing_taxonomy(
@@ -252,12 +257,12 @@ def test_update_family_raises_when_missing_taxonomy(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 2
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_family_raises_when_collection_id_invalid(
@@ -282,13 +287,12 @@ def test_update_family_raises_when_collection_id_invalid(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 2
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.validate.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_family_raises_when_collection_missing(
@@ -313,13 +317,12 @@ def test_update_family_raises_when_collection_missing(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 2
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.validate.call_count == 1
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 1
 
 
 def test_update_family_raises_when_collection_org_different_to_usr_org(
@@ -345,12 +348,11 @@ def test_update_family_raises_when_collection_org_different_to_usr_org(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 2
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 3
-    assert collection_repo_mock.validate.call_count == 1
+    assert collection_repo_mock.collection_orgs.call_count == 1
 
 
 def test_update_raises_when_family_organisation_mismatch_with_user_org(
@@ -379,13 +381,12 @@ def test_update_raises_when_family_organisation_mismatch_with_user_org(
     assert e.value.message == expected_msg
 
     assert family_repo_mock.get.call_count == 2
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
     assert family_repo_mock.update.call_count == 0
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 0
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 0
-    assert collection_repo_mock.validate.call_count == 0
+    assert collection_repo_mock.collection_orgs.call_count == 0
 
 
 def test_update_success_when_family_organisation_mismatch_with_user_org(
@@ -409,13 +410,12 @@ def test_update_success_when_family_organisation_mismatch_with_user_org(
     result = family_service.update("a.b.c.d", super_user_context, updated_family)
     assert result is not None
 
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
-    assert family_repo_mock.get.call_count == 2
+    assert geography_repo_mock.get_all.call_count == 1
+    assert family_repo_mock.get.call_count == 1
     assert corpus_repo_mock.get_corpus_org_id.call_count == 1
     assert db_client_metadata_mock.get_taxonomy_from_corpus.call_count == 1
     assert db_client_metadata_mock.get_entity_specific_taxonomy.call_count == 0
-    assert collection_repo_mock.get_org_from_collection_id.call_count == 3
-    assert collection_repo_mock.validate.call_count == 1
+    assert collection_repo_mock.collection_orgs.call_count == 1
     assert family_repo_mock.update.call_count == 1
 
 
@@ -15,7 +15,7 @@ def test_geo_service_validate_raises_when_invalid(
 
     expected_msg = "The geography value CHN is invalid!"
     assert e.value.message == expected_msg
-    assert geography_repo_mock.get_id_from_value.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
 
 
 def test_geo_service_raises_error_when_validating_invalid_geo_ids(
@@ -30,7 +30,7 @@ def test_geo_service_raises_error_when_validating_invalid_geo_ids(
         "One or more of the following geography values are invalid: CHN, USA, AGO"
     )
     assert e.value.message == expected_msg
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
 
 
 def test_geo_service_gets_ids_from_repo(
@@ -38,4 +38,65 @@ def test_geo_service_gets_ids_from_repo(
 ):
     result = geography_service.get_ids(geography_repo_mock, ["CHN", "USA"])
     assert result == [1, 2]
-    assert geography_repo_mock.get_ids_from_values.call_count == 1
+    assert geography_repo_mock.get_all.call_count == 1
+
+
+def test_geo_service_gets_id_from_tree(geography_repo_mock):
+    assert geography_service.get_id(None, "USA") == 2  # type: ignore
+    assert geography_service.get_id(None, "AGO") == 3  # type: ignore
+    assert geography_repo_mock.get_all.call_count == 1
+
+
+def test_geo_service_rejects_repeated_values(geography_repo_mock):
+    with pytest.raises(ValidationError):
+        geography_service.get_ids(geography_repo_mock, ["CHN", "CHN"])
+
+
+def test_geo_service_rebuilds_tree_when_table_changes(geography_repo_mock):
+    geography_repo_mock.error = True
+    with pytest.raises(ValidationError):
+        geography_service.get_id(None, "CHN")  # type: ignore
+
+    geography_repo_mock.error = False
+    assert geography_service.get_id(None, "CHN") == 1  # type: ignore
+    assert geography_repo_mock.get_all.call_count == 2
+
+
+def test_geo_service_compiles_tree(monkeypatch, geography_repo_mock):
+    rows = [
+        {"id": 1, "value": "R1", "type": "Region", "parent_id": None},
+        {"id": 2, "value": "CHN", "type": "ISO-3166", "parent_id": 1},
+        {"id": 3, "value": "CN-BJ", "type": "ISO-3166-2", "parent_id": 2},
+        {"id": 4, "value": "R2", "type": "Region", "parent_id": None},
+    ]
+    monkeypatch.setattr(geography_service.geography_repo, "get_all", lambda _: rows)
+
+    tree = geography_service.get_tree(None)  # type: ignore
+
+    assert [r["node"]["value"] for r in tree.regions] == ["R1", "R2"]
+    assert [c["node"]["value"] for c in tree.regions[0]["children"]] == ["CHN"]
+    assert tree.regions[0]["children"][0]["children"] == ()
+    assert tree.ids_by_value["CN-BJ"] == 3
+
+    assert geography_service.get_tree(None) is tree  # type: ignore
+
+
+def test_geo_service_tree_cannot_be_changed_through_copies(
+    monkeypatch, geography_repo_mock
+):
+    rows = [
+        {"id": 1, "value": "R1", "type": "Region", "parent_id": None},
+        {"id": 2, "value": "CHN", "type": "ISO-3166", "parent_id": 1},
+    ]
+    monkeypatch.setattr(geography_service.geography_repo, "get_all", lambda _: rows)
+    tree = geography_service.get_tree(None)  # type: ignore
+
+    with pytest.raises(TypeError):
+        tree.regions[0]["node"]["value"] = "changed"  # type: ignore
+
+    copy = tree.region_dicts()
+    copy[0]["node"]["value"] = "changed"
+    copy[0]["children"].clear()
+
+    assert tree.regions[0]["node"]["value"] == "R1"
+    assert [c["node"]["value"] for c in tree.regions[0]["children"]] == ["CHN"]
@@ -22,7 +22,7 @@ def test_raises_when_user_not_found(
         auth_service.authenticate_user(VALID_USERNAME, PLAIN_PASSWORD)
 
     assert e.value.message == f"User not found for {VALID_USERNAME}"
-    assert app_user_repo_mock.get_user_by_email.call_count == 1
+    assert app_user_repo_mock.get_user_login.call_count == 1
 
 
 def test_raises_when_incorrect_password(
@@ -32,7 +32,7 @@ def test_raises_when_incorrect_password(
         auth_service.authenticate_user(VALID_USERNAME, "random")
 
     assert e.value.message == f"Could not verify password for {VALID_USERNAME}"
-    assert app_user_repo_mock.get_user_by_email.call_count == 1
+    assert app_user_repo_mock.get_user_login.call_count == 1
 
 
 def test_raises_when_no_password(
@@ -42,7 +42,7 @@ def test_raises_when_no_password(
         auth_service.authenticate_user(VALID_USERNAME, "")
 
     assert e.value.message == f"Could not verify password for {VALID_USERNAME}"
-    assert app_user_repo_mock.get_user_by_email.call_count == 1
+    assert app_user_repo_mock.get_user_login.call_count == 1
 
 
 def test_raises_when_inactive(
@@ -53,7 +53,7 @@ def test_raises_when_inactive(
         auth_service.authenticate_user(VALID_USERNAME, PLAIN_PASSWORD)
 
     assert e.value.message == f"User {VALID_USERNAME} is marked as not active."
-    assert app_user_repo_mock.get_user_by_email.call_count == 1
+    assert app_user_repo_mock.get_user_login.call_count == 1
 
 
 def test_can_auth(
@@ -67,5 +67,16 @@ def test_can_auth(
     assert user.authorisation is not None
     assert len(user.authorisation.keys()) == 1
 
-    assert app_user_repo_mock.get_user_by_email.call_count == 1
-    assert app_user_repo_mock.get_app_user_authorisation.call_count == 1
+    assert app_user_repo_mock.get_user_login.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_can_auth_async(
+    app_user_repo_mock,
+):
+    token = await auth_service.authenticate_user_async(VALID_USERNAME, PLAIN_PASSWORD)
+    user = token_service.decode(token)
+
+    assert user.email == VALID_USERNAME
+    assert user.org_ids == [1]
+    assert app_user_repo_mock.get_user_login.call_count == 1
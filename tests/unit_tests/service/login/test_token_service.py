@@ -2,6 +2,8 @@ from typing import cast
 
 import jwt
 import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 
 import app.service.token as token_service
 from app.errors import TokenError
@@ -88,3 +90,55 @@ def test_decode_fails_when_no_org_id():
         token_service.decode(encoded_jwt)
 
     assert e.value.message == "Token did not contain any organisation_id"
+
+
+def test_decode_cached_verifies_a_token_once(mocker):
+    token = token_service.encode("bob@here.com", False, {}, org_ids=[1])
+    verify_spy = mocker.spy(token_service, "_verify")
+
+    first = token_service.decode_cached(token)
+    second = token_service.decode_cached(token)
+
+    assert second is first
+    assert first.email == "bob@here.com"
+    assert verify_spy.call_count == 1
+    assert token_service._verified.hits == 1
+    assert token_service._verified.misses == 1
+
+
+def test_token_cache_hits_and_misses_are_reported():
+    reader = InMemoryMetricReader()
+    token_service.instrument(MeterProvider(metric_readers=[reader]).get_meter("test"))
+    token = token_service.encode("bob@here.com", False, {}, org_ids=[1])
+
+    for _ in range(3):
+        token_service.decode_cached(token)
+
+    data = reader.get_metrics_data()
+    assert data is not None
+    values = {
+        metric.name: metric.data.data_points[0].value
+        for metric in data.resource_metrics[0].scope_metrics[0].metrics
+    }
+    assert values == {"auth.token_cache.hits": 2, "auth.token_cache.misses": 1}
+
+
+def test_decode_cached_does_not_cache_invalid_tokens(mocker):
+    verify_spy = mocker.spy(token_service, "_verify")
+
+    for _ in range(2):
+        with pytest.raises(TokenError):
+            token_service.decode_cached("not.a.token")
+
+    assert verify_spy.call_count == 2
+
+
+def test_decode_cached_verifies_again_once_the_token_expires(mocker):
+    token = token_service.encode("bob@here.com", False, {}, org_ids=[1])
+    token_service.decode_cached(token)
+    verify_spy = mocker.spy(token_service, "_verify")
+
+    mocker.patch("app.cache.time.time", return_value=2**40)
+    token_service.decode_cached(token)
+
+    assert verify_spy.call_count == 1
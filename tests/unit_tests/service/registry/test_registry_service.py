@@ -0,0 +1,62 @@
+import app.service.registry as registry_service
+
+CORPUS_ID = "CCLW.corpus.i00000001.n0000"
+
+
+def test_corpus_org_id_is_looked_up_once(corpus_repo_mock, db_session_mock):
+    assert registry_service.corpus_org_id(db_session_mock, CORPUS_ID) == 1
+    assert registry_service.corpus_org_id(db_session_mock, CORPUS_ID) == 1
+    assert corpus_repo_mock.get_corpus_org_id.call_count == 1
+
+
+def test_corpus_exists_only_caches_corpora_found(corpus_repo_mock, db_session_mock):
+    corpus_repo_mock.valid = False
+    assert not registry_service.corpus_exists(db_session_mock, CORPUS_ID)
+
+    corpus_repo_mock.valid = True
+    assert registry_service.corpus_exists(db_session_mock, CORPUS_ID)
+    assert registry_service.corpus_exists(db_session_mock, CORPUS_ID)
+    assert corpus_repo_mock.verify_corpus_exists.call_count == 2
+
+
+def test_missing_corpora_checks_unknown_ids_in_one_query(
+    corpus_repo_mock, db_session_mock
+):
+    registry_service.corpus_exists(db_session_mock, "A.corpus.1.0")
+
+    missing = registry_service.missing_corpora(
+        db_session_mock, ["A.corpus.1.0", "B.corpus.2.0", "C.corpus.3.0"]
+    )
+
+    assert missing == []
+    corpus_repo_mock.get_corpus_org_ids.assert_called_once_with(
+        db_session_mock, ["B.corpus.2.0", "C.corpus.3.0"]
+    )
+    assert registry_service.corpus_org_id(db_session_mock, "C.corpus.3.0") == 1
+    assert corpus_repo_mock.get_corpus_org_id.call_count == 0
+
+
+def test_missing_corpora_returns_ids_not_found(corpus_repo_mock, db_session_mock):
+    corpus_repo_mock.valid = False
+    missing = registry_service.missing_corpora(db_session_mock, ["B.corpus.2.0"])
+    assert missing == ["B.corpus.2.0"]
+
+
+def test_org_id_from_name_is_looked_up_once(organisation_repo_mock, db_session_mock):
+    assert registry_service.org_id_from_name(db_session_mock, "CCLW") == 1
+    assert registry_service.org_id_from_name(db_session_mock, "CCLW") == 1
+    assert organisation_repo_mock.get_id_from_name.call_count == 1
+
+
+def test_invalidate_drops_entries(
+    corpus_repo_mock, organisation_repo_mock, db_session_mock
+):
+    registry_service.corpus_org_id(db_session_mock, CORPUS_ID)
+    registry_service.org_id_from_name(db_session_mock, "CCLW")
+
+    registry_service.invalidate()
+
+    registry_service.corpus_org_id(db_session_mock, CORPUS_ID)
+    registry_service.org_id_from_name(db_session_mock, "CCLW")
+    assert corpus_repo_mock.get_corpus_org_id.call_count == 2
+    assert organisation_repo_mock.get_id_from_name.call_count == 2
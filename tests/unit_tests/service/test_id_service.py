@@ -31,3 +31,26 @@ def test_invalid_ids(import_id: str):
         id.validate(import_id)
     expected_msg = f"The import id {import_id} is invalid!"
     assert e.value.message == expected_msg
+
+
+def test_validate_batch_dedupes_in_request_order():
+    assert id.validate_batch(["B.B.B.B", "A.A.A.A", "B.B.B.B"]) == [
+        "B.B.B.B",
+        "A.A.A.A",
+    ]
+
+
+def test_validate_batch_rejects_invalid_ids():
+    with pytest.raises(ValidationError) as e:
+        id.validate_batch(["A.A.A.A", "bad"])
+    assert e.value.message == "The import ids are invalid: ['bad']"
+
+
+def test_validate_batch_rejects_too_many_ids():
+    import_ids = [f"A.B.C.{n}" for n in range(id.MAX_BATCH_SIZE + 1)]
+    with pytest.raises(ValidationError) as e:
+        id.validate_batch(import_ids)
+    assert e.value.message == (
+        f"Too many import ids requested: {id.MAX_BATCH_SIZE + 1} "
+        f"(max {id.MAX_BATCH_SIZE})"
+    )